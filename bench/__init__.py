@@ -0,0 +1,4 @@
+"""Benchmarks for EZ-IPC. Each Module may be run as a Script, for example:
+
+    python -m bench.many 10000
+"""
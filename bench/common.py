@@ -0,0 +1,138 @@
+"""Utilities shared by the Benchmarks."""
+
+from asyncio import (
+    AbstractEventLoop,
+    gather,
+    get_running_loop,
+    open_connection,
+    run,
+    start_server,
+)
+from multiprocessing import get_context
+from socket import socket
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, List, Tuple
+
+from ezipc.remote import Remote
+from ezipc.remote.codec import BACKEND
+from ezipc.util import set_verbosity
+
+
+REPEAT: int = 3
+# The number of Processes, and of Connections from each, which load a Server.
+LOADERS: int = 4
+CONNECTIONS: int = 4
+
+
+async def pair(helpers: int = 5) -> Tuple[Remote, Remote]:
+    """Connect two Remotes to each other over the Loopback Interface. The first
+        plays the part of a Client, and the second that of a Server.
+    """
+    set_verbosity(0)
+    loop: AbstractEventLoop = get_running_loop()
+    accepted = loop.create_future()
+
+    server = await start_server(
+        lambda r, w: accepted.set_result((r, w)), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    instr, outstr = await open_connection("127.0.0.1", port)
+    client = Remote(loop, instr, outstr, rtype="Server", remote_id="SRV")
+    server_side = Remote(loop, *await accepted, rtype="Client", remote_id="CLI")
+    server.close()
+
+    loop.create_task(client.loop(helpers))
+    loop.create_task(server_side.loop(helpers))
+    return client, server_side
+
+
+async def timed(coro_func: Callable, repeat: int = REPEAT) -> float:
+    """Run a Coroutine Function several times, and return the best time."""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = perf_counter()
+        await coro_func()
+        times.append(perf_counter() - start)
+    return min(times)
+
+
+def banner() -> None:
+    """Say which JSON Backend the Results were measured with."""
+    print(f"JSON Backend: {BACKEND}")
+
+
+def report(name: str, count: int, seconds: float) -> None:
+    print(
+        f"{name:<32} {count:>8} calls {seconds * 1000:>10.2f} ms"
+        f" {count / seconds:>12.0f} calls/s"
+    )
+
+
+def free_port() -> int:
+    with socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10):
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        with socket() as sock:
+            if sock.connect_ex(("127.0.0.1", port)) == 0:
+                return
+        sleep(0.1)
+    raise TimeoutError(f"Nothing is listening on Port {port}.")
+
+
+def _load(port: int, count: int, method: str, params: Any, go, results):
+    async def main():
+        set_verbosity(0)
+        loop = get_running_loop()
+        remotes = []
+        for _ in range(CONNECTIONS):
+            remote = Remote(loop, *await open_connection("127.0.0.1", port))
+            loop.create_task(remote.loop(5))
+            remotes.append(remote)
+
+        async def work(remote: Remote):
+            for _ in range(count // 100):
+                await gather(
+                    *(remote.request(method, params, timeout=30) for _ in range(100))
+                )
+
+        await loop.run_in_executor(None, go.wait)
+        start = monotonic()
+        await gather(*map(work, remotes))
+        results.put((start, monotonic(), len(remotes) * (count // 100) * 100))
+
+        for remote in remotes:
+            await remote.terminate()
+
+    run(main())
+
+
+def hammer(port: int, count: int, method: str, params: Any) -> Tuple[int, float]:
+    """Send Requests to a Server in another Process from several Processes at
+        once, each with several Connections, and each Connection sending
+        ``count`` Requests. Return the number of Requests answered, and the
+        number of seconds from the first being sent to the last being answered.
+    """
+    context = get_context("fork")
+    go = context.Event()
+    results = context.Queue()
+    loaders = [
+        context.Process(target=_load, args=(port, count, method, params, go, results))
+        for _ in range(LOADERS)
+    ]
+    for proc in loaders:
+        proc.start()
+    go.set()
+
+    times = [results.get(timeout=300) for _ in loaders]
+    for proc in loaders:
+        proc.join()
+
+    start = min(t[0] for t in times)
+    end = max(t[1] for t in times)
+    return sum(t[2] for t in times), end - start
@@ -0,0 +1,44 @@
+"""Measure ``JRPC.decode()`` and the encoding of Messages on their own, for each
+    kind of Message, and for a Batch of them.
+"""
+
+from sys import argv
+from timeit import repeat
+
+from ezipc.remote.protocol import Batch, compose, JRPC, Notification, Request, Response
+
+from .common import banner, REPEAT, report
+
+
+def lines():
+    notif = compose(Notification, "TOPIC.PUB", ["news.sport", {"score": [3, 1]}])
+    request = compose(Request, "ECHO", {"text": "hello", "count": 3}, mid="ABC/0F0F0F")
+    request.set_budget(5)
+    response = Response("ABC/0F0F0F", result={"text": "hello", "count": 3})
+    batch = Batch(*([notif, request, response] * 10))
+
+    return (
+        ("Notification", notif, 1),
+        ("Request", request, 1),
+        ("Response", response, 1),
+        ("Batch of 30", batch, 30),
+    )
+
+
+def main(count: int = 20000):
+    banner()
+    for name, msg, size in lines():
+        seconds = min(repeat(lambda: bytes(msg), number=count, repeat=REPEAT))
+        report(f"encode {name}", count * size, seconds)
+
+    for name, msg, size in lines():
+        # Lines arrive from the Connection as Bytes.
+        line = bytes(msg)
+        seconds = min(
+            repeat(lambda: list(JRPC.decode(line)), number=count, repeat=REPEAT)
+        )
+        report(f"decode() {name}", count * size, seconds)
+
+
+if __name__ == "__main__":
+    main(*map(int, argv[1:]))
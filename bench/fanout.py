@@ -0,0 +1,72 @@
+"""Measure how long a Broadcast takes to reach every Client, as the number of
+    Clients grows, with ``Server.bcast_notif()`` and with ``Server.broadcast()``.
+    One Client never reads anything, to show the effect of a stuck peer.
+"""
+
+from asyncio import gather, get_running_loop, open_connection, run, start_server
+from sys import argv
+from time import perf_counter
+
+from ezipc.remote import Remote
+from ezipc.server import Server
+from ezipc.util import set_verbosity
+
+from .common import banner
+
+
+async def main(*counts: int):
+    banner()
+    set_verbosity(0)
+    loop = get_running_loop()
+
+    server = Server("127.0.0.1", 0)
+    server.eventloop = loop
+    server.setup()
+    listener = await start_server(server.open_connection, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+
+    # A Client which connects, and then never reads.
+    _stuck = await open_connection("127.0.0.1", port)
+
+    clients = []
+    arrived = []
+    done = loop.create_future()
+
+    def receive(_):
+        arrived.append(None)
+        if len(arrived) == len(clients) and not done.done():
+            done.set_result(perf_counter())
+
+    for count in counts or (100, 500, 1000):
+        while len(clients) < count:
+            instr, outstr = await open_connection("127.0.0.1", port)
+            client = Remote(loop, instr, outstr, rtype="Server")
+            client.hook_notif("BENCH")(receive)
+            loop.create_task(client.loop(1))
+            clients.append(client)
+
+        for name, cast in (
+            ("bcast_notif()", lambda: server.bcast_notif("BENCH", [count])),
+            (
+                "broadcast()",
+                lambda: server.broadcast("BENCH", [count], timeout=0.05, limit=64),
+            ),
+        ):
+            arrived.clear()
+            done = loop.create_future()
+            start = perf_counter()
+            ret = await cast()
+            if isinstance(ret, dict):
+                await gather(*ret.values(), return_exceptions=True)
+            returned = perf_counter()
+            reached = await done
+
+            print(
+                f"{name:<16} {count:>6} Clients:"
+                f" returned in {(returned - start) * 1000:>8.2f} ms,"
+                f" all received in {(reached - start) * 1000:>8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    run(main(*map(int, argv[1:])))
@@ -0,0 +1,50 @@
+"""Compare sending many Requests with ``Remote.request_many()`` against calling
+    ``Remote.request()`` in a loop.
+"""
+
+from asyncio import gather, run
+from sys import argv
+
+from .common import banner, pair, REPEAT, report, timed
+
+
+async def main(count: int = 10000):
+    banner()
+    client, server = await pair()
+
+    @server.hook_request("ECHO")
+    def echo(data):
+        return data
+
+    calls = [("ECHO", [i]) for i in range(count)]
+
+    async def looped():
+        await gather(*[await client.request(m, p) for m, p in calls])
+
+    async def gathered():
+        await gather(*(client.request(m, p, timeout=30) for m, p in calls))
+
+    async def batched():
+        await gather(*await client.request_many(calls))
+
+    async def autobatched():
+        client.enable_batching(0)
+        try:
+            await gather(*(client.request(m, p, timeout=30) for m, p in calls))
+        finally:
+            client.batch_delay = None
+
+    for name, func in (
+        ("request() in a loop", looped),
+        ("request() gathered", gathered),
+        ("request() auto-batched", autobatched),
+        ("request_many()", batched),
+    ):
+        frames = client.connection.frames_sent
+        report(name, count, await timed(func))
+        frames = (client.connection.frames_sent - frames) // REPEAT
+        print(f"{'':<32} {frames:>8} frames")
+
+
+if __name__ == "__main__":
+    run(main(*map(int, argv[1:])))
@@ -0,0 +1,55 @@
+"""Compare Requests sent with ``Remote.request()`` against those sent through
+    ``Remote.prepare()``, both in the cost of building each Request, and in the
+    rate at which small Requests are answered.
+"""
+
+from asyncio import gather, run
+from sys import argv
+from timeit import repeat
+
+from ezipc.remote.protocol import compose, Request
+
+from .common import banner, pair, REPEAT, report, timed
+
+
+async def main(count: int = 10000):
+    banner()
+    client, server = await pair()
+
+    @server.hook_request("ECHO")
+    def echo(data):
+        return data
+
+    prepared = client.prepare("ECHO")
+    params = {"key": "value", "n": 1}
+
+    def built():
+        bytes(compose(Request, "ECHO", params, mid=client._id_new()))
+
+    def built_prepared():
+        prepared.encode(params, client._id_new(), 0)
+
+    # What it costs the caller to build each Request.
+    for name, func in (
+        ("build Request", built),
+        ("build PreparedRequest", built_prepared),
+    ):
+        report(name, count, min(repeat(func, number=count, repeat=REPEAT)))
+
+    async def requested():
+        await gather(
+            *(client.request("ECHO", params, timeout=30) for _ in range(count))
+        )
+
+    async def requested_prepared():
+        await gather(*(prepared(params, timeout=30) for _ in range(count)))
+
+    for name, func in (
+        ("request()", requested),
+        ("prepare()", requested_prepared),
+    ):
+        report(name, count, await timed(func))
+
+
+if __name__ == "__main__":
+    run(main(*map(int, argv[1:])))
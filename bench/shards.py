@@ -0,0 +1,76 @@
+"""Compare a Server running every Remote on one Event Loop against one whose
+    Remotes are spread over several Shards, each with its own Loop and Thread,
+    as with ``Server.run(shards=K)``.
+
+Two Hooks are measured. ``ECHO`` spends its time in Python, and cannot gain from
+    more Threads. ``ZIP`` spends its time compressing with ``zlib``, which lets
+    go of the Global Interpreter Lock, and can gain when there are spare Cores.
+"""
+
+from asyncio import run
+from multiprocessing import get_context
+from os import cpu_count, urandom
+from sys import argv
+from zlib import compress
+
+from ezipc.server import Server
+from ezipc.util import set_verbosity
+
+from .common import (
+    banner,
+    CONNECTIONS,
+    free_port,
+    hammer,
+    LOADERS,
+    report,
+    wait_for_port,
+)
+
+
+# Half random, half repeated, so that compressing it takes real work.
+PAYLOAD: bytes = (urandom(1024) + bytes(1024)) * 32
+
+
+def serve(port: int, shards: int):
+    set_verbosity(0)
+    server = Server("127.0.0.1", port)
+
+    @server.hook_request("ECHO")
+    def echo(data):
+        return data
+
+    @server.hook_request("ZIP")
+    def zipped(data):
+        return len(compress(PAYLOAD, 6))
+
+    async def main():
+        server.setup()
+        await (await server.run(shards=shards))
+
+    run(main())
+
+
+def measure(shards: int, method: str, count: int) -> None:
+    port = free_port()
+
+    server = get_context("fork").Process(target=serve, args=(port, shards))
+    server.start()
+    try:
+        wait_for_port(port)
+        calls, seconds = hammer(port, count, method, {"key": "value", "n": 1})
+        report(f"{method} {shards} shard{'' if shards == 1 else 's'}", calls, seconds)
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main(count: int = 1000, *shards: int):
+    banner()
+    print(f"CPUs: {cpu_count()}, {LOADERS} x {CONNECTIONS} Connections")
+    for method in ("ECHO", "ZIP"):
+        for k in shards or (1, 2, 4):
+            measure(k, method, count)
+
+
+if __name__ == "__main__":
+    main(*map(int, argv[1:]))
@@ -0,0 +1,64 @@
+"""Measure how many small Requests a Server answers per second, as the number of
+    Worker Processes given to ``Server.start(workers=N)`` grows.
+
+The load comes from several Processes of its own, each with several Connections,
+    so that the Clients are not the bottleneck. Scaling can only show when the
+    Machine has a spare Core for every Worker and every load Process.
+"""
+
+from multiprocessing import get_context
+from os import cpu_count
+from sys import argv
+from time import sleep
+
+from ezipc.server import Server
+from ezipc.util import set_verbosity
+
+from .common import (
+    banner,
+    CONNECTIONS,
+    free_port,
+    hammer,
+    LOADERS,
+    report,
+    wait_for_port,
+)
+
+
+def serve(port: int, workers: int):
+    set_verbosity(0)
+    server = Server("127.0.0.1", port)
+
+    @server.hook_request("ECHO")
+    def echo(data):
+        return data
+
+    server.start(workers=workers)
+
+
+def measure(workers: int, count: int) -> None:
+    port = free_port()
+
+    server = get_context("fork").Process(target=serve, args=(port, workers))
+    server.start()
+    try:
+        wait_for_port(port)
+        # Give every Worker time to bind, not only the first.
+        sleep(1)
+
+        calls, seconds = hammer(port, count, "ECHO", {"key": "value", "n": 1})
+        report(f"{workers} worker{'' if workers == 1 else 's'}", calls, seconds)
+    finally:
+        server.terminate()
+        server.join()
+
+
+def main(count: int = 2000, *workers: int):
+    banner()
+    print(f"CPUs: {cpu_count()}, {LOADERS} x {CONNECTIONS} Connections")
+    for n in workers or (1, 2, 4):
+        measure(n, count)
+
+
+if __name__ == "__main__":
+    main(*map(int, argv[1:]))
@@ -1,6 +1,7 @@
 from asyncio import (
     AbstractEventLoop,
     CancelledError,
+    gather,
     get_running_loop,
     open_connection,
     Task,
@@ -8,17 +9,25 @@ from asyncio import (
     wait_for,
 )
 from datetime import datetime as dt
-from typing import Callable, Optional, Union
+from inspect import isawaitable, signature
+from typing import Callable, Dict, List, Optional, Union
 
 from .remote import (
     can_encrypt,
+    Lane,
     mkid,
     notif_handler,
+    Notification,
     Remote,
     RemoteError,
+    Request,
     request_handler,
     rpc_response,
+    TopicIndex,
 )
+from .remote.codec import BACKEND
+from .remote.executors import hold, release, warm
+from .remote.protocol import compose
 from .util import callback_response, echo, err, P, warn
 
 
@@ -28,6 +37,7 @@ __all__ = (
     "Client",
     "echo",
     "err",
+    "Lane",
     "rpc_response",
     "P",
     "Remote",
@@ -50,6 +60,8 @@ class Client:
     :param str addr: IPv4 Address of the Server this Client will connect to. If
         this is not supplied, ``127.0.0.1`` will be used.
     :param int port: IP Port of the Server to use.
+    :param int cache: The greatest number of Results to keep from Methods which
+        the Server declares cacheable. If this is zero, nothing is cached.
     """
 
     __slots__ = (
@@ -61,11 +73,15 @@ class Client:
         "startup",
         "hooks_notif",
         "hooks_request",
+        "priorities",
+        "cache_size",
+        "topics",
     )
 
-    def __init__(self, addr: str = "127.0.0.1", port: int = 9002):
+    def __init__(self, addr: str = "127.0.0.1", port: int = 9002, cache: int = 256):
         self.addr: str = addr
         self.port: int = port
+        self.cache_size: int = cache
 
         self.eventloop: Optional[AbstractEventLoop] = None
         self.remote: Optional[Remote] = None
@@ -75,6 +91,11 @@ class Client:
 
         self.hooks_notif = {}
         self.hooks_request = {}
+        self.priorities: Dict[str, int] = {}
+
+        # Topic Patterns, and the local Functions subscribed to each.
+        self.topics: TopicIndex = TopicIndex()
+        self.hook_notif("TOPIC.PUB")(self._on_publish)
 
     @property
     def alive(self) -> bool:
@@ -86,11 +107,19 @@ class Client:
 
         if response:
             self.remote.id = response.get("id") or mkid(self.remote)
+            self.remote.enable_cache(response.get("cache") or {}, self.cache_size)
             ts = response.get("startup", 0)
             if ts:
                 self.startup = dt.fromtimestamp(ts)
                 P.startup = self.startup
                 echo("info", f"Server Uptime: {dt.utcnow() - self.startup}")
+
+            patterns = set()
+            for func in self.topics.subscribers():
+                patterns |= self.topics.patterns(func)
+            if patterns:
+                # Resume any Subscriptions made before connecting.
+                await self.remote.request("TOPIC.SUB", sorted(patterns), timeout=10)
         else:
             self.remote.id = mkid(self.remote)
             warn("Failed to get Server Uptime.")
@@ -110,23 +139,119 @@ class Client:
                 f" Connection is !>>> NOT SECURE <<<!"
             )
 
-    def hook_notif(self, method: str):
+    def hook_notif(self, method: str, *, priority: int = None, **options):
         """Signal to the Remote that `func` is waiting for Notifications of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Notification, and the second is the Remote.
+            of the Notification, and the second is the Remote. It may also take a
+            third, the Notification itself.
+
+        If ``priority`` is given, Messages of the Method will be queued in that
+            Lane. Other Keyword Options, such as ``executor`` and ``bulkhead``,
+            are passed through to ``notif_handler()``.
         """
-        return notif_handler(self.hooks_notif, method)
+        if priority is not None:
+            self.priorities[method] = priority
+        return notif_handler(self.hooks_notif, method, **options)
 
-    def hook_request(self, method: str) -> Callable:
+    def hook_request(
+        self, method: str, *, priority: int = None, **options
+    ) -> Callable:
         """Signal to the Remote that `func` is waiting for Requests of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Request, and the second is the Remote.
+            of the Request, and the second is the Remote. It may also take a
+            third, the Request itself.
+
+        If ``priority`` is given, Messages of the Method will be queued in that
+            Lane. Other Keyword Options, such as ``executor`` and ``bulkhead``,
+            are passed through to ``request_handler()``.
+        """
+        if priority is not None:
+            self.priorities[method] = priority
+        return request_handler(self.hooks_request, method, **options)
+
+    def hook_topic(self, pattern: str) -> Callable:
+        """Subscribe a Function to every Topic matching a Pattern, such as
+            ``news.#``. See the ``topics`` Module for the form of Patterns.
+
+        The provided Function may take up to three arguments: The Data that was
+            published, the Topic it was published to, and the Remote.
+
+        If the Client is already connected, ``subscribe()`` must also be called
+            to tell the Server; Otherwise, the Server is told during Setup.
+        """
+
+        def decorator(func: Callable) -> Callable:
+            self.topics.subscribe(func, pattern)
+            return func
+
+        return decorator
+
+    async def subscribe(self, pattern: str, func: Callable = None) -> List[str]:
+        """Ask the Server to send Notifications published to Topics matching a
+            Pattern, and optionally subscribe a Function to them. Return all the
+            Patterns to which the Client is now subscribed.
+        """
+        if func is not None:
+            self.hook_topic(pattern)(func)
+        return await self.remote.request("TOPIC.SUB", [pattern], timeout=10)
+
+    async def unsubscribe(self, pattern: str) -> List[str]:
+        """Stop receiving Notifications published to Topics matching a Pattern,
+            and remove all local Functions subscribed to it. Return all the
+            Patterns to which the Client is still subscribed.
         """
-        return request_handler(self.hooks_request, method)
+        for func in list(self.topics.subscribers()):
+            self.topics.unsubscribe(func, pattern)
+        return await self.remote.request("TOPIC.UNSUB", [pattern], timeout=10)
+
+    async def relay(
+        self,
+        to: str,
+        meth: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        request: bool = False,
+        timeout: float = 10,
+    ):
+        """Send a Message, through the Server, to another Client, identified by
+            the ID the Server gave it. If ``request`` is True, a Request is sent,
+            and its Result is returned. Otherwise, a Notification is sent.
+
+        The Message is encoded here, and the Server passes the text on without
+            decoding it. The ID of a relayed Request starts with the ID of this
+            Client, so it cannot clash with those of other Clients.
+        """
+        if request:
+            msg = compose(Request, meth, params, mid=self.remote._id_new())
+            if timeout > 0:
+                msg.set_budget(timeout)
+            return await self.remote.request(
+                "RELAY.REQ", {"to": to, "msg": str(msg)}, timeout=timeout
+            )
+        else:
+            msg = compose(Notification, meth, params)
+            await self.remote.notif("RELAY.NOTIF", {"to": to, "msg": str(msg)})
+
+    def _on_publish(self, data: list, remote: Remote):
+        topic, params = data
+        calls = []
+
+        for func in self.topics.match(topic):
+            arity = len(signature(func).parameters)
+            try:
+                ret = func(*(params, topic, remote)[:arity])
+            except Exception as e:
+                err(f"Failed to handle {topic!r} with {func.__name__!r}:", e)
+            else:
+                if isawaitable(ret):
+                    calls.append(ret)
+
+        if calls:
+            return gather(*calls, return_exceptions=True)
 
     async def connect(
         self, loop: AbstractEventLoop, helpers: int = 5, timeout: Union[float, int] = 10
@@ -161,9 +286,14 @@ class Client:
             return False
 
         try:
+            # Spawn the Workers of any Process Pools before any Requests arrive.
+            hold(self)
+            await warm()
+            echo("info", f"JSON Backend: {BACKEND}")
             self.remote = Remote(loop, *streams, rtype="Server", remote_id="000")
             self.remote.hooks_notif_inher = self.hooks_notif
             self.remote.hooks_request_inher = self.hooks_request
+            self.remote.priorities.update(self.priorities)
             self.listening = loop.create_task(self.remote.loop(helpers))
             self.listening.add_done_callback(self.report)
         except:
@@ -203,6 +333,10 @@ class Client:
             finally:
                 self.remote = None
 
+        # Let go of the Threads and Processes which ran Hooks, unless another
+        #   Server or Client is still using them.
+        release(self)
+
     async def terminate(self, reason: str = None):
         """Politely close the Remote Connection. Calls ``Remote.terminate()``
         and passes the Reason, if any, through.
@@ -235,6 +369,19 @@ class Client:
                     for k, v in self.remote.total_recv.items()
                 ],
             )
+            pending = self.remote.futures.stats()
+            echo(
+                "info",
+                f"Pending: {pending['pending']} Request(s), oldest"
+                f" {pending['oldest']:.1f}s; {pending['expired']} expired.",
+            )
+            flights = self.remote.flights.stats()
+            if flights["joined"]:
+                echo(
+                    "info",
+                    f"Shared: {flights['joined']} Request(s) joined"
+                    f" {flights['led']} on the wire.",
+                )
         except:
             pass
 
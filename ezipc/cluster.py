@@ -0,0 +1,652 @@
+"""Module providing a Cluster, which links Servers to each other so that
+    Broadcasts, Topics and Relays reach Clients on any of them.
+
+Each Server in a Cluster is a Node with its own ID. Nodes connect to each other
+    with ez-ipc itself: One Node dials the Port of another as though it were a
+    Client, and both say who they are with a ``CLUSTER.HELLO`` Request. From
+    then on the Connection is a Link, and is no longer counted among the
+    Clients of either Node.
+
+Every Node of a Cluster is given the same Secret. Anyone may connect to the Port
+    of a Node, so before a Connection becomes a Link, each end proves to the
+    other that it knows the Secret, without sending it: Each sends a random
+    Challenge, and answers that of the other with an HMAC of both Challenges
+    and both Node IDs, keyed with the Secret. This takes a ``CLUSTER.HELLO``
+    Request from the dialing Node, and a ``CLUSTER.AUTH`` Request once it has
+    checked the answer of the other. A Node ID which is already Linked is
+    refused, and only a Link may send a ``CLUSTER.BATCH``.
+
+Remote IDs handed out by a Node in a Cluster begin with the ID of the Node, as
+    in ``"3F0A.7C2"``, so any Node can tell where a Remote is from its ID alone,
+    without keeping a directory of every Client in the Cluster. A Relay to a
+    Remote on another Node is passed to that Node over their Link, as the same
+    ``RELAY.REQ`` Request or ``RELAY.NOTIF`` Notification a Client would send.
+    A Relay therefore needs a Link straight to the Node of its target.
+
+Broadcasts and Publications are passed on to every Linked Node, which delivers
+    them to its own Clients and passes them on to any Node which has not had
+    them yet. Every such Message carries an ID and the Nodes which it has been
+    sent to, so that it is passed on only where needed, and delivered only once
+    even where the Links form loops.
+
+Messages for another Node are not sent one by one. They wait for a moment, and
+    everything for the same Node in that moment is sent as one ``CLUSTER.BATCH``
+    Notification. Messages are passed on as the text they were first encoded
+    as. Each Node checks that what it is given to deliver is one well-formed
+    Notification before sending it to its Clients, but never encodes it again.
+
+The ID of every Message includes a random Epoch, chosen when the Cluster is made,
+    so that a Node which restarts, and counts its Messages from zero again, is
+    not mistaken for one sending Messages which have already been delivered.
+
+A Server run in several Worker Processes cannot be a Node; Every Worker would
+    need an ID, and a Link, of its own.
+
+Requests sent to every Remote, such as with ``Server.scatter()``, still reach
+    only the Clients of the Node which sends them.
+"""
+
+from asyncio import (
+    AbstractEventLoop,
+    CancelledError,
+    open_connection,
+    run_coroutine_threadsafe,
+    sleep,
+    Task,
+    wait_for,
+)
+from collections import deque
+from hashlib import sha256
+from hmac import compare_digest, new as hmac
+from itertools import count
+from secrets import randbits, token_hex
+from threading import Lock
+from typing import Any, Deque, Dict, List, Set, Tuple, TYPE_CHECKING, Union
+
+from .remote import Error, JRPC, Lane, LazyMessage, Remote
+from .remote.codec import loads
+from .remote.protocol import compose, Notification, Request
+from .shards import on_loop, run_on
+from .util import echo, err, warn
+
+if TYPE_CHECKING:
+    from asyncio import TimerHandle
+    from .server import Server
+
+
+# The number of seconds that Messages for another Node wait to be sent together.
+LINGER: float = 0.002
+# The greatest number of Messages sent to another Node in one Batch.
+BATCH: int = 256
+# The number of Message IDs remembered, to recognize Messages already delivered.
+SEEN: int = 8192
+# The least and greatest number of seconds to wait before dialing a Node again.
+RETRY_MIN: float = 0.5
+RETRY_MAX: float = 30.0
+
+
+class Seen:
+    """A Set of the most recent Message IDs, which forgets the oldest. Messages
+        from other Nodes may arrive on the Loops of several Shards at once, so
+        it is changed only under a Lock.
+    """
+
+    __slots__ = ("ids", "lock", "order")
+
+    def __init__(self, size: int = SEEN):
+        self.ids: Set[str] = set()
+        self.lock: Lock = Lock()
+        self.order: Deque[str] = deque(maxlen=size)
+
+    def __contains__(self, mid: str) -> bool:
+        return mid in self.ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, mid: str) -> bool:
+        """Remember an ID. Return False if it was already remembered."""
+        with self.lock:
+            if mid in self.ids:
+                return False
+
+            if len(self.order) == self.order.maxlen:
+                self.ids.discard(self.order[0])
+            self.order.append(mid)
+            self.ids.add(mid)
+            return True
+
+
+def valid_node(node: Any) -> bool:
+    """Check whether something may be the ID of a Node."""
+    return isinstance(node, str) and bool(node) and "." not in node
+
+
+def deliverable(kind: str, meth: str, msg: Any) -> bool:
+    """Check whether a Message from another Node is the single Notification
+        which its Envelope says that it is.
+    """
+    if not isinstance(msg, dict) or JRPC.check(msg) is not JRPC.NOTIF:
+        return False
+    elif kind == "b":
+        return msg["method"] == meth
+    else:
+        # A Publication holds its Topic as its first Parameter.
+        params = msg.get("params")
+        return (
+            msg["method"] == "TOPIC.PUB"
+            and isinstance(params, list)
+            and params[:1] == [meth]
+        )
+
+
+class NodeRoute:
+    """Stands in for a Remote which is connected to another Node, so that it can
+        be sent Messages in the same ways as a local one.
+    """
+
+    __slots__ = ("cluster", "id", "node")
+
+    def __init__(self, cluster: "Cluster", node: str, rid: str):
+        self.cluster: "Cluster" = cluster
+        self.node: str = node
+        self.id: str = rid
+
+    def __repr__(self) -> str:
+        return f"<NodeRoute: {self.id} on Node {self.node}>"
+
+    @property
+    def open(self) -> bool:
+        return self.node in self.cluster.links
+
+    @property
+    def eventloop(self) -> AbstractEventLoop:
+        """The Loop of the Link to the Node, on which this must be used."""
+        return self.cluster.link(self.node).eventloop
+
+    async def forward(self, msg: Union[LazyMessage, Any], *, timeout: float = 0):
+        """Pass a Message on to the Node which holds the Remote. A Request goes at
+            once, and a Future for its Result is returned, or the Result itself
+            if ``timeout`` is given. A Notification goes in the next Batch.
+        """
+        link = self.cluster.link(self.node)
+        if msg.mtype is JRPC.REQUEST:
+            return await link.request(
+                "RELAY.REQ",
+                {"to": self.id, "msg": str(msg)},
+                nohandle=True,
+                quiet=True,
+                timeout=timeout,
+            )
+        else:
+            self.cluster.queue(self.node, {"k": "n", "to": self.id, "msg": str(msg)})
+
+    async def notif(self, meth: str, params: Union[dict, list, tuple] = None, **_):
+        await self.forward(compose(Notification, meth, params))
+
+    async def request(
+        self, meth: str, params: Union[dict, list, tuple] = None, *, timeout=0, **_
+    ):
+        link = self.cluster.link(self.node)
+        return await self.forward(
+            compose(Request, meth, params, mid=link._id_new()), timeout=timeout
+        )
+
+
+class Cluster:
+    """Joins a Server to a Cluster of Servers. The Cluster must be created before
+        the Server is run, so that its Hooks are registered, and the IDs of all
+        Clients carry the ID of the Node.
+
+    :param Server server: The Server which is to be a Node of the Cluster.
+    :param str node: The ID of the Node. It must be unique in the Cluster, and
+        must not contain a Full Stop. If not given, one is made at random.
+    :param secret: The Secret shared by every Node of the Cluster, which a
+        Node must prove that it knows before it is Linked.
+    :param float linger: The number of seconds that Messages for another Node
+        wait to be sent together.
+    :param int batch: The greatest number of Messages sent in one Batch.
+    """
+
+    __slots__ = (
+        "batch",
+        "batches",
+        "challenges",
+        "delivered",
+        "duplicates",
+        "dialers",
+        "epoch",
+        "forwarded",
+        "linger",
+        "links",
+        "listening",
+        "lock",
+        "node",
+        "open",
+        "pending",
+        "refused",
+        "secret",
+        "sequence",
+        "server",
+        "seen",
+        "timers",
+    )
+
+    def __init__(
+        self,
+        server: "Server",
+        node: str = None,
+        *,
+        secret: Union[str, bytes],
+        linger: float = LINGER,
+        batch: int = BATCH,
+    ):
+        if node is None:
+            node = format(randbits(16), "04X")
+        elif not valid_node(node):
+            raise ValueError(f"Invalid Node ID: {node!r}")
+
+        if isinstance(secret, str):
+            secret = secret.encode()
+        if not secret:
+            raise ValueError("A Cluster must have a Secret.")
+
+        self.server: "Server" = server
+        self.node: str = node
+        self.secret: bytes = secret
+        self.linger: float = linger
+        self.batch: int = batch
+        self.open: bool = True
+
+        # Node ID -> The Connection to that Node. Links may be made from the
+        #   Loops of several Shards, so they are only changed under a Lock.
+        self.links: Dict[str, Remote] = {}
+        self.lock: Lock = Lock()
+        # Connections which have said HELLO, but not yet proven that they know
+        #   the Secret -> Their Node IDs, and the Challenges sent to them.
+        self.challenges: Dict[Remote, Tuple[str, str]] = {}
+        # Tasks keeping up Connections to Nodes which this Node dials.
+        self.dialers: Set[Task] = set()
+        # Links which this Node dialed -> The Tasks listening to them.
+        self.listening: Dict[Remote, Task] = {}
+
+        # Node ID -> Messages waiting to be sent to it, and the Timer which will
+        #   send them.
+        self.pending: Dict[str, List[dict]] = {}
+        self.timers: Dict[str, "TimerHandle"] = {}
+
+        self.seen: Seen = Seen()
+        self.epoch: str = format(randbits(32), "08X")
+        self.sequence = count()
+
+        self.batches: int = 0
+        self.forwarded: int = 0
+        self.delivered: int = 0
+        self.duplicates: int = 0
+        self.refused: int = 0
+
+        server.cluster = self
+        server.remotes.prefix = f"{node}."
+        self._hook()
+
+    def __repr__(self) -> str:
+        return f"<Cluster: Node {self.node}, {len(self.links)} Links>"
+
+    def _hook(self):
+        server = self.server
+
+        @server.hook_request("CLUSTER.HELLO")
+        def cb_hello(data: dict, remote: Remote):
+            node = data.get("node") if isinstance(data, dict) else None
+            nonce = data.get("nonce") if isinstance(data, dict) else None
+            if not valid_node(node) or node == self.node or not isinstance(nonce, str):
+                return Error.invalid_params(f"Invalid Node ID: {node!r}")
+            if self.linked(node):
+                self.refused += 1
+                return Error.invalid_request(f"Node {node!r} is already Linked.")
+
+            challenge = token_hex(16)
+            self.challenges[remote] = (node, challenge)
+            return {
+                "node": self.node,
+                "nonce": challenge,
+                "proof": self.prove("accept", nonce, challenge, self.node, node),
+            }
+
+        @server.hook_request("CLUSTER.AUTH")
+        def cb_auth(data: dict, remote: Remote):
+            node, challenge = self.challenges.pop(remote, (None, None))
+            proof = data.get("proof") if isinstance(data, dict) else None
+            if (
+                node is None
+                or not isinstance(proof, str)
+                or not compare_digest(
+                    proof, self.prove("dial", challenge, self.node, node)
+                )
+            ):
+                self.refused += 1
+                warn(f"Refused to Link to {remote!r}: Bad Proof of the Secret.")
+                return Error.invalid_request("Not a Node of this Cluster.")
+
+            try:
+                self.add_link(node, remote)
+            except ValueError as e:
+                self.refused += 1
+                return Error.invalid_request(str(e))
+            else:
+                return {"node": self.node}
+
+        @server.hook_notif("CLUSTER.BATCH")
+        async def cb_batch(data: list, remote: Remote):
+            if self.links.get(remote.id) is not remote:
+                # Only a Node which has proven that it knows the Secret may
+                #   pass Messages on to the Clients of this one.
+                self.refused += 1
+                warn(f"Refused a Batch from {remote!r}, which is not Linked.")
+                return
+
+            for envelope in data if isinstance(data, list) else ():
+                try:
+                    await self.receive(envelope, remote)
+                except Exception as e:
+                    warn(f"Failed to handle a Message from {remote!r}:", e)
+
+        @server.hook_disconnect
+        async def cb_unlink(remote: Remote):
+            self.challenges.pop(remote, None)
+            self.remove_link(remote)
+
+    def prove(self, role: str, *parts: str) -> str:
+        """Answer a Challenge, proving knowledge of the Secret."""
+        return hmac(self.secret, "\n".join((role, *parts)).encode(), sha256).hexdigest()
+
+    def linked(self, node: str) -> bool:
+        """Check whether there is an open Link to a Node."""
+        link = self.links.get(node)
+        return link is not None and link.open
+
+    def add_link(self, node: str, remote: Remote):
+        """Make a Connection the Link to a Node.
+
+        :raises ValueError: If there is already an open Link to the Node.
+        """
+        with self.lock:
+            if self.linked(node):
+                raise ValueError(f"Node {node!r} is already Linked.")
+
+            # The Remote is a Node, not a Client; It should not be sent
+            #   Broadcasts, or be found by Relays. It must be dropped before its
+            #   ID changes, since that is how it is found.
+            self.server.drop(remote)
+            remote.id = node
+            remote.rtype = "Node"
+            self.links[node] = remote
+        echo("con", f"Linked to Node {node} at {remote.host}.")
+
+    def remove_link(self, remote: Remote):
+        with self.lock:
+            lost = [node for node, link in self.links.items() if link is remote]
+            for node in lost:
+                del self.links[node]
+
+        for node in lost:
+            self.discard(node)
+            echo("dcon", f"Lost the Link to Node {node}.")
+
+    def discard(self, node: str):
+        """Drop the next Batch for a Node which is no longer Linked."""
+        loop = self.server.eventloop
+        if not on_loop(loop):
+            # A Link may be lost on the Loop of a Shard, but Batches and their
+            #   Timers belong to the Loop of the Server.
+            loop.call_soon_threadsafe(self.discard, node)
+            return
+
+        if node in self.links:
+            # Linked again before this could run. The Batch is for the new Link.
+            return
+
+        self.pending.pop(node, None)
+        timer = self.timers.pop(node, None)
+        if timer:
+            timer.cancel()
+
+    def link(self, node: str) -> Remote:
+        """Find the Connection to a Node.
+
+        :raises KeyError: If there is no open Link to the Node.
+        """
+        link = self.links.get(node)
+        if link is None or not link.open:
+            raise KeyError(f"No Link to Node {node!r}")
+        return link
+
+    def route(self, to: str) -> NodeRoute:
+        """Find the Node which holds the Remote with a given ID.
+
+        :raises KeyError: If the ID does not belong to a Linked Node.
+        """
+        node = to.rpartition(".")[0]
+        if node == self.node or node not in self.links:
+            raise KeyError(f"No Remote with ID {to!r}")
+        return NodeRoute(self, node, to)
+
+    async def dial(self, addr: str, port: int, timeout: float = 10) -> Remote:
+        """Connect to another Node, once, and Link to it."""
+        streams = await wait_for(open_connection(addr, port), timeout)
+        loop = self.server.eventloop
+
+        remote = Remote(loop, *streams, rtype="Node")
+        remote.hooks_notif_inher = self.server.hooks_notif
+        remote.hooks_request_inher = self.server.hooks_request
+        listening = loop.create_task(remote.loop(self.server.helpers))
+        self.listening[remote] = listening
+
+        try:
+            nonce = token_hex(16)
+            hello = await remote.request(
+                "CLUSTER.HELLO",
+                {"node": self.node, "nonce": nonce},
+                nohandle=True,
+                timeout=timeout,
+            )
+            node, challenge, proof = hello["node"], hello["nonce"], hello["proof"]
+            if (
+                not valid_node(node)
+                or node == self.node
+                or not isinstance(challenge, str)
+                or not isinstance(proof, str)
+                or not compare_digest(
+                    proof, self.prove("accept", nonce, challenge, node, self.node)
+                )
+            ):
+                raise PermissionError(f"{remote!r} is not a Node of this Cluster.")
+
+            await remote.request(
+                "CLUSTER.AUTH",
+                {"proof": self.prove("dial", challenge, node, self.node)},
+                nohandle=True,
+                timeout=timeout,
+            )
+            self.add_link(node, remote)
+        except BaseException:
+            listening.cancel()
+            del self.listening[remote]
+            await remote.terminate("Cluster Handshake Failed")
+            raise
+
+        return remote
+
+    def join(self, addr: str, port: int) -> Task:
+        """Keep a Link to another Node, dialing it again whenever it is lost,
+            until the Cluster is closed. Return the Task which does so.
+        """
+
+        async def keep():
+            delay = RETRY_MIN
+            while self.open:
+                try:
+                    remote = await self.dial(addr, port)
+                except CancelledError:
+                    raise
+                except Exception as e:
+                    warn(f"Failed to reach Node at {addr}:{port}:", e)
+                else:
+                    delay = RETRY_MIN
+                    try:
+                        await self.listening[remote]
+                    except CancelledError:
+                        if not self.open:
+                            raise
+                    except Exception as e:
+                        warn(f"Lost the Link to Node {remote.id}:", e)
+                    finally:
+                        self.listening.pop(remote, None)
+                        self.remove_link(remote)
+
+                if self.open:
+                    await sleep(delay)
+                    delay = min(delay * 2, RETRY_MAX)
+
+        task = self.server.eventloop.create_task(keep())
+        self.dialers.add(task)
+        task.add_done_callback(self.dialers.discard)
+        return task
+
+    def _envelope(self, kind: str, meth: str, text: bytes) -> dict:
+        return {
+            "id": f"{self.node}:{self.epoch}:{next(self.sequence)}",
+            "k": kind,
+            "m": meth,
+            "msg": text.decode(),
+            "via": [self.node],
+        }
+
+    def broadcast(self, meth: str, text: bytes):
+        """Pass a Notification, already encoded, on to the Clients of every
+            other Node.
+        """
+        self.spread(self._envelope("b", meth, text))
+
+    def publish(self, topic: str, text: bytes):
+        """Pass a ``TOPIC.PUB`` Notification, already encoded, on to the Clients
+            of every other Node which are subscribed to its Topic.
+        """
+        self.spread(self._envelope("p", topic, text))
+
+    def spread(self, envelope: dict):
+        """Send a Message to every Linked Node which has not been sent it."""
+        self.seen.add(envelope["id"])
+        targets = [node for node in self.links if node not in envelope["via"]]
+        if not targets:
+            return
+
+        # Every Node sent it now need not send it to the others.
+        envelope = {**envelope, "via": envelope["via"] + targets}
+        for node in targets:
+            self.queue(node, envelope)
+
+    def queue(self, node: str, envelope: dict):
+        """Add a Message to the next Batch for a Node."""
+        loop = self.server.eventloop
+        if not on_loop(loop):
+            # Batches are only kept on the Loop of the Server, not on those of
+            #   its Shards.
+            loop.call_soon_threadsafe(self.queue, node, envelope)
+            return
+
+        pending = self.pending.setdefault(node, [])
+        pending.append(envelope)
+        self.forwarded += 1
+
+        if len(pending) >= self.batch:
+            self.flush(node)
+        elif node not in self.timers:
+            self.timers[node] = self.server.eventloop.call_later(
+                self.linger, self.flush, node
+            )
+
+    def flush(self, node: str):
+        timer = self.timers.pop(node, None)
+        if timer:
+            timer.cancel()
+
+        pending = self.pending.pop(node, None)
+        link = self.links.get(node)
+        if not pending or link is None:
+            return
+
+        self.batches += 1
+        # The Link may be on the Loop of a Shard.
+        run_coroutine_threadsafe(
+            link.notif("CLUSTER.BATCH", pending, quiet=True), link.eventloop
+        )
+
+    async def receive(self, envelope: dict, remote: Remote):
+        """Handle one Message from another Node.
+
+        :raises ValueError: If the Message is not well-formed.
+        """
+        kind = envelope.get("k") if isinstance(envelope, dict) else None
+        text = envelope.get("msg") if isinstance(envelope, dict) else None
+        if not isinstance(text, str):
+            raise ValueError("Malformed Message from another Node.")
+
+        if kind == "n":
+            msg = LazyMessage(text)
+            if msg.mtype is not JRPC.NOTIF:
+                raise ValueError("Only a Notification may be passed on alone.")
+            target = self.server.route(envelope.get("to"))
+            await run_on(target.eventloop, target.forward(msg))
+            return
+
+        elif kind not in ("b", "p"):
+            raise ValueError(f"Unknown kind of Message: {kind!r}")
+
+        meth, via = envelope.get("m"), envelope.get("via")
+        if (
+            not isinstance(envelope.get("id"), str)
+            or not isinstance(meth, str)
+            or not isinstance(via, list)
+            or not all(isinstance(node, str) for node in via)
+        ):
+            raise ValueError("Malformed Message from another Node.")
+
+        # The text is sent to Clients within Batches of other Messages, so it
+        #   must be exactly one Notification, and nothing more.
+        text = text.strip()
+        if not deliverable(kind, meth, loads(text)):
+            raise ValueError(f"Invalid Message from another Node: {text[:64]!r}")
+
+        if not self.seen.add(envelope["id"]):
+            self.duplicates += 1
+            return
+
+        self.spread(envelope)
+        self.delivered += 1
+
+        if kind == "b":
+            await self.server._fan_out(
+                list(self.server.remotes), meth, text.encode(), None
+            )
+        else:
+            await self.server._fan_out(
+                self.server.topics.match(meth), "TOPIC.PUB", text.encode(), Lane.NORMAL
+            )
+
+    async def close(self):
+        """Stop dialing other Nodes, and close every Link."""
+        self.open = False
+        for task in list(self.dialers):
+            task.cancel()
+
+        for node in list(self.pending):
+            self.flush(node)
+
+        for remote in list(self.links.values()):
+            try:
+                await run_on(remote.eventloop, remote.terminate("Cluster Closing"))
+            except Exception as e:
+                err(f"Failed to close the Link to {remote!r}:", e)
+            finally:
+                self.remove_link(remote)
@@ -6,30 +6,38 @@ This is where the real work gets done.
 from asyncio import (
     AbstractEventLoop,
     CancelledError,
+    ensure_future,
     Future,
     gather,
     IncompleteReadError,
     Queue,
+    sleep,
     StreamReader,
     StreamWriter,
     Task,
     wait_for,
 )
-from collections import Counter
+from collections import Counter, OrderedDict
 from datetime import datetime as dt
 from functools import partial
 from inspect import isawaitable
 from json import JSONDecodeError
 from secrets import randbits
+from time import monotonic
 from typing import (
+    Any,
     AsyncGenerator,
     Awaitable,
+    AsyncIterator,
     Callable,
+    Container,
     Dict,
     Generator,
+    Iterable,
     List,
     Optional,
     overload,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -45,21 +53,37 @@ from ..util.output import (
     res_good,
     warn,
 )
+from .admission import Bulkhead
+from .cache import cache_key, MISSING, ResultCache
 from .connection import can_encrypt, Connection
 from .exc import RemoteError
+from .flight import FlightGroup
 from .handlers import rpc_response, notif_handler, request_handler, response_handler
+from .lanes import Lane, LaneQueue, Lanes, peek_method, PRIORITY
+from .pending import Pending
+from .prepared import PreparedRequest
+from .registry import Registry
+from .streams import Credit, ResponseStream, WINDOW_DEFAULT
+from .topics import TopicIndex
 from .protocol import (
     Batch,
+    compose,
     Error,
     JRPC,
+    LazyMessage,
     Message,
     Notification,
+    Raw,
+    Rejected,
     Request,
     Response,
 )
 
 
-counter = lambda: Counter(byte=0, notif=0, request=0, response=0)
+counter = lambda: Counter(byte=0, frame=0, notif=0, request=0, response=0)
+CANCELLED_MAX: int = 1024
+BATCH_MAX: int = 64
+BATCH_BYTES: int = 0x8000
 TV = TypeVar("TV", bound=Callable)
 
 
@@ -91,9 +115,25 @@ class Remote:
         "hooks_request",
         "hooks_request_inher",
         "futures",
+        "cacheable",
+        "rcache",
+        "inflight",
+        "cancelled",
+        "streams",
+        "credits",
         "lines",
+        "outbox",
+        "queued",
+        "writer",
+        "batch_delay",
+        "batch_max",
+        "batch_bytes",
+        "priorities",
         "total_sent",
         "total_recv",
+        "expired",
+        "flights",
+        "singleflight",
         "group",
         "rtype",
         "id",
@@ -126,11 +166,49 @@ class Remote:
         self.hooks_request: Dict[str, Callable] = {}
         self.hooks_request_inher: Dict[str, Callable] = {}
 
-        self.futures: Dict[str, Future] = {}
+        # Futures waiting for Responses. Any left unanswered for too long are
+        #   failed, and the Remote is told to stop working on them.
+        self.futures: Pending = Pending(eventloop, self._expire)
+
+        # Methods which the Remote has declared cacheable, with their TTLs, and
+        #   the Cache of their Results. See ``enable_cache()``.
+        self.cacheable: Dict[str, Optional[float]] = {}
+        self.rcache: Optional[ResultCache] = None
+
+        # Requests on the wire which identical concurrent Requests may share,
+        #   and whether they do so when the caller does not specify.
+        self.flights: FlightGroup = FlightGroup()
+        self.singleflight: bool = False
+
+        # Handlers currently running for Requests from the Remote, and the IDs
+        #   of Requests cancelled by the Remote before they could be started.
+        self.inflight: Dict[str, Future] = {}
+        self.cancelled: OrderedDict = OrderedDict()
+
+        # Streamed Responses being received from the Remote, and the Credit of
+        #   those being sent to it. See the ``streams`` Module.
+        self.streams: Dict[str, ResponseStream] = {}
+        self.credits: Dict[str, Credit] = {}
+
+        # Inbound Lines and outbound Messages are both sorted into Lanes by the
+        #   priority of their Methods, so that control traffic is not stuck
+        #   behind bulk traffic.
+        self.priorities: Dict[str, int] = dict(PRIORITY)
+        self.lines: LaneQueue = LaneQueue(self._lane_line)
+        self.outbox: Lanes = Lanes()
+        # The number of Bytes waiting in the Outbox.
+        self.queued: int = 0
+        self.writer: Optional[Task] = None
+
+        # Outbound Messages may be packed together into Batches, to send fewer
+        #   Frames. This is off unless there is a delay. See ``enable_batching``.
+        self.batch_delay: Optional[float] = None
+        self.batch_max: int = BATCH_MAX
+        self.batch_bytes: int = BATCH_BYTES
 
-        self.lines: Queue = Queue()
         self.total_sent: Counter = counter()
         self.total_recv: Counter = counter()
+        self.expired: int = 0
 
         self.group: set = group
         self.rtype: str = rtype
@@ -145,6 +223,15 @@ class Remote:
     def host(self) -> str:
         return f"{self.addr}:{self.port}"
 
+    @property
+    def backlog(self) -> int:
+        """The number of Bytes which are waiting to be sent, because the Remote
+            is not reading them fast enough. This counts both those still in the
+            Outbox and those already written to the Connection.
+        """
+        transport = self.outstr.transport
+        return self.queued + (transport.get_write_buffer_size() if transport else 0)
+
     @property
     def is_secure(self) -> bool:
         return bool(self.connection.can_encrypt and self.connection.encrypted)
@@ -168,6 +255,45 @@ class Remote:
         def cb_ping(data):
             return data
 
+        @self.hook_notif("CACHE.DROP")
+        def cb_cache_drop(data: dict):
+            # The Remote has told us that some of its Results have changed.
+            if self.rcache is not None:
+                self.rcache.invalidate(data.get("meth"), data.get("params", MISSING))
+
+        @self.hook_notif("RPC.CANCEL")
+        def cb_cancel(data: list):
+            # The Remote has stopped waiting for these Requests. Stop working on
+            #   them, or make sure that they are never started.
+            for mid in data:
+                handler = self.inflight.get(mid)
+                if handler is None:
+                    self.cancelled[mid] = None
+                    while len(self.cancelled) > CANCELLED_MAX:
+                        self.cancelled.popitem(last=False)
+                elif not handler.done():
+                    echo("info", f"Request {mid} cancelled by {self}.")
+                    handler.cancel()
+
+        @self.hook_notif("RPC.MORE")
+        def cb_more(data: list):
+            # The Remote has read some parts of a Stream, and wants more.
+            mid, count = data
+            credit = self.credits.get(mid)
+            if credit is not None:
+                credit.grant(count)
+
+        @self.hook_notif("RPC.PART")
+        def cb_part(data: list):
+            mid, part = data
+            stream = self.streams.get(mid)
+            if stream is not None:
+                stream.feed(part)
+                self.futures.touch(mid, stream.timeout)
+                if stream.finished():
+                    # This was the last part, and it was late.
+                    del self.streams[mid]
+
         @self.hook_request("RSA.EXCH")
         async def cb_rsa_exchange(data: list):
             if self.connection.can_encrypt:
@@ -189,8 +315,195 @@ class Remote:
             else:
                 yield Error(1, "Cannot Activate")
 
-    def _id_new(self) -> str:
-        return f"{self.id}/{randbits(24):0>6X}"
+    def _id_new(self, taken: Container[str] = ()) -> str:
+        while (mid := f"{self.id}/{randbits(24):0>6X}") in self.futures or (
+            mid in taken
+        ):
+            # Never reuse the ID of a Request still waiting for its Response.
+            pass
+        return mid
+
+    def _lane_line(self, item: Tuple[float, bytes]) -> int:
+        method = peek_method(item[1])
+        if method is None:
+            # Responses are cheap to process, and something is waiting on them.
+            return Lane.HIGH
+        else:
+            return self.lane(method)
+
+    def _abandon(self, mid: str, future: Future) -> None:
+        """Callback for the Future of a Request. If it was cancelled, whether
+            directly or by a timeout, tell the Remote to stop working on it.
+        """
+        if future.cancelled():
+            self.futures.pop(mid, None)
+            if self.open:
+                self.eventloop.create_task(
+                    self.notif("RPC.CANCEL", [mid], quiet=True)
+                )
+
+    def _forget_stream(self, mid: str, _future: Future) -> None:
+        """Callback for the Future of a Streamed Request."""
+        stream = self.streams.get(mid)
+        if stream is not None and stream.finished():
+            del self.streams[mid]
+
+    def _stream_out(self, request: Request, gen: Union[AsyncGenerator, Generator]):
+        """Start sending the values of a Generator as a Stream, in its own Task,
+            so that it does not hold up a Helper for as long as it runs.
+        """
+        task = self.eventloop.create_task(self._send_stream(request, gen))
+        self.inflight[request.id] = task
+        task.add_done_callback(lambda _: self.inflight.pop(request.id, None))
+
+    async def _send_stream(
+        self, request: Request, gen: Union[AsyncGenerator, Generator]
+    ) -> None:
+        credit = self.credits[request.id] = Credit(self.eventloop, request.stream)
+        lane = self.lane(request.method)
+        parts = 0
+
+        try:
+            while True:
+                # Wait for room in the Window before making the next value, so
+                #   that nothing is made before it can be sent.
+                await credit.take()
+                try:
+                    if isinstance(gen, AsyncGenerator):
+                        part = await gen.__anext__()
+                    else:
+                        part = next(gen)
+                except (StopAsyncIteration, StopIteration):
+                    break
+
+                await self.send(Notification("RPC.PART", request.id, part), lane)
+                parts += 1
+
+        except CancelledError:
+            # The Remote has stopped reading.
+            raise
+        except Exception as e:
+            await self.send(
+                request.response(error=Error.from_exception(e)), Lane.HIGH
+            )
+        else:
+            # The end of the Stream is marked outside of the Result, so that it
+            #   cannot be confused with anything the Handler might return.
+            end = request.response(result=[])
+            end.set_parts(parts)
+            await self.send(end, lane)
+
+        finally:
+            del self.credits[request.id]
+            if isinstance(gen, AsyncGenerator):
+                await gen.aclose()
+            else:
+                gen.close()
+
+    def _cancel_now(self, line: bytes) -> bool:
+        """Process a line immediately, if it holds only Cancellations."""
+        try:
+            msgs = list(JRPC.decode(line))
+        except Exception:
+            return False
+
+        if all(
+            isinstance(msg, Notification) and msg.method == "RPC.CANCEL"
+            for msg in msgs
+        ):
+            for msg in msgs:
+                self.process_message(msg)
+            return True
+        else:
+            return False
+
+    def _expire(self, mids: List[str]) -> None:
+        """Callback for the Pending Table, when Requests go unanswered until
+            their Deadlines.
+        """
+        warn(f"{len(mids)} Request(s) to {self!r} went unanswered.")
+        if self.open:
+            self.eventloop.create_task(self.notif("RPC.CANCEL", mids, quiet=True))
+
+    def _screen(
+        self, msgs: Iterable[Union[Exception, Message]]
+    ) -> Dict[Union[Exception, Message], Any]:
+        """Process each Message which should be processed at all. A Request
+            which was cancelled is dropped. A Request whose Deadline has passed,
+            or whose Budget is invalid, is not run, but is answered with an
+            Error, so that anything passing it on stops waiting for it.
+        """
+        data = {}
+        for msg in msgs:
+            if isinstance(msg, Rejected):
+                warn(f"Rejecting Request {msg.request.id} from {self!r}:", msg)
+                data[msg.request] = msg.error
+
+            elif isinstance(msg, Request) and msg.expired:
+                self.expired += 1
+                late = -msg.remaining
+                warn(
+                    f"Dropping {hl_method(msg.method)} Request from {self!r}:"
+                    f" Deadline passed {late:.3f}s ago."
+                )
+                data[msg] = Error.expired(f"Deadline passed {late:.3f}s ago.")
+
+            elif (
+                isinstance(msg, Request)
+                and self.cancelled
+                and msg.id in self.cancelled
+            ):
+                del self.cancelled[msg.id]
+                echo("info", f"Dropping cancelled Request {msg.id} from {self}.")
+
+            else:
+                data[msg] = self.process_message(msg)
+
+        return data
+
+    def lane(self, method: str) -> int:
+        """Find the Lane in which Messages of a given Method should wait."""
+        return self.priorities.get(method, Lane.NORMAL)
+
+    def enable_cache(self, cacheable: Dict[str, Optional[float]], size: int) -> None:
+        """Start caching the Results of Requests to the given Methods, each for
+            its respective TTL in seconds. The Remote must send ``CACHE.DROP``
+            when Results change before then.
+        """
+        self.cacheable = dict(cacheable)
+        self.rcache = ResultCache(None, size) if cacheable and size > 0 else None
+
+    def enable_batching(
+        self,
+        delay: Optional[float] = 0,
+        size: int = BATCH_MAX,
+        nbytes: int = BATCH_BYTES,
+    ) -> None:
+        """Start packing outbound Messages into Batches. Each time the Outbox is
+            written out, the Writer first waits ``delay`` seconds, or for one
+            tick of the Event Loop if this is zero, for more Messages to arrive.
+            Then, up to ``size`` Messages from the same Lane, totalling up to
+            ``nbytes`` Characters, are sent together in one Frame.
+
+        Note that the Remote is likely to answer a Batch of Requests with one
+            Batch of Responses, once all of them are done. A Delay of None turns
+            batching off again.
+        """
+        if size < 1:
+            raise ValueError("A Batch must be able to hold at least one Message.")
+
+        self.batch_delay = delay
+        self.batch_max = size
+        self.batch_bytes = nbytes
+
+    def _cache_fill(self, key, generation: int, future: Future) -> None:
+        """Callback for the Future of a cacheable Request."""
+        if (
+            self.rcache is not None
+            and self.rcache.generation == generation
+            and not (future.cancelled() or future.exception())
+        ):
+            self.rcache.put(key, future.result(), self.cacheable.get(key[0]))
 
     async def enable_rsa(self) -> bool:
         if not self.connection.can_encrypt:
@@ -247,6 +560,12 @@ class Remote:
                     # We need to fulfill this Future now.
                     echo("recv", f"Receiving a Response from {self}.")
 
+                    stream = self.streams.get(msg.id)
+                    if stream is not None:
+                        # Tell the Stream how many parts to expect, if this is
+                        #   the end of one, before it sees the Future done.
+                        stream.end(msg.parts)
+
                     if msg.error:
                         # Server sent an Error Response. Forward it to the Future.
                         future.set_exception(msg.error.as_exception())
@@ -318,28 +637,56 @@ class Remote:
         #             msg, error=Error.invalid_request(list(dict(msg).keys()))
         #         )
 
-    def hook_notif(self, method: str):
+    def hook_notif(self, method: str, *, priority: int = None, **options):
         """Signal to the Remote that `func` is waiting for Notifications of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Notification, and the second is the Remote.
+            of the Notification, and the second is the Remote. It may also take a
+            third, the Notification itself.
+
+        If ``priority`` is given, Messages of the Method will be queued in that
+            Lane. Other Keyword Options, such as ``executor`` and ``bulkhead``,
+            are passed through to ``notif_handler()``.
         """
-        return notif_handler(self.hooks_notif, method)
+        if priority is not None:
+            self.priorities[method] = priority
+        return notif_handler(self.hooks_notif, method, **options)
 
-    def hook_request(self, method: str) -> Callable:
+    def hook_request(
+        self, method: str, *, priority: int = None, **options
+    ) -> Callable:
         """Signal to the Remote that `func` is waiting for Requests of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Request, and the second is the Remote.
+            of the Request, and the second is the Remote. It may also take a
+            third, the Request itself.
+
+        If ``priority`` is given, Messages of the Method will be queued in that
+            Lane. Other Keyword Options, such as ``executor`` and ``bulkhead``,
+            are passed through to ``request_handler()``.
         """
-        return request_handler(self.hooks_request, method)
+        if priority is not None:
+            self.priorities[method] = priority
+        return request_handler(self.hooks_request, method, **options)
 
     def close(self) -> None:
         self.total_recv["byte"] = self.connection.total_recv
         self.total_sent["byte"] = self.connection.total_sent
+        self.total_recv["frame"] = self.connection.frames_recv
+        self.total_sent["frame"] = self.connection.frames_sent
         self.connection.close()
+        self.futures.fail_all("Connection closed.")
+
+        if self.writer is not None:
+            self.writer.cancel()
+        while self.outbox:
+            # Nothing more will be written. Let the senders know.
+            _, sent = self.outbox.pop()
+            if not sent.done():
+                sent.set_exception(ConnectionResetError("Connection closed."))
+        self.queued = 0
 
         if self.group is not None and self in self.group:
             # Remove self from Client Set, if possible.
@@ -355,11 +702,10 @@ class Remote:
                 Then, when the Processing Coroutine finishes, Gather and Await
                 all the Tasks, if any, that have since accrued.
             """
-            while line := await self.lines.get():
+            while item := await self.lines.get():
+                received, line = item
                 try:
-                    data = {
-                        msg: self.process_message(msg) for msg in (JRPC.decode(line))
-                    }
+                    data = self._screen(JRPC.decode(line, received))
 
                 except JSONDecodeError as e:
                     warn(f"Invalid JSON received from {self!r}.")
@@ -392,6 +738,11 @@ class Remote:
                             #   the Batch.
                             responses.append(tsk)
 
+                        elif isinstance(tsk, Error):
+                            # If it returned an Error, send it back as-is.
+                            if isinstance(recv, Request):
+                                responses.append(recv.response(error=tsk))
+
                         elif isinstance(tsk, (dict, list, tuple)):
                             # If the Processor returned something that can be
                             #   made into a Response, do it and add it.
@@ -410,6 +761,16 @@ class Remote:
                             # If it can be Awaited, add it as a Task.
                             tasks[recv] = tsk
 
+                        elif (
+                            isinstance(tsk, (AsyncGenerator, Generator))
+                            and isinstance(recv, Request)
+                            and recv.stream
+                        ):
+                            # The Remote asked for every value to be sent. The
+                            #   Stream will send its own Response when it ends.
+                            self._stream_out(recv, tsk)
+                            data[recv] = None
+
                         elif isinstance(tsk, AsyncGenerator):
                             # If it is an Async Generator, this means that the
                             #   Processor will Yield something, and then it has
@@ -420,8 +781,8 @@ class Remote:
                         elif isinstance(tsk, Generator):
                             # If it is a Sync Generator, same deal; However, it
                             #   must be wrapped in a Task first.
-                            async def _n():
-                                return next(tsk)
+                            async def _n(gen: Generator = tsk):
+                                return next(gen)
 
                             tasks[recv] = _n()
 
@@ -431,6 +792,13 @@ class Remote:
                                 recv.response(result=[] if tsk is None else [tsk])
                             )
 
+                    for recv, tsk in tasks.items():
+                        # Wrap everything in a Task, so that the Handlers of
+                        #   Requests can be found and cancelled by the Remote.
+                        tasks[recv] = tsk = ensure_future(tsk, loop=self.eventloop)
+                        if isinstance(recv, Request):
+                            self.inflight[recv.id] = tsk
+
                     # Gather and Await all the Tasks.
                     finals = dict(
                         zip(
@@ -441,10 +809,22 @@ class Remote:
 
                     for recv, ret in finals.items():
                         # Add the Responses of the Tasks to the Batch.
-                        if isinstance(ret, Response):
+                        if isinstance(recv, Request):
+                            self.inflight.pop(recv.id, None)
+
+                        if isinstance(ret, CancelledError):
+                            # The Remote no longer wants a Response.
+                            continue
+
+                        elif isinstance(ret, Response):
                             # All native Responses are added directly.
                             responses.append(ret)
 
+                        elif isinstance(ret, Error):
+                            # Errors are sent back as-is.
+                            if isinstance(recv, Request):
+                                responses.append(recv.response(error=ret))
+
                         elif isinstance(ret, (dict, list, tuple)):
                             # Structures are wrapped and Added...IF the original
                             #   Message was a Request.
@@ -466,7 +846,19 @@ class Remote:
 
                     # # # SEND THE BATCH # # #
                     if responses:
-                        await self.send_batch(responses)
+                        # The Responses are as urgent as the most urgent of the
+                        #   Requests they answer.
+                        await self.send_batch(
+                            responses,
+                            min(
+                                (
+                                    self.lane(recv.method)
+                                    for recv in data
+                                    if isinstance(recv, Request)
+                                ),
+                                default=Lane.NORMAL,
+                            ),
+                        )
                     # # # ============== # # #
 
                     # Now, handle any Cleanup required by Generators.
@@ -530,9 +922,13 @@ class Remote:
                 if isinstance(item, Exception):
                     # If we received an Exception, the Decryption failed.
                     warn(f"Decryption from {self!r} failed:", item)
+                elif peek_method(item) == "RPC.CANCEL" and self._cancel_now(item):
+                    # Cancellations cannot wait for a Helper, since the Helpers
+                    #   may all be busy with the very Requests being cancelled.
+                    pass
                 else:
-                    # Otherwise, add it to the Queue.
-                    await self.lines.put(item)
+                    # Otherwise, add it to the Queue, noting when it arrived.
+                    await self.lines.put((monotonic(), item))
 
                 # Double check that we are still listening.
                 if helper_runner.done():
@@ -580,12 +976,7 @@ class Remote:
 
         try:
             self.total_sent["notif"] += 1
-            if isinstance(params, dict):
-                await self.send(Notification(meth, **params))
-            elif isinstance(params, (list, tuple)):
-                await self.send(Notification(meth, *params))
-            else:
-                await self.send(Notification(meth))
+            await self.send(compose(Notification, meth, params))
         except Exception as e:
             err_("Failed to send Notification:", e)
             if nohandle:
@@ -600,6 +991,7 @@ class Remote:
         callback: Callable = None,
         nohandle: bool = False,
         quiet: bool = False,
+        shared: bool = None,
     ) -> Future:
         ...
 
@@ -612,6 +1004,7 @@ class Remote:
         callback: Callable = None,
         nohandle: bool = False,
         quiet: bool = False,
+        shared: bool = None,
         timeout: float,
     ) -> Union[dict, list]:
         ...
@@ -624,13 +1017,53 @@ class Remote:
         callback: Callable = None,
         nohandle: bool = False,
         quiet: bool = False,
+        shared: bool = None,
         timeout: float = 0,
     ) -> Union[Union[dict, list], Future]:
         """Assemble a JSON-RPC Request with the given data. Send the Request,
             and return a Future to represent the eventual result.
+
+        If a ``timeout`` is given, the Result itself is awaited and returned
+            instead, and the Request carries the timeout as its Budget, so that
+            the Remote can drop it if it cannot be answered in time.
+
+        If ``shared`` is True, or is not given and ``singleflight`` is set, an
+            identical Request which is already waiting for its Response is not
+            sent again. Instead, this call waits for the same Response. Every
+            caller still gets its own Future, and cancelling one does not affect
+            the others; The Request on the wire is only cancelled when all of
+            them have given up.
         """
         # Create a Future which will represent the Response.
         future: Future = self.eventloop.create_future()
+        if shared is None:
+            shared = self.singleflight
+
+        if self.rcache is not None and meth in self.cacheable:
+            key = cache_key(meth, params)
+            cached = self.rcache.get(key)
+
+            if cached is not MISSING:
+                # The Remote has already answered this, and has not said that
+                #   the answer has changed. Skip the round trip.
+                future.set_result(cached)
+                if callback:
+                    future.add_done_callback(partial(callback, remote=self))
+                return cached if timeout > 0 else future
+
+            future.add_done_callback(
+                partial(self._cache_fill, key, self.rcache.generation)
+            )
+
+        if shared:
+            flight = cache_key(meth, params)
+            mine = self.flights.follow(flight)
+
+            if mine is not None:
+                # The same Request is already on the wire. Wait for its answer.
+                if callback:
+                    mine.add_done_callback(partial(callback, remote=self))
+                return await wait_for(mine, timeout) if timeout > 0 else mine
 
         if not self.open:
             future.set_exception(ConnectionResetError)
@@ -640,14 +1073,24 @@ class Remote:
             echo("send", f"Sending {hl_method(meth)} Request to {self}.")
         self.total_sent["request"] += 1
 
-        if isinstance(params, dict):
-            req = Request(meth, **params, mid=self._id_new())
-        elif isinstance(params, (list, tuple)):
-            req = Request(meth, *params, mid=self._id_new())
+        req = compose(Request, meth, params, mid=self._id_new())
+
+        if shared:
+            # Other callers may join this Request with their own timeouts, so
+            #   it cannot carry ours. The Future on the wire is only cancelled
+            #   once every caller has gone; Each caller waits on its own.
+            self.futures.add(req.id, future)
+            future.add_done_callback(partial(self._abandon, req.id))
+            future = self.flights.lead(flight, future)
+
         else:
-            req = Request(meth, mid=self._id_new())
+            if timeout > 0:
+                # Tell the Remote how long we will wait, so that it does not
+                #   bother to answer after we have given up.
+                req.set_budget(timeout)
 
-        self.futures[req.id] = future
+            self.futures.add(req.id, future, timeout)
+            future.add_done_callback(partial(self._abandon, req.id))
 
         if callback:
             cb = partial(callback, remote=self)
@@ -666,6 +1109,191 @@ class Remote:
             else:
                 return future
 
+    def prepare(
+        self, meth: str, *, lane: int = None, nohandle: bool = False
+    ) -> PreparedRequest:
+        """Prepare Requests for a Method which will be called many times. The
+            Callable returned takes the Parameters of a Request, and optionally
+            a ``timeout``, just as ``request()`` does, but sends each Request
+            with much less work, and without logging it.
+
+        :param str meth: The Method to be requested.
+        :param int lane: The Lane in which the Requests will wait to be sent. If
+            this is not supplied, the Lane of the Method is found now.
+        :param bool nohandle: If this is True, an Exception raised while sending
+            is raised, rather than only logged.
+        """
+        return PreparedRequest(
+            self, meth, self.lane(meth) if lane is None else lane, nohandle
+        )
+
+    async def request_stream(
+        self,
+        meth: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        window: int = WINDOW_DEFAULT,
+        quiet: bool = False,
+        timeout: float = 0,
+    ) -> ResponseStream:
+        """Assemble a JSON-RPC Request with the given data, asking for it to be
+            answered as a Stream, and send it. Return an Async Iterator over the
+            values produced by the Handler of the Remote. If the Handler does
+            not stream, its Result is the only value.
+
+        The Remote will send no more than ``window`` values ahead of what has
+            been read. If a ``timeout`` is given, the Stream fails if no value
+            is received for that many seconds. The Request is cancelled if the
+            Stream is closed before it ends.
+        """
+        future: Future = self.eventloop.create_future()
+        req = compose(Request, meth, params, mid=self._id_new())
+        req.set_stream(window)
+
+        stream = ResponseStream(
+            future,
+            window,
+            lambda count: self.eventloop.create_task(
+                self.notif("RPC.MORE", [req.id, count], quiet=True)
+            ),
+            timeout,
+        )
+
+        if not self.open:
+            future.set_exception(ConnectionResetError)
+            return stream
+
+        if not quiet:
+            echo("send", f"Sending {hl_method(meth)} Stream Request to {self}.")
+        self.total_sent["request"] += 1
+
+        self.streams[req.id] = stream
+        self.futures.add(req.id, future, timeout)
+        future.add_done_callback(partial(self._abandon, req.id))
+        future.add_done_callback(partial(self._forget_stream, req.id))
+
+        try:
+            await self.send(req)
+        except Exception as e:
+            err_("Failed to send Request:", e)
+            if not future.done():
+                future.set_exception(e)
+
+        return stream
+
+    async def notif_many(
+        self,
+        calls: Iterable[Tuple[str, Union[dict, list, tuple, None]]],
+        *,
+        nohandle: bool = False,
+        quiet: bool = False,
+    ) -> None:
+        """Assemble a JSON-RPC Notification for each pair of a Method and its
+            Parameters, and send all of them together, in one Batch.
+        """
+        if not self.open:
+            return
+
+        batch = Batch(
+            *(compose(Notification, meth, params) for meth, params in calls)
+        )
+
+        if not quiet:
+            echo("send", f"Sending {len(batch)} Notifications to {self}.")
+
+        try:
+            self.total_sent["notif"] += len(batch)
+            await self._write_many(
+                list(map(bytes, batch)),
+                min((self.lane(n.method) for n in batch), default=Lane.NORMAL),
+            )
+        except Exception as e:
+            err_("Failed to send Notifications:", e)
+            if nohandle:
+                raise e
+
+    async def request_many(
+        self,
+        calls: Iterable[Tuple[str, Union[dict, list, tuple, None]]],
+        *,
+        nohandle: bool = False,
+        quiet: bool = False,
+        timeout: float = 0,
+    ) -> List[Future]:
+        """Assemble a JSON-RPC Request for each pair of a Method and its
+            Parameters, and send all of them together, in one Batch. Return a
+            List of Futures for their Results, in the same order.
+
+        This is much cheaper than calling ``request()`` in a loop: The Requests
+            are packed into as few Frames as possible, each no larger than
+            ``batch_bytes``, and the Futures are added to the Table of Pending
+            Requests at once. However, it does not look in
+            the Cache, or share Requests already in flight.
+
+        If a ``timeout`` is given, each Request carries it as its Budget, and
+            each Future fails with a ``TimeoutError`` if it is not answered in
+            time. Unlike with ``request()``, the Futures are still returned.
+        """
+        batch = Batch()
+        mids = set()
+
+        for meth, params in calls:
+            # The new IDs are not in the Table yet, so they must also be kept
+            #   apart from each other.
+            mids.add(mid := self._id_new(mids))
+            batch.append(compose(Request, meth, params, mid=mid))
+
+        futures: List[Future] = [self.eventloop.create_future() for _ in batch]
+
+        if not self.open:
+            for future in futures:
+                future.set_exception(ConnectionResetError)
+            return futures
+
+        if not quiet:
+            echo("send", f"Sending {len(batch)} Requests to {self}.")
+        self.total_sent["request"] += len(batch)
+
+        for req, future in zip(batch, futures):
+            if timeout > 0:
+                req.set_budget(timeout)
+            future.add_done_callback(partial(self._abandon, req.id))
+
+        self.futures.add_many(((req.id, f) for req, f in zip(batch, futures)), timeout)
+
+        try:
+            await self._write_many(
+                list(map(bytes, batch)),
+                min((self.lane(r.method) for r in batch), default=Lane.NORMAL),
+            )
+        except Exception as e:
+            err_("Failed to send Requests:", e)
+            if nohandle:
+                raise e
+
+        return futures
+
+    async def request_each(
+        self,
+        calls: Iterable[Tuple[str, Union[dict, list, tuple, None]]],
+        **kw,
+    ) -> AsyncIterator[Tuple[int, Future]]:
+        """Send Requests as ``request_many()`` does, and then yield each Future,
+            along with its Index in ``calls``, as soon as it is done.
+
+        Note that a Remote may answer a whole Batch of Requests at once, so the
+            Futures of Requests that shared a Frame may all be done together.
+        """
+        futures = await self.request_many(calls, **kw)
+        done: Queue = Queue()
+
+        for i, future in enumerate(futures):
+            future.add_done_callback(partial(lambda i_, _: done.put_nowait(i_), i))
+
+        for _ in futures:
+            i = await done.get()
+            yield i, futures[i]
+
     async def respond(
         self,
         mid: Optional[str],
@@ -695,15 +1323,152 @@ class Remote:
                 if nohandle:
                     raise e
 
-    async def send(self, msg: Message) -> int:
+    async def _flush(self) -> None:
+        """Write out everything waiting in the Outbox, most urgent first."""
+        while self.outbox:
+            if self.batch_delay is None:
+                items = [self.outbox.pop()]
+            else:
+                if len(self.outbox) < self.batch_max:
+                    # Give other senders a chance to add to the Batch.
+                    await sleep(self.batch_delay)
+                    if not self.outbox:
+                        break
+                items = self.outbox.pop_many(
+                    self.batch_max, self.batch_bytes, lambda item: len(item[0])
+                )
+            self.queued -= sum(len(text) for text, _ in items)
+
+            # Skip anything that the sender has given up on.
+            items = [(text, sent) for text, sent in items if not sent.done()]
+
+            # Text which has not been decoded may not be valid JSON, so it gets a
+            #   Frame to itself.
+            frames: List[Tuple[bytes, List[Future]]] = [
+                (text, [sent]) for text, sent in items if isinstance(text, Raw)
+            ]
+            items = [item for item in items if not isinstance(item[0], Raw)]
+
+            if len(items) == 1:
+                frames.append((items[0][0], [items[0][1]]))
+            elif items:
+                # Unwrap any Batches, and wrap everything in one new Batch.
+                text = b",".join(
+                    part
+                    for part in (
+                        text[1:-1] if text[:1] == b"[" else text for text, _ in items
+                    )
+                    if part
+                )
+                frames.append((b"[" + text + b"]", [sent for _, sent in items]))
+
+            for i, (text, waiting) in enumerate(frames):
+                try:
+                    count = await self.connection.write(text)
+                except Exception as e:
+                    for sent in waiting:
+                        if not sent.done():
+                            sent.set_exception(e)
+                except BaseException:
+                    # Cancelled by ``close()``. This Frame, and those after it,
+                    #   will never be written. Let their senders know.
+                    for _, rest in frames[i:]:
+                        for sent in rest:
+                            if not sent.done():
+                                sent.set_exception(
+                                    ConnectionResetError("Connection closed.")
+                                )
+                    raise
+                else:
+                    for sent in waiting:
+                        if not sent.done():
+                            sent.set_result(count)
+
+    async def _write(self, text: bytes, lane: int) -> int:
+        """Put text into the Outbox, make sure that something is writing out the
+            Outbox, and wait for the text to be written.
+        """
+        sent: Future = self.eventloop.create_future()
+        self.outbox.push(lane, (text, sent))
+        self.queued += len(text)
+
+        if self.writer is None or self.writer.done():
+            self.writer = self.eventloop.create_task(self._flush())
+
+        return await sent
+
+    async def _write_many(self, texts: List[bytes], lane: int) -> int:
+        """Pack the texts of many Messages into as few Batches as will fit into
+            Frames of ``batch_bytes``, and write all of them.
+        """
+        if not texts:
+            return 0
+
+        frames: List[List[bytes]] = [[]]
+        size: int = 0
+
+        for text in texts:
+            if frames[-1] and size + len(text) >= self.batch_bytes:
+                frames.append([])
+                size = 0
+            frames[-1].append(text)
+            size += len(text) + 1
+
+        writes = [self._write(b"[" + b",".join(frame) + b"]", lane) for frame in frames]
+        return sum(await gather(*writes))
+
+    async def send(self, msg: Message, lane: int = None) -> int:
+        if self.open:
+            if lane is None:
+                lane = self.lane(getattr(msg, "method", None))
+            return await self._write(bytes(msg), lane)
+        else:
+            return 0
+
+    async def forward(self, msg: Message, *, timeout: float = 0) -> Any:
+        """Send a Notification or Request which came from somewhere else, such
+            as another Remote. A ``LazyMessage`` is sent as the same text that it
+            arrived as, without being decoded.
+
+        The Response to a Request is matched to it by its own ID, which must not
+            already be in use here. A Future is returned, or the Result itself
+            if ``timeout`` is given.
+        """
+        if msg.mtype is not JRPC.REQUEST:
+            self.total_sent["notif"] += 1
+            await self.send(msg)
+            return None
+
+        if msg.id in self.futures:
+            raise ValueError(f"Request ID {msg.id!r} is already in use.")
+
+        future: Future = self.eventloop.create_future()
+        if not self.open:
+            future.set_exception(ConnectionResetError)
+            return future
+
+        self.total_sent["request"] += 1
+        self.futures.add(msg.id, future, timeout)
+        future.add_done_callback(partial(self._abandon, msg.id))
+
+        await self.send(msg)
+        return await wait_for(future, timeout) if timeout > 0 else future
+
+    async def send_text(self, text: Union[bytes, str], lane: int = Lane.NORMAL) -> int:
+        """Send a Message which has already been serialized. This allows the
+            same text to be sent to many Remotes without encoding it for each.
+            It should be given as UTF-8 Bytes, as from ``bytes(message)``.
+        """
         if self.open:
-            return await self.connection.write(str(msg))
+            if isinstance(text, str):
+                text = text.encode()
+            return await self._write(text, lane)
         else:
             return 0
 
-    async def send_batch(self, batch: Batch) -> int:
+    async def send_batch(self, batch: Batch, lane: int = Lane.NORMAL) -> int:
         if batch and self.open:
-            return await self.connection.write(batch.json())
+            return await self._write(bytes(batch), lane)
         else:
             return 0
 
@@ -0,0 +1,261 @@
+"""Module providing Admission Control for Hooks.
+
+A Bulkhead bounds the number of calls to a Hook, or to a group of Hooks, which
+    may be running at the same time, and the number which may wait for a turn.
+    Anything arriving beyond that is turned away immediately, so that a flood
+    of one expensive Method cannot starve every other Method of the Server.
+
+A Bulkhead may be shared by Hooks running on the Event Loops of several Threads,
+    as in a Server with Shards. Its counts are kept under a Lock, and a place
+    freed on one Loop is handed to a call waiting on another through the Loop
+    of that call.
+
+A Hook which is a Generator keeps its place for as long as it is producing
+    values, not only until it returns the Generator. Its Generator is wrapped
+    in a ``Held``, which gives the place up when the Generator is exhausted,
+    fails, or is closed.
+"""
+
+from asyncio import CancelledError, Future, get_running_loop
+from collections import deque
+from collections.abc import AsyncGenerator
+from inspect import isawaitable
+from threading import RLock
+from typing import Any, Callable, Deque, Dict, Generator, Union
+
+
+class Bulkhead:
+    """A limit on concurrent executions, with a bounded waiting line.
+
+    :param int limit: The number of calls which may run at the same time.
+    :param int queue: The number of calls which may wait for a running call to
+        finish. When this many are already waiting, further calls are rejected.
+    :param str name: A label for the Bulkhead, used in Statistics. Typically
+        the Method, or the Namespace of the Methods, that it protects.
+    """
+
+    __slots__ = (
+        "name",
+        "limit",
+        "queue",
+        "active",
+        "waiters",
+        "admitted",
+        "queued",
+        "rejected",
+        "wait_total",
+        "lock",
+    )
+
+    def __init__(self, limit: int, queue: int = 0, name: str = ""):
+        if limit < 1:
+            raise ValueError("A Bulkhead must admit at least one call.")
+        if queue < 0:
+            raise ValueError("A Bulkhead cannot have a negative queue.")
+
+        self.name: str = name
+        self.limit: int = limit
+        self.queue: int = queue
+
+        self.active: int = 0
+        self.waiters: Deque[Future] = deque()
+
+        self.admitted: int = 0
+        self.queued: int = 0
+        self.rejected: int = 0
+        self.wait_total: float = 0.0
+        self.lock: RLock = RLock()
+
+    @property
+    def waiting(self) -> int:
+        with self.lock:
+            return sum(1 for w in self.waiters if not w.done())
+
+    def __repr__(self) -> str:
+        return (
+            f"<Bulkhead {self.name!r}: {self.active}/{self.limit} active,"
+            f" {self.waiting}/{self.queue} waiting>"
+        )
+
+    def admit(self) -> Union[bool, Future]:
+        """Try to claim a place for a call. This must be done synchronously, at
+            the moment the call arrives, so that the limits hold exactly.
+
+        :return: True if the call may run immediately; A Future which will be
+            fulfilled when the call may run, if it must wait; False if the call
+            has been rejected.
+        :rtype: Union[bool, Future]
+        """
+        with self.lock:
+            if self.active < self.limit:
+                self.active += 1
+                self.admitted += 1
+                return True
+
+            elif self.waiting < self.queue:
+                ticket: Future = get_running_loop().create_future()
+                self.waiters.append(ticket)
+                self.queued += 1
+                return ticket
+
+            else:
+                self.rejected += 1
+                return False
+
+    def release(self) -> None:
+        """Give up a place. If anything is waiting, the place is handed directly
+            to the oldest waiting call.
+        """
+        with self.lock:
+            while self.waiters:
+                ticket = self.waiters.popleft()
+                if ticket.done():
+                    continue
+
+                loop = ticket.get_loop()
+                if loop is get_running_loop():
+                    ticket.set_result(None)
+                else:
+                    # The call is waiting on the Loop of another Thread.
+                    loop.call_soon_threadsafe(self._hand_over, ticket)
+                return
+
+            self.active -= 1
+
+    def _hand_over(self, ticket: Future) -> None:
+        if ticket.done():
+            # The call gave up before the place reached it. Pass it on.
+            self.release()
+        else:
+            ticket.set_result(None)
+
+    async def run(self, ticket: Union[bool, Future], func: Callable, *args) -> Any:
+        """Wait for the place claimed by ``admit()``, if necessary, and then
+            call a Function, awaiting its Return if needed. The place is given
+            up when the Function finishes.
+        """
+        if isinstance(ticket, Future):
+            try:
+                await self._wait(ticket)
+            except CancelledError:
+                if not ticket.cancelled():
+                    # The place was handed over just before the cancellation.
+                    self.release()
+                raise
+
+        try:
+            ret = func(*args)
+            if isawaitable(ret):
+                ret = await ret
+            return ret
+        finally:
+            self.release()
+
+    def hold(
+        self, ticket: Union[bool, Future], gen: Union[AsyncGenerator, Generator]
+    ) -> "Held":
+        """Wait for the place claimed by ``admit()``, if necessary, and then run
+            a Generator. The place is given up when the Generator ends.
+        """
+        return Held(self, ticket, self._drain(ticket, gen))
+
+    async def _wait(self, ticket: Future) -> None:
+        loop = get_running_loop()
+        start = loop.time()
+        await ticket
+
+        with self.lock:
+            self.wait_total += loop.time() - start
+            self.admitted += 1
+
+    async def _drain(
+        self, ticket: Union[bool, Future], gen: Union[AsyncGenerator, Generator]
+    ):
+        if isinstance(ticket, Future):
+            await self._wait(ticket)
+
+        try:
+            if isinstance(gen, AsyncGenerator):
+                async for value in gen:
+                    yield value
+            else:
+                for value in gen:
+                    yield value
+        finally:
+            if isinstance(gen, AsyncGenerator):
+                await gen.aclose()
+            else:
+                gen.close()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "limit": self.limit,
+            "queue": self.queue,
+            "active": self.active,
+            "waiting": self.waiting,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+            "wait_mean": self.wait_total / self.queued if self.queued else 0.0,
+        }
+
+
+class Held(AsyncGenerator):
+    """An Async Generator which keeps a place in a Bulkhead for as long as it
+        runs. The place is given up when it ends in any way, even if it is
+        closed before it starts.
+
+    :param Bulkhead bulkhead: The Bulkhead in which the place was claimed.
+    :param ticket: The Return of ``Bulkhead.admit()`` which claimed it.
+    :param AsyncGenerator gen: The Generator to run.
+    """
+
+    __slots__ = ("bulkhead", "gen", "held", "ticket")
+
+    def __init__(
+        self, bulkhead: Bulkhead, ticket: Union[bool, Future], gen: AsyncGenerator
+    ):
+        self.bulkhead: Bulkhead = bulkhead
+        self.gen: AsyncGenerator = gen
+        self.held: bool = True
+        self.ticket: Union[bool, Future] = ticket
+
+    def _let_go(self) -> None:
+        if not self.held:
+            return
+        self.held = False
+
+        ticket = self.ticket
+        if isinstance(ticket, Future):
+            if not ticket.done():
+                # The place has not reached this call yet. It will be passed on
+                #   to the next instead.
+                ticket.cancel()
+                return
+            elif ticket.cancelled():
+                return
+
+        self.bulkhead.release()
+
+    async def asend(self, value: Any) -> Any:
+        try:
+            return await self.gen.asend(value)
+        except BaseException:
+            self._let_go()
+            raise
+
+    async def athrow(self, typ, val=None, tb=None) -> Any:
+        try:
+            if val is None and tb is None:
+                return await self.gen.athrow(typ)
+            else:
+                return await self.gen.athrow(typ, val, tb)
+        except BaseException:
+            self._let_go()
+            raise
+
+    async def aclose(self) -> None:
+        try:
+            await self.gen.aclose()
+        finally:
+            self._let_go()
@@ -0,0 +1,176 @@
+"""Module providing a Cache for the Results of idempotent Methods.
+
+Results are keyed by the Method and the canonical JSON form of the Parameters,
+    so that Parameters which differ only in the order of their keys share an
+    entry. Entries expire after a fixed time, and the least recently used entry
+    is evicted whenever the Cache is full.
+
+The same Cache is used on both ends of a Connection. A Server caches the Results
+    of its own Hooks, and tells each Client during ``ETC.INIT`` which Methods
+    are cacheable, and for how long. The Client then keeps Responses to those
+    Methods, and drops them when the Server sends a ``CACHE.DROP`` Notification.
+
+A Cache may be shared by Remotes on the Event Loops of several Threads, as in a
+    Server with Shards, so every change to it is made under a Lock.
+"""
+
+from collections import OrderedDict
+from inspect import isawaitable
+from json import dumps
+from threading import Lock
+from time import monotonic
+from typing import Any, AsyncGenerator, Awaitable, Dict, Generator, Hashable, Tuple
+
+from .protocol import Error, ParamsRPC, Response
+
+
+MISSING = object()
+CacheKey = Tuple[str, str]
+
+
+def cache_key(method: str, params: ParamsRPC) -> CacheKey:
+    if params is None:
+        params = []
+    elif isinstance(params, tuple):
+        params = list(params)
+    return method, dumps(params, sort_keys=True, separators=(",", ":"))
+
+
+def cacheable(value: Any) -> bool:
+    """Determine whether the Return of a Hook is a Result which may be cached,
+        rather than a failure or something yet to be finished.
+    """
+    return not (
+        isinstance(value, (BaseException, Error, Response, AsyncGenerator, Generator))
+        or isawaitable(value)
+    )
+
+
+class ResultCache:
+    """A bounded LRU Mapping of Requests to Results, with a time to live.
+
+    :param float ttl: The number of seconds for which an entry is valid. If
+        this is None, entries are valid until they are evicted or invalidated.
+    :param int maxsize: The greatest number of entries to keep.
+    """
+
+    __slots__ = (
+        "entries",
+        "evictions",
+        "generation",
+        "hits",
+        "lock",
+        "maxsize",
+        "misses",
+        "ttl",
+    )
+
+    def __init__(self, ttl: float = None, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("A Cache must be able to hold at least one entry.")
+
+        self.ttl: float = ttl
+        self.maxsize: int = maxsize
+        self.entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.lock: Lock = Lock()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        # Incremented by every Invalidation. A Result which was requested in an
+        #   earlier Generation may already be stale, and should not be stored.
+        self.generation: int = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __repr__(self) -> str:
+        return f"<ResultCache: {len(self)}/{self.maxsize}, ttl={self.ttl}>"
+
+    def get(self, key: Hashable) -> Any:
+        """Return the Result stored for a key, or ``MISSING``."""
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is not None:
+                expires, value = entry
+                if expires >= monotonic():
+                    self.hits += 1
+                    self.entries.move_to_end(key)
+                    return value
+                else:
+                    del self.entries[key]
+
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: Hashable, value: Any, ttl: float = MISSING) -> None:
+        """Store a Result, to be kept for ``ttl`` seconds, or for the default
+            TTL of the Cache if not specified. A TTL of None keeps the Result
+            until it is evicted or invalidated.
+        """
+        if ttl is MISSING:
+            ttl = self.ttl
+        expires = float("inf") if ttl is None else monotonic() + ttl
+
+        with self.lock:
+            self.entries[key] = (expires, value)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def fill(self, key: Hashable, ret: Any) -> Any:
+        """Store the Return of a Hook, if it is a Result, and pass it on. If it
+            is Awaitable, return a Coroutine which will store it when it is
+            ready.
+        """
+        if isawaitable(ret):
+            return self._fill_later(key, ret, self.generation)
+        elif cacheable(ret):
+            self.put(key, ret)
+        return ret
+
+    async def _fill_later(self, key: Hashable, ret: Awaitable, generation: int) -> Any:
+        ret = await ret
+        if cacheable(ret) and generation == self.generation:
+            self.put(key, ret)
+        return ret
+
+    def invalidate(self, method: str = None, params: ParamsRPC = MISSING) -> int:
+        """Remove entries from the Cache, and return how many were removed.
+
+        :param str method: The Method whose entries should be removed. If this
+            is not supplied, every entry is removed.
+        :param ParamsRPC params: The Parameters of the single entry which should
+            be removed. If this is not supplied, every entry of ``method`` is
+            removed.
+        """
+        with self.lock:
+            self.generation += 1
+
+            if method is None:
+                count = len(self.entries)
+                self.entries.clear()
+
+            elif params is not MISSING:
+                key = cache_key(method, params)
+                count = int(self.entries.pop(key, None) is not None)
+
+            else:
+                stale = [key for key in self.entries if key[0] == method]
+                for key in stale:
+                    del self.entries[key]
+                count = len(stale)
+
+        return count
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
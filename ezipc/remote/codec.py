@@ -0,0 +1,59 @@
+"""Module providing the JSON Codec used for every Message.
+
+The fastest JSON Library available is chosen when the Package is imported. If
+    ``orjson`` is installed, it is used; Otherwise, the Standard Library is.
+    Either way, Messages are encoded straight to UTF-8 Bytes, which is what is
+    written to the Connection, and Bytes can be decoded without first being
+    turned into a String.
+
+Anything which ``orjson`` refuses to encode, such as an Integer too large for
+    64 bits, is encoded by the Standard Library instead, so the choice of
+    Backend never changes what can be sent.
+"""
+
+from json import dumps as std_dumps, loads as std_loads
+from typing import Any, Union
+
+try:
+    # noinspection PyPackageRequirements
+    import orjson
+except ImportError:
+    orjson = None
+
+
+JSON_OPTS = {"separators": (",", ":")}
+
+
+if orjson is not None:
+    BACKEND: str = f"orjson {orjson.__version__}"
+
+    _opts: int = orjson.OPT_NON_STR_KEYS
+
+    def dumpb(obj: Any) -> bytes:
+        """Encode an Object as compact JSON, in UTF-8 Bytes."""
+        try:
+            return orjson.dumps(obj, option=_opts)
+        except TypeError:
+            return std_dumps(obj, **JSON_OPTS).encode()
+
+    def dumps(obj: Any) -> str:
+        """Encode an Object as compact JSON, in a String."""
+        return dumpb(obj).decode()
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Decode JSON from either Bytes or a String."""
+        return orjson.loads(data)
+
+
+else:
+    BACKEND: str = "json (Standard Library)"
+
+    def dumpb(obj: Any) -> bytes:
+        """Encode an Object as compact JSON, in UTF-8 Bytes."""
+        return std_dumps(obj, **JSON_OPTS).encode()
+
+    def dumps(obj: Any) -> str:
+        """Encode an Object as compact JSON, in a String."""
+        return std_dumps(obj, **JSON_OPTS)
+
+    loads = std_loads
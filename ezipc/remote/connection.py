@@ -52,6 +52,8 @@ class Connection:
         "box",
         "total_sent",
         "total_recv",
+        "frames_sent",
+        "frames_recv",
     )
 
     def __init__(
@@ -75,6 +77,8 @@ class Connection:
 
         self.total_sent: int = 0
         self.total_recv: int = 0
+        self.frames_sent: int = 0
+        self.frames_recv: int = 0
 
     @property
     def encrypted(self) -> bool:
@@ -91,7 +95,7 @@ class Connection:
             else None
         )
 
-    def _decode(self, bytes_cipher: bytes) -> str:
+    def _decode(self, bytes_cipher: bytes) -> bytes:
         if self.encrypted:
             bytes_plain: bytes = self.box.decrypt(dearmor(bytes_cipher))
             if self.key_other_ver:
@@ -99,11 +103,11 @@ class Connection:
         else:
             bytes_plain = dearmor(bytes_cipher)
 
-        return bytes_plain.decode(self.encoding)
-
-    def _encode(self, str_plain: str) -> bytes:
-        bytes_plain: bytes = str_plain.encode(self.encoding)
+        # JSON is decoded straight from the Bytes, so they are not turned into a
+        #   String here.
+        return bytes_plain
 
+    def _encode(self, bytes_plain: bytes) -> bytes:
         if self.encrypted:
             if self._key_sign:
                 bytes_plain = self._key_sign.sign(bytes_plain)
@@ -138,19 +142,23 @@ class Connection:
     def encryption_ready(self) -> bool:
         return bool(self._box and self._box is not self.box)
 
-    async def read(self) -> str:
+    async def read(self) -> bytes:
         ctext: bytes = await self.instr.readuntil(sep)
         self.total_recv += len(ctext)
-        ptext: str = self._decode(ctext[: -len(sep)])
+        self.frames_recv += 1
+        ptext: bytes = self._decode(ctext[: -len(sep)])
         return ptext
 
-    async def write(self, ptext: str) -> int:
+    async def write(self, ptext: Union[bytes, str]) -> int:
+        if isinstance(ptext, str):
+            ptext = ptext.encode(self.encoding)
         ctext: bytes = self._encode(ptext)
         self.outstr.write(ctext)
         self.outstr.write(sep)
 
         count = len(ctext) + len(sep)
         self.total_sent += count
+        self.frames_sent += 1
 
         await self.outstr.drain()
         return count
@@ -158,9 +166,9 @@ class Connection:
     def __aiter__(self):
         return self
 
-    async def __anext__(self) -> Union[CryptoError, str]:
+    async def __anext__(self) -> Union[CryptoError, bytes]:
         try:
-            line: str = await self.read()
+            line: bytes = await self.read()
             if line and self.open:
                 return line
             else:
@@ -0,0 +1,194 @@
+"""Module managing the Executor Pools in which Hooks may be run, rather than
+    directly on the Event Loop.
+
+A Hook registered with ``executor="thread"`` is run in a bounded
+    ``ThreadPoolExecutor``, which keeps blocking calls, such as Disk I/O, from
+    stalling every other Connection. Unless a Method asks for its own number of
+    ``workers``, all such Hooks share a single Pool.
+
+A Hook registered with ``executor="process"`` is run in a
+    ``ProcessPoolExecutor`` instead, so that CPU-bound work can use every core
+    rather than contending for the GIL. Everything crossing into the Worker
+    Process is pickled, which imposes a contract on the Hook:
+        - It must be a plain Function defined at the top level of a Module, so
+            that it can be found again by name in the Worker. Lambdas, nested
+            Functions and Methods are rejected when they are hooked.
+        - It receives only the Parameters of the Message. The Remote cannot be
+            sent to another Process, so a Hook that takes two arguments is also
+            rejected.
+        - Its Return must be picklable. Dicts, Lists, Tuples, primitives and
+            ``Error`` objects are all fine.
+        - It must not rely on state set up in the parent Process after the Pool
+            was started, since the Workers will not see it.
+
+Process Pools are started, and their Workers spawned, by ``warm()``, which is
+    awaited when a Server starts running. This keeps the cost of forking off of
+    the first Requests to arrive.
+
+Pools are shared by every Server and Client in the Process. Each of them calls
+    ``hold()`` when it starts, and ``release()`` when it stops, and the Pools
+    are only shut down once the last of them has let go, so that one Client
+    disconnecting does not break the Hooks of a Server still running. To shut
+    down every Pool at once regardless, call ``shutdown()`` at the top level of
+    the Program.
+"""
+
+from asyncio import AbstractEventLoop, Future, gather, wrap_future
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from os import cpu_count, register_at_fork
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+EXECUTORS: Tuple[str, ...] = ("thread", "process")
+PROCESSES_DEFAULT: int = cpu_count() or 1
+THREADS_DEFAULT: int = min(32, (cpu_count() or 1) + 4)
+
+_shared: Dict[str, Executor] = {}
+# Owner -> The dedicated Pool made for it.
+_dedicated: Dict[Any, Executor] = {}
+_pools: List[Executor] = []
+_cold: Dict[Executor, int] = {}
+# The Servers and Clients which are running, and may still call Hooks.
+_holders: Set[Any] = set()
+# Pools may be looked up from the Threads of several Event Loops at once.
+_lock: Lock = Lock()
+
+
+def _noop() -> None:
+    pass
+
+
+def _new(kind: str, workers: Optional[int]) -> Executor:
+    if kind == "thread":
+        return ThreadPoolExecutor(workers or THREADS_DEFAULT, "ezipc-hook")
+    elif kind == "process":
+        pool = ProcessPoolExecutor(workers or PROCESSES_DEFAULT)
+        _cold[pool] = workers or PROCESSES_DEFAULT
+        return pool
+    else:
+        raise ValueError(
+            f"Unknown Executor {kind!r}. Must be one of: {', '.join(EXECUTORS)}"
+        )
+
+
+def get_executor(kind: str, workers: int = None, owner: Any = None) -> Executor:
+    """Find the Executor Pool which should run a Hook.
+
+    :param str kind: The type of Executor. Must be one of ``EXECUTORS``.
+    :param int workers: If this is supplied, a dedicated Pool of this size will
+        be used. Otherwise, the shared Pool of the given type will be used. In
+        either case, the Pool is created if it does not exist yet.
+    :param owner: The holder of a dedicated Pool. The same Pool is returned for
+        the same Owner until ``shutdown()`` is called. If this is not supplied,
+        a new dedicated Pool is made every time.
+
+    :return: An Executor into which Functions may be submitted.
+    :rtype: Executor
+    """
+    with _lock:
+        if workers is not None:
+            if workers < 1:
+                raise ValueError("An Executor must have at least one Worker.")
+
+            pool = _dedicated.get(owner) if owner is not None else None
+            if pool is None:
+                pool = _new(kind, workers)
+                _pools.append(pool)
+                if owner is not None:
+                    _dedicated[owner] = pool
+            return pool
+
+        if kind not in _shared:
+            _shared[kind] = pool = _new(kind, None)
+            _pools.append(pool)
+
+        return _shared[kind]
+
+
+def run_in(
+    loop: AbstractEventLoop, pool: Executor, func: Callable, *args
+) -> Future:
+    """Submit a Function into an Executor Pool, and return an AsyncIO Future
+        which will receive its Return.
+    """
+    return loop.run_in_executor(pool, partial(func, *args))
+
+
+async def warm() -> None:
+    """Start every Process Pool which has not yet been used, by giving each of
+        its Workers something to do.
+    """
+    # Pools may be made and warmed from several Threads at once.
+    with _lock:
+        cold = list(_cold.items())
+        _cold.clear()
+
+    if cold:
+        await gather(
+            *(
+                wrap_future(pool.submit(_noop))
+                for pool, count in cold
+                for _ in range(count)
+            )
+        )
+
+
+def _forget() -> List[Executor]:
+    """Forget every Pool, and return them so that they can be shut down. Must be
+        called with the Lock held.
+    """
+    pools = _pools[:]
+    _pools.clear()
+    _shared.clear()
+    _dedicated.clear()
+    _cold.clear()
+    return pools
+
+
+def hold(holder: Any) -> None:
+    """Keep the Pools running for a Server or Client, until it calls
+        ``release()``.
+    """
+    with _lock:
+        _holders.add(holder)
+
+
+def release(holder: Any, wait: bool = False) -> None:
+    """Let go of the Pools held for a Server or Client. If nothing else holds
+        them, shut them down. Any Hook called again later will make new ones.
+    """
+    with _lock:
+        _holders.discard(holder)
+        pools = [] if _holders else _forget()
+
+    for pool in pools:
+        pool.shutdown(wait=wait)
+
+
+def _after_fork() -> None:
+    """Forget the Pools of the parent in a forked Child, such as a Worker of a
+        Supervisor, so that it makes its own. A Process Pool holds the Pipes to
+        its Workers, and a Child using the one it inherited would share them
+        with every other Child of the same parent.
+    """
+    global _lock
+    # The Lock may have been held by another Thread when the Process forked.
+    _lock = Lock()
+    _forget()
+    _holders.clear()
+
+
+register_at_fork(after_in_child=_after_fork)
+
+
+def shutdown(wait: bool = True) -> None:
+    """Shut down every Executor Pool that has been created, whether or not it is
+        held. Any Hooks which use an Executor afterwards will make new Pools.
+    """
+    with _lock:
+        pools = _forget()
+
+    for pool in pools:
+        pool.shutdown(wait=wait)
@@ -0,0 +1,218 @@
+"""Module providing a Fan-Out Engine, for sending to many Remotes at once.
+
+Rather than one Task for every target, a fixed number of Workers take targets
+    in turn, so that the cost of starting a Broadcast does not grow with the
+    number of Remotes, and no more than a set number of sends are in progress
+    at any moment. Each send is given a timeout, so that one stuck Remote
+    holds up only the Worker sending to it, and only for so long.
+
+A Remote which has fallen behind, with more than a set number of Bytes already
+    waiting to be sent to it, is a Slow Consumer. Writing more to it would only
+    make it fall further behind, and waiting for it would hold up a Worker. It
+    is either skipped outright, or put off until every other target is done,
+    and then skipped if it has still not caught up.
+
+Responses to a Request sent to many Remotes can then be gathered in the order
+    they arrive, stopping as soon as enough have, and cancelling the rest.
+"""
+
+from asyncio import CancelledError, Future, gather, Queue, TimeoutError, wait_for
+from time import monotonic
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from . import Remote
+
+
+# The greatest number of sends in progress at once, by default.
+FANOUT_LIMIT: int = 64
+# The number of Bytes waiting to be sent to a Remote beyond which it is treated
+#   as a Slow Consumer, by default.
+BACKLOG_MAX: int = 1 << 20
+# The number of seconds to wait for each send, by default.
+SEND_TIMEOUT: float = 10.0
+
+SKIP: str = "skip"
+QUEUE: str = "queue"
+
+
+class FanoutReport:
+    """The outcome of sending something to many Remotes.
+
+    ``sent`` maps each Remote reached to what its send returned. ``skipped``
+        lists the Slow Consumers that were not sent anything, and ``failed``
+        maps each Remote whose send failed or timed out to the Exception.
+    """
+
+    __slots__ = ("elapsed", "failed", "sent", "skipped")
+
+    def __init__(self):
+        self.sent: Dict["Remote", Any] = {}
+        self.skipped: List["Remote"] = []
+        self.failed: Dict["Remote", BaseException] = {}
+        self.elapsed: float = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<FanoutReport: {len(self.sent)} sent, {len(self.skipped)} skipped,"
+            f" {len(self.failed)} failed in {self.elapsed * 1000:.1f}ms>"
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Whether every target was reached."""
+        return not (self.skipped or self.failed)
+
+    @property
+    def timed_out(self) -> List["Remote"]:
+        return [r for r, e in self.failed.items() if isinstance(e, TimeoutError)]
+
+
+async def fan_out(
+    targets: Iterable["Remote"],
+    send: Callable[["Remote"], Awaitable],
+    *,
+    limit: int = FANOUT_LIMIT,
+    timeout: Optional[float] = SEND_TIMEOUT,
+    backlog: int = BACKLOG_MAX,
+    slow: str = SKIP,
+) -> FanoutReport:
+    """Call a Send Function for each of several Remotes, and await each of the
+        results, with no more than ``limit`` in progress at once.
+
+    :param Iterable[Remote] targets: The Remotes to send to.
+    :param Callable send: A Function which receives a Remote, and returns
+        something to be awaited.
+    :param int limit: The greatest number of sends in progress at once.
+    :param float timeout: The number of seconds to wait for each send. If this
+        is None, a send may take as long as it needs, and a Remote which has
+        stopped reading holds up its Worker until its Connection is lost.
+    :param int backlog: The number of Bytes waiting to be sent to a Remote
+        beyond which it is a Slow Consumer. If this is None, no Remote is.
+    :param str slow: What to do with a Slow Consumer: ``"skip"`` it, or
+        ``"queue"`` it to be tried again once every other target is done.
+
+    :return: A Report of which Remotes were reached, and which were not.
+    :rtype: FanoutReport
+    """
+    if slow not in (SKIP, QUEUE):
+        raise ValueError(f"Unknown Slow Consumer Policy: {slow!r}")
+    if limit < 1:
+        raise ValueError("A Fan-Out must be able to send to at least one Remote.")
+
+    report = FanoutReport()
+    start = monotonic()
+    targets = list(targets)
+    deferred: List["Remote"] = []
+
+    async def attempt(remote: "Remote") -> None:
+        try:
+            if timeout is None:
+                report.sent[remote] = await send(remote)
+            else:
+                report.sent[remote] = await wait_for(send(remote), timeout)
+        except CancelledError:
+            raise
+        except Exception as e:
+            report.failed[remote] = e
+
+    async def worker(queue, retry: bool) -> None:
+        # Every Worker takes its next target from the same Iterator. This is
+        #   safe, since nothing is awaited between checking and taking.
+        for remote in queue:
+            if not remote.open:
+                report.failed[remote] = ConnectionResetError("Connection closed.")
+            elif backlog is not None and remote.backlog > backlog:
+                if retry:
+                    deferred.append(remote)
+                else:
+                    report.skipped.append(remote)
+            else:
+                await attempt(remote)
+
+    if targets:
+        queue = iter(targets)
+        await gather(
+            *(worker(queue, slow == QUEUE) for _ in range(min(limit, len(targets))))
+        )
+
+    if deferred:
+        # Give the Slow Consumers one more chance, now that they have had time
+        #   to catch up.
+        queue = iter(deferred)
+        await gather(*(worker(queue, False) for _ in range(min(limit, len(deferred)))))
+
+    report.elapsed = monotonic() - start
+    return report
+
+
+async def as_completed(
+    futures: Dict["Remote", Future],
+    *,
+    first: int = None,
+    timeout: float = None,
+    errors: bool = False,
+    cancel: bool = True,
+) -> AsyncIterator[Tuple["Remote", Any]]:
+    """Yield each Remote and the Result of its Future, as each Future is done.
+
+    :param Dict[Remote, Future] futures: A Mapping of Remotes to Futures, such
+        as the ``sent`` of a ``FanoutReport`` for a Request.
+    :param int first: The number of Results after which to stop. If this is
+        not supplied, every Result is yielded.
+    :param float timeout: The number of seconds after which to stop, however
+        many Results have been yielded.
+    :param bool errors: If this is True, a Remote whose Future fails is yielded
+        with the Exception, which does not count towards ``first``. Otherwise,
+        it is passed over.
+    :param bool cancel: If this is True, any Futures not yet done when this
+        stops are cancelled, which tells their Remotes to stop working on them.
+        Otherwise, they are left to finish, and ignored.
+    """
+    arrived: Queue = Queue()
+    for remote, future in futures.items():
+        future.add_done_callback(lambda f, r=remote: arrived.put_nowait((r, f)))
+
+    deadline = None if timeout is None else monotonic() + timeout
+    remaining = len(futures)
+    results = 0
+
+    try:
+        while remaining and (first is None or results < first):
+            try:
+                if deadline is None:
+                    remote, future = await arrived.get()
+                else:
+                    remote, future = await wait_for(
+                        arrived.get(), max(deadline - monotonic(), 0)
+                    )
+            except TimeoutError:
+                break
+
+            remaining -= 1
+            if future.cancelled():
+                continue
+            elif future.exception() is not None:
+                if errors:
+                    yield remote, future.exception()
+            else:
+                results += 1
+                yield remote, future.result()
+
+    finally:
+        if cancel:
+            # Nobody is waiting for the stragglers anymore.
+            for future in futures.values():
+                if not future.done():
+                    future.cancel()
@@ -0,0 +1,101 @@
+"""Module providing Single-Flight Groups, which let concurrent identical calls
+    share one execution.
+
+The first call with a given key leads the Flight: Its work is actually done, and
+    the Future representing that work is shared. Any call with the same key
+    made before the work finishes follows the Flight instead of doing the work
+    again. Every caller gets its own Future, which receives the shared outcome;
+    Cancelling it detaches only that caller. The shared work is only cancelled
+    once every caller has gone.
+
+Nothing is kept after a Flight lands. This is not a Cache.
+
+A Group may be shared by Remotes on the Event Loops of several Threads, as in a
+    Server with Shards, so the Flights and their counts are changed under a
+    Lock. A Future belongs to one Loop, so each Flight is only ever joined from
+    the Loop which leads it.
+"""
+
+from asyncio import Future
+from threading import Lock
+from typing import Dict, Hashable, List, Optional
+
+
+class FlightGroup:
+    """A set of Flights in progress, keyed by what they are computing."""
+
+    __slots__ = ("flights", "joined", "led", "lock")
+
+    def __init__(self):
+        # Key -> [Shared Future, Number of attached Callers]
+        self.flights: Dict[Hashable, List] = {}
+        self.lock: Lock = Lock()
+
+        self.led: int = 0
+        self.joined: int = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.flights
+
+    def __len__(self) -> int:
+        return len(self.flights)
+
+    def _attach(self, key: Hashable) -> Future:
+        flight = self.flights[key]
+        shared: Future = flight[0]
+        mine: Future = shared.get_loop().create_future()
+        flight[1] += 1
+
+        def land(_):
+            if not mine.done():
+                if shared.cancelled():
+                    mine.cancel()
+                elif shared.exception() is not None:
+                    mine.set_exception(shared.exception())
+                else:
+                    mine.set_result(shared.result())
+
+        def leave(_):
+            if mine.cancelled():
+                flight[1] -= 1
+                if flight[1] <= 0 and not shared.done():
+                    # Nobody is waiting for this anymore.
+                    shared.cancel()
+
+        shared.add_done_callback(land)
+        mine.add_done_callback(leave)
+        return mine
+
+    def follow(self, key: Hashable) -> Optional[Future]:
+        """If a Flight with the given key is in progress, attach to it and
+            return a new Future for its outcome. Otherwise, return None.
+        """
+        with self.lock:
+            if key not in self.flights:
+                return None
+            self.joined += 1
+        return self._attach(key)
+
+    def lead(self, key: Hashable, shared: Future) -> Future:
+        """Start a Flight with the given key, whose outcome will be that of the
+            shared Future, and return a new Future for the caller.
+        """
+
+        def landed(_):
+            with self.lock:
+                if self.flights.get(key, (None,))[0] is shared:
+                    del self.flights[key]
+
+        with self.lock:
+            self.flights[key] = [shared, 0]
+            self.led += 1
+        shared.add_done_callback(landed)
+        return self._attach(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return {
+                "flying": len(self.flights),
+                "led": self.led,
+                "joined": self.joined,
+            }
@@ -1,9 +1,20 @@
-from asyncio import Future
+from asyncio import ensure_future, Future, get_running_loop
 from functools import wraps
-from inspect import signature
-from typing import Callable, Dict, Tuple, TYPE_CHECKING, TypeVar, Union
-
-from .protocol import Notification, Request
+from inspect import (
+    isasyncgenfunction,
+    isawaitable,
+    iscoroutinefunction,
+    isgeneratorfunction,
+    signature,
+)
+from typing import Any, Callable, Dict, Tuple, TYPE_CHECKING, TypeVar, Union
+
+from ..util.output import warn
+from .admission import Bulkhead
+from .cache import cache_key, MISSING, ResultCache
+from .executors import get_executor, run_in
+from .flight import FlightGroup
+from .protocol import Error, Notification, Request, Response
 
 if TYPE_CHECKING:
     from . import Remote
@@ -24,7 +35,97 @@ rpc_response: type = Union[
 ]
 
 
-def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
+Incoming = Union[Notification, Request]
+
+
+def _invoker(
+    func: Callable, executor: str = None, workers: int = None
+) -> Callable[[Incoming, Remote], Any]:
+    """Build a Function which will call a Hook with the Parameters of a Message
+    and, if the Hook accepts them, the Remote that sent the Message and then the
+    Message itself. A Hook which receives the Message can, for example, read the
+    ``deadline`` of a Request, and cut its work short.
+
+    If an Executor is specified, the Hook is instead submitted to the relevant
+    Pool, and what is returned is a Future which will receive its Return.
+
+    :param Callable func: The Hook Function.
+    :param str executor: The type of Executor Pool to run the Hook in, or None
+        to run it directly on the Event Loop.
+    :param int workers: The size of a dedicated Pool for this Hook. If this is
+        not supplied, a shared Pool is used.
+
+    :return: A Function which receives a Message and a Remote.
+    :rtype: Callable[[Incoming, Remote], Any]
+    """
+    arity: int = len(signature(func).parameters)
+
+    if executor is None:
+        if workers is not None:
+            raise ValueError("Cannot size a Pool without an Executor.")
+
+        if arity > 2:
+            return lambda msg, remote: func(msg.params, remote, msg)
+        elif arity > 1:
+            return lambda msg, remote: func(msg.params, remote)
+        else:
+            return lambda msg, _remote: func(msg.params)
+
+    if (
+        iscoroutinefunction(func)
+        or isasyncgenfunction(func)
+        or isgeneratorfunction(func)
+    ):
+        raise TypeError(
+            f"Hook {func.__name__!r} cannot be run in an Executor: Only plain"
+            f" Functions may be sent to another Thread or Process."
+        )
+
+    if executor == "process":
+        if arity > 1:
+            raise TypeError(
+                f"Hook {func.__name__!r} cannot be run in a Process Pool: The"
+                f" Remote cannot be passed to another Process."
+            )
+        elif "<" in func.__qualname__ or "." in func.__qualname__:
+            raise TypeError(
+                f"Hook {func.__qualname__!r} cannot be run in a Process Pool: It"
+                f" must be defined at the top level of a Module to be pickled."
+            )
+
+    def call(msg: Incoming, remote: Remote):
+        # Look the Pool up every time, so that one shut down is replaced.
+        pool = get_executor(executor, workers, call)
+        if arity > 2:
+            return run_in(remote.eventloop, pool, func, msg.params, remote, msg)
+        elif arity > 1:
+            return run_in(remote.eventloop, pool, func, msg.params, remote)
+        else:
+            return run_in(remote.eventloop, pool, func, msg.params)
+
+    # Make the Pool now, so that it can be warmed before the first Request.
+    get_executor(executor, workers, call)
+    return call
+
+
+async def _addressed(request: Request, shared: Future) -> Any:
+    """Wait for the shared Return of a Hook, and make sure that, if it is a
+    Response, it answers the given Request rather than the one that started it.
+    """
+    ret = await shared
+    if isinstance(ret, Response) and ret.id != request.id:
+        ret = request.response(error=ret.error, result=ret.result)
+    return ret
+
+
+def notif_handler(
+    hooks: Dict[str, Callable],
+    method: str,
+    *,
+    executor: str = None,
+    workers: int = None,
+    bulkhead: Bulkhead = None,
+) -> Callable:
     """Generate a Decorator which will wrap a Function in a Request Handler
     and add a Callback Hook for a given RPC Method.
 
@@ -34,6 +135,17 @@ def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
         Callables.
     :param str method: The JSON-RPC Method that the Decorator will hook the
         passed Function to listen for, like LOGIN or PING.
+    :param str executor: If this is ``"thread"``, the Function will be run in a
+        Thread Pool instead of on the Event Loop. Use this for Functions which
+        block, such as those performing Disk I/O. If this is ``"process"``, it
+        will be run in a Process Pool, for Functions which are CPU-bound; See
+        the ``executors`` Module for what such a Function must satisfy.
+    :param int workers: The number of Threads or Processes in a Pool dedicated
+        to this Method. If this is not supplied, a shared Pool is used.
+    :param Bulkhead bulkhead: A limit on how many calls to this Method may run,
+        or wait to run, at the same time. One Bulkhead may be shared between
+        several Methods to limit them together. A Generator keeps its place
+        until it has been run through.
 
     :return: The Decorator Function that the next-defined Function will
         *actually* be passed to.
@@ -52,6 +164,8 @@ def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             Result or Error attached as appropriate.
         :rtype: Callable[[Union[dict, list], Remote], Callable]
         """
+        invoke = _invoker(func, executor, workers)
+        streams: bool = isgeneratorfunction(func) or isasyncgenfunction(func)
 
         @wraps(func)
         def handle_notif(notif: Notification, remote: Remote):
@@ -63,18 +177,39 @@ def notif_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             :param Remote remote: A Remote Object representing the IPC interface
                 to another, possibly non-local, Process.
             """
-            if len(signature(func).parameters) > 1:
-                return func(notif.params, remote)
+            if bulkhead is None:
+                return invoke(notif, remote)
+
+            ticket = bulkhead.admit()
+            if ticket is False:
+                # There is no room for this call. A Notification cannot be told
+                #   so, and must simply be dropped.
+                warn(f"Dropping {method!r} Notification from {remote!r}: Full.")
+                return None
+            elif streams:
+                # Keep the place until the Generator has been run through.
+                return bulkhead.hold(ticket, invoke(notif, remote))
             else:
-                return func(notif.params)
+                return bulkhead.run(ticket, invoke, notif, remote)
 
         hooks[method] = handle_notif
-        return handle_notif
+        # A Function run in a Process Pool is pickled by name, so the name must
+        #   still refer to the original Function rather than to the Wrapper.
+        return func if executor == "process" else handle_notif
 
     return decorator
 
 
-def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
+def request_handler(
+    hooks: Dict[str, Callable],
+    method: str,
+    *,
+    executor: str = None,
+    workers: int = None,
+    bulkhead: Bulkhead = None,
+    cache: ResultCache = None,
+    coalesce: FlightGroup = None,
+) -> Callable:
     """Generate a Decorator which will wrap a Function in a Request Handler
     and add a Callback Hook for a given RPC Method.
 
@@ -85,6 +220,25 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
         Callables.
     :param str method: The JSON-RPC Method that the Decorator will hook the
         passed Function to listen for, like LOGIN or PING.
+    :param str executor: If this is ``"thread"``, the Function will be run in a
+        Thread Pool instead of on the Event Loop. Use this for Functions which
+        block, such as those performing Disk I/O. If this is ``"process"``, it
+        will be run in a Process Pool, for Functions which are CPU-bound; See
+        the ``executors`` Module for what such a Function must satisfy.
+    :param int workers: The number of Threads or Processes in a Pool dedicated
+        to this Method. If this is not supplied, a shared Pool is used.
+    :param Bulkhead bulkhead: A limit on how many calls to this Method may run,
+        or wait to run, at the same time. One Bulkhead may be shared between
+        several Methods to limit them together. A Generator keeps its place
+        until it has been run through.
+    :param ResultCache cache: A Cache in which to keep the Results of this
+        Method. A Request whose Result is cached is answered from the Cache
+        without running the Function. Only use this for a Method whose Result
+        depends on nothing but its Parameters.
+    :param FlightGroup coalesce: A Group in which to share running calls of this
+        Method. A Request identical to one which is still being handled, from
+        any Remote, waits for the same Result instead of running the Function
+        again. The same restriction as for ``cache`` applies.
 
     :return: The Decorator Function that the next-defined Function will
         *actually* be passed to.
@@ -103,6 +257,23 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             Result or Error attached as appropriate.
         :rtype: Callable[[Union[dict, list], Remote], Callable]
         """
+        invoke = _invoker(func, executor, workers)
+        streams: bool = isgeneratorfunction(func) or isasyncgenfunction(func)
+
+        def run(request: Request, remote: Remote):
+            if bulkhead is None:
+                return invoke(request, remote)
+
+            ticket = bulkhead.admit()
+            if ticket is False:
+                # There is no room for this call. Fail now, rather than letting
+                #   the Remote wait for a Response that will come too late.
+                return request.response(error=Error.overloaded(method))
+            elif streams:
+                # Keep the place until the Generator has been run through.
+                return bulkhead.hold(ticket, invoke(request, remote))
+            else:
+                return bulkhead.run(ticket, invoke, request, remote)
 
         @wraps(func)
         def handle_request(request: Request, remote: Remote):
@@ -114,10 +285,37 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             :param Remote remote: A Remote Object representing the IPC interface
                 to another, possibly non-local, Process.
             """
-            if len(signature(func).parameters) > 1:
-                return func(request.params, remote)
+            if cache is None and coalesce is None:
+                return run(request, remote)
+
+            key = cache_key(method, request.params)
+
+            if cache is not None:
+                ret = cache.get(key)
+                if ret is not MISSING:
+                    # Answer from the Cache, without running the Function.
+                    return ret
+
+            if coalesce is not None:
+                # A Future can only be awaited on its own Loop, so calls are
+                #   only shared among those on the same one.
+                flight = (get_running_loop(), key)
+                mine = coalesce.follow(flight)
+                if mine is not None:
+                    # The same call is already running. Wait for it to finish.
+                    return _addressed(request, mine)
+
+            # Run the Function, and keep its Result, if any.
+            ret = run(request, remote)
+            if cache is not None:
+                ret = cache.fill(key, ret)
+
+            if coalesce is not None and isawaitable(ret):
+                # Let any identical Requests that arrive before this finishes
+                #   share it. Cancelling this one does not cancel the call.
+                return coalesce.lead(flight, ensure_future(ret))
             else:
-                return func(request.params)
+                return ret
 
             # res: Union[Coroutine, rpc_response] = coro(request.params, host)
             # while isinstance(res, Coroutine):
@@ -191,7 +389,9 @@ def request_handler(hooks: Dict[str, Callable], method: str) -> Callable:
             #     return request.response(error=Error(121, type(e).__name__, [str(e)]))
 
         hooks[method] = handle_request
-        return handle_request
+        # A Function run in a Process Pool is pickled by name, so the name must
+        #   still refer to the original Function rather than to the Wrapper.
+        return func if executor == "process" else handle_request
 
     return decorator
 
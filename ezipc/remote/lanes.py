@@ -0,0 +1,154 @@
+"""Module providing Priority Lanes for queued Messages.
+
+Control traffic, such as Pings, Key Exchanges and Terminations, is cheap but
+    urgent. When it waits in line behind bulk application traffic, a Remote
+    which is only busy can look dead. Messages are therefore sorted into Lanes,
+    and a more urgent Lane is served first; However, a less urgent Lane that has
+    been passed over too many times in a row is given a turn, so that it is
+    never starved outright.
+"""
+
+from asyncio import Queue
+from collections import deque
+from enum import IntEnum
+from re import compile as regex
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+
+class Lane(IntEnum):
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+# The Lanes of Methods which are not otherwise configured.
+PRIORITY: Dict[str, Lane] = {
+    "PING": Lane.HIGH,
+    "RPC.CANCEL": Lane.HIGH,
+    "RPC.MORE": Lane.HIGH,
+    "RSA.CONF": Lane.HIGH,
+    "RSA.EXCH": Lane.HIGH,
+    "TERM": Lane.HIGH,
+}
+
+# How many times a waiting Lane may be passed over before it gets a turn.
+BURST: int = 8
+
+_method = regex(r'"method"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_method_bytes = regex(rb'"method"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def peek_method(line: Union[bytes, str]) -> Optional[str]:
+    """Find the Method of a raw JSON-RPC Message without decoding all of it. For
+        a Batch, this is the Method of the first Message that has one. For a
+        Response, there is no Method, and None is returned.
+    """
+    if isinstance(line, bytes):
+        found = _method_bytes.search(line)
+        return found.group(1).decode() if found else None
+    else:
+        found = _method.search(line)
+        return found.group(1) if found else None
+
+
+class Lanes:
+    """A set of FIFO Queues, one for each Lane, which are popped as though
+        they were one Queue.
+    """
+
+    __slots__ = ("burst", "queues", "skipped")
+
+    def __init__(self, count: int = len(Lane), burst: int = BURST):
+        self.burst: int = burst
+        self.queues: List[Deque[Any]] = [deque() for _ in range(count)]
+        self.skipped: List[int] = [0] * count
+
+    def __bool__(self) -> bool:
+        return any(self.queues)
+
+    def __len__(self) -> int:
+        return sum(map(len, self.queues))
+
+    def __repr__(self) -> str:
+        return f"<Lanes {[len(q) for q in self.queues]}>"
+
+    def push(self, lane: int, item: Any) -> None:
+        self.queues[min(max(lane, 0), len(self.queues) - 1)].append(item)
+
+    def _choose(self) -> int:
+        chosen: Optional[int] = None
+
+        for i, q in enumerate(self.queues):
+            if q:
+                if chosen is None:
+                    # The most urgent Lane with anything in it.
+                    chosen = i
+                elif self.skipped[i] >= self.burst:
+                    # A less urgent Lane which has waited long enough.
+                    chosen = i
+                    break
+
+        if chosen is None:
+            raise IndexError("pop from empty Lanes")
+
+        for i, q in enumerate(self.queues):
+            if i == chosen or not q:
+                self.skipped[i] = 0
+            else:
+                self.skipped[i] += 1
+
+        return chosen
+
+    def pop(self) -> Any:
+        return self.queues[self._choose()].popleft()
+
+    def pop_many(
+        self, limit: int, size: int = None, measure: Callable[[Any], int] = len
+    ) -> List[Any]:
+        """Pop the item which ``pop()`` would, followed by as many more items
+            from the same Lane as will fit within the limits. Items are never
+            taken from more than one Lane, so that a Batch of them may be given
+            the priority of that Lane.
+
+        :param int limit: The greatest number of items to pop.
+        :param int size: The greatest total size of the items to pop, as given
+            by ``measure``. The first item is popped regardless.
+        :param Callable measure: A Function returning the size of an item.
+        """
+        q = self.queues[self._choose()]
+        first = q.popleft()
+        items = [first]
+
+        if size is not None:
+            size -= measure(first)
+
+        while q and len(items) < limit:
+            if size is not None:
+                size -= measure(q[0])
+                if size < 0:
+                    break
+            items.append(q.popleft())
+
+        return items
+
+
+class LaneQueue(Queue):
+    """An AsyncIO Queue which sorts each item put into it into a Lane, as given
+        by a Classifier Function, and gets items by the rules of ``Lanes``.
+    """
+
+    def __init__(
+        self, classify: Callable[[Any], int], maxsize: int = 0, burst: int = BURST
+    ):
+        self.classify: Callable[[Any], int] = classify
+        self.burst: int = burst
+        super().__init__(maxsize)
+
+    def _init(self, maxsize):
+        self._queue = Lanes(burst=self.burst)
+
+    def _put(self, item):
+        self._queue.push(self.classify(item), item)
+
+    def _get(self):
+        return self._queue.pop()
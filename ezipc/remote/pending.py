@@ -0,0 +1,220 @@
+"""Module providing a Table of Requests which are waiting for Responses.
+
+An entry may be given a Deadline when it is added. Entries are normally removed
+    when their Responses arrive, or when they are cancelled; Anything still in
+    the Table at its Deadline is removed then, and its Future is failed with a
+    ``TimeoutError``, so that unanswered Requests cannot pile up for the life of
+    a Connection.
+
+An entry added without a Deadline of its own gets the default of the Table, if
+    it has one. By default it does not, and such an entry waits for as long as
+    the Connection lasts, since a Request sent without a timeout may rightly
+    take a long time to be answered.
+
+Deadlines are kept in a Heap, and a single Timer is set for the earliest one.
+    Entries removed early are not searched out of the Heap; They are skipped
+    when they reach the top, and the Heap is rebuilt if too many accumulate.
+"""
+
+from asyncio import AbstractEventLoop, Future, TimeoutError, TimerHandle
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+# Seconds to wait for a Response to a Request which was sent without a timeout.
+#   None waits for as long as the Connection lasts.
+TTL_DEFAULT: Optional[float] = None
+
+
+class Pending:
+    """A Mapping of Request IDs to the Futures waiting for their Responses.
+
+    :param AbstractEventLoop loop: The Event Loop on which to set the Timer.
+    :param Callable on_expire: A Function to be called with a List of the IDs
+        removed by each sweep, if any.
+    :param float ttl: The Deadline of an entry added without one, in seconds.
+        If this is None, such entries have no Deadline.
+    """
+
+    __slots__ = (
+        "entries",
+        "expired",
+        "heap",
+        "loop",
+        "on_expire",
+        "seq",
+        "timer",
+        "ttl",
+    )
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        on_expire: Callable[[List[str]], None] = None,
+        ttl: Optional[float] = TTL_DEFAULT,
+    ):
+        self.loop: AbstractEventLoop = loop
+        self.on_expire: Optional[Callable[[List[str]], None]] = on_expire
+        self.ttl: Optional[float] = ttl
+
+        # ID -> (Future, Creation Time, Deadline). Dicts keep insertion order,
+        #   so the first entry is always the oldest. Entries without Deadlines
+        #   are kept out of the Heap.
+        self.entries: Dict[str, Tuple[Future, float, Optional[float]]] = {}
+        self.heap: List[Tuple[float, int, str]] = []
+        self.seq: Iterator[int] = count()
+        self.timer: Optional[TimerHandle] = None
+
+        self.expired: int = 0
+
+    def __contains__(self, mid: str) -> bool:
+        return mid in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __setitem__(self, mid: str, future: Future) -> None:
+        self.add(mid, future)
+
+    def add(self, mid: str, future: Future, ttl: float = None) -> None:
+        """Add a Future to the Table, to be failed if it is still waiting after
+            ``ttl`` seconds.
+        """
+        now = self.loop.time()
+        self._push(mid, future, now, self._deadline(now, ttl))
+
+    def touch(self, mid: str, ttl: float = None) -> None:
+        """Push back the Deadline of an entry, as though it had only just been
+            added. This is for Requests which are still in progress, such as a
+            Stream which has just received a part.
+        """
+        entry = self.entries.get(mid)
+        if entry is not None:
+            self._push(mid, entry[0], entry[1], self._deadline(self.loop.time(), ttl))
+
+    def _deadline(self, now: float, ttl: Optional[float]) -> Optional[float]:
+        if not (ttl and ttl > 0):
+            ttl = self.ttl
+        return None if ttl is None else now + ttl
+
+    def _push(
+        self, mid: str, future: Future, created: float, deadline: Optional[float]
+    ) -> None:
+        self.entries[mid] = (future, created, deadline)
+        if deadline is None:
+            return
+        heappush(self.heap, (deadline, next(self.seq), mid))
+
+        if len(self.heap) > 2 * len(self.entries) + 64:
+            # Too many stale Heap entries. Rebuild it from the live ones.
+            self.heap = [
+                (deadline_, next(self.seq), mid_)
+                for mid_, (_, _, deadline_) in self.entries.items()
+                if deadline_ is not None
+            ]
+            heapify(self.heap)
+
+        if self.timer is None or deadline < self.timer.when():
+            self._schedule()
+
+    def add_many(self, items: Iterable[Tuple[str, Future]], ttl: float = None) -> None:
+        """Add several Futures to the Table at once, all with the same Deadline.
+            The Heap is rebuilt and the Timer checked only once.
+        """
+        now = self.loop.time()
+        deadline = self._deadline(now, ttl)
+
+        for mid, future in items:
+            self.entries[mid] = (future, now, deadline)
+            if deadline is not None:
+                self.heap.append((deadline, next(self.seq), mid))
+        if deadline is None:
+            return
+        heapify(self.heap)
+
+        if self.timer is None or deadline < self.timer.when():
+            self._schedule()
+
+    def get(self, mid: str, default: Future = None) -> Optional[Future]:
+        entry = self.entries.get(mid)
+        return default if entry is None else entry[0]
+
+    def pop(self, mid: str, *default) -> Future:
+        entry = self.entries.pop(mid, None)
+        if entry is None:
+            if default:
+                return default[0]
+            raise KeyError(mid)
+        return entry[0]
+
+    def oldest(self) -> float:
+        """Return the age, in seconds, of the oldest entry in the Table."""
+        for _, created, _ in self.entries.values():
+            return self.loop.time() - created
+        return 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "pending": len(self.entries),
+            "oldest": self.oldest(),
+            "expired": self.expired,
+        }
+
+    def _schedule(self) -> None:
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        while self.heap:
+            deadline, _, mid = self.heap[0]
+            entry = self.entries.get(mid)
+            if entry is None or entry[2] != deadline:
+                # Stale; This entry has already been removed.
+                heappop(self.heap)
+            else:
+                self.timer = self.loop.call_at(deadline, self.sweep)
+                break
+
+    def sweep(self) -> List[str]:
+        """Remove every entry whose Deadline has passed, failing its Future."""
+        now = self.loop.time()
+        gone: List[str] = []
+
+        while self.heap and self.heap[0][0] <= now:
+            deadline, _, mid = heappop(self.heap)
+            entry = self.entries.get(mid)
+
+            if entry is not None and entry[2] == deadline:
+                del self.entries[mid]
+                gone.append(mid)
+                if not entry[0].done():
+                    entry[0].set_exception(
+                        TimeoutError(f"No Response to Request {mid}.")
+                    )
+
+        self.expired += len(gone)
+        self._schedule()
+
+        if gone and self.on_expire is not None:
+            self.on_expire(gone)
+        return gone
+
+    def fail_all(self, reason: str) -> None:
+        """Empty the Table, failing every Future still waiting with a
+            ``ConnectionResetError``.
+        """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+
+        entries = list(self.entries.values())
+        self.entries.clear()
+        self.heap.clear()
+
+        for future, _, _ in entries:
+            if not future.done():
+                future.set_exception(ConnectionResetError(reason))
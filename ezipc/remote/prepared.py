@@ -0,0 +1,109 @@
+"""Module providing Prepared Requests, for Methods which are called very often.
+
+Sending a Request normally builds a ``Request`` object, turns it into a Dict,
+    and encodes the whole Dict as JSON. For a small Request, most of that work
+    is the same every time. A Prepared Request encodes the unchanging start of
+    the Message once, when it is prepared, and on each call encodes only the
+    Parameters and the ID, and splices them on.
+
+A Prepared Request skips the Result Cache and Single-Flight Group of the Remote,
+    since looking up either means encoding the Parameters a second time. If
+    its Method is cacheable, or the Remote shares its Requests, each call falls
+    back to ``Remote.request()``, so that nothing behaves differently.
+"""
+
+from asyncio import Future, wait_for
+from functools import partial
+from typing import Any, TYPE_CHECKING, Union
+
+from ..util.output import err
+from .codec import dumpb
+
+if TYPE_CHECKING:
+    from . import Remote
+
+
+class PreparedRequest:
+    """A Callable which sends a Request for one Method of a Remote.
+
+    :param Remote remote: The Remote to which Requests will be sent.
+    :param str method: The Method to request.
+    :param int lane: The Lane in which the Requests will wait to be sent.
+    :param bool nohandle: If this is True, an Exception raised while sending is
+        raised, rather than only logged.
+    """
+
+    __slots__ = ("head", "lane", "method", "nohandle", "remote")
+
+    def __init__(self, remote: "Remote", method: str, lane: int, nohandle: bool):
+        self.remote: "Remote" = remote
+        self.method: str = method
+        self.lane: int = lane
+        self.nohandle: bool = nohandle
+
+        self.head: bytes = b'{"jsonrpc":"2.0","method":' + dumpb(method)
+
+    def __repr__(self) -> str:
+        return f"<PreparedRequest: {self.method!r} to {self.remote!r}>"
+
+    def encode(
+        self, params: Union[dict, list, tuple, None], mid: str, timeout: float
+    ) -> bytes:
+        """Build the text of one Request, in the same form as ``Request`` would."""
+        if params is None:
+            params = []
+        elif isinstance(params, tuple):
+            params = list(params)
+
+        if timeout > 0:
+            budget = b',"budget":' + dumpb(round(timeout, 3))
+        else:
+            budget = b""
+
+        return b"".join(
+            (
+                self.head,
+                budget,
+                b',"params":',
+                dumpb(params),
+                b',"id":',
+                dumpb(mid),
+                b"}",
+            )
+        )
+
+    async def __call__(
+        self, params: Union[dict, list, tuple] = None, *, timeout: float = 0
+    ) -> Union[Any, Future]:
+        """Send the Request, and return a Future for its Result, or the Result
+            itself if ``timeout`` is given.
+        """
+        remote = self.remote
+        if remote.singleflight or (
+            remote.rcache is not None and self.method in remote.cacheable
+        ):
+            return await remote.request(
+                self.method, params, nohandle=self.nohandle, quiet=True, timeout=timeout
+            )
+
+        future: Future = remote.eventloop.create_future()
+        if not remote.open:
+            future.set_exception(ConnectionResetError)
+            return future
+
+        mid = remote._id_new()
+        remote.total_sent["request"] += 1
+        remote.futures.add(mid, future, timeout)
+        future.add_done_callback(partial(remote._abandon, mid))
+
+        try:
+            await remote._write(self.encode(params, mid, timeout), self.lane)
+        except Exception as e:
+            err("Failed to send Request:", e)
+            if self.nohandle:
+                raise e
+
+        if timeout > 0:
+            return await wait_for(future, timeout)
+        else:
+            return future
@@ -6,8 +6,9 @@ https://www.jsonrpc.org/specification
 
 from abc import ABC, abstractmethod
 from enum import IntEnum
-from json import dumps, loads
+from re import compile as regex
 from secrets import randbits
+from time import monotonic
 from typing import (
     Any,
     Dict,
@@ -21,11 +22,11 @@ from typing import (
     Union,
 )
 
+from .codec import dumpb, dumps, loads
 from .exc import RemoteError
 
 
 ID_PRE: str = "NaN"
-JSON_OPTS = {"separators": (",", ":")}
 __version__ = "2.0"
 
 
@@ -35,14 +36,21 @@ id_: FrozenSet[str] = basic_ | frozenset({"id"})
 method_: FrozenSet[str] = basic_ | frozenset({"method"})
 params_: FrozenSet[str] = basic_ | frozenset({"params"})
 
+# Extension Members, which are not part of JSON-RPC, but which are accepted.
+#   "budget": The number of seconds the sender of a Request will wait for its
+#       Response. The receiver should not bother to run it after that.
+ext_req: FrozenSet[str] = frozenset({"budget", "stream"})
+#   "parts": The number of parts sent before the Response which ends a Stream.
+ext_res: FrozenSet[str] = frozenset({"parts"})
+
 err_sub: FrozenSet[str] = frozenset({"code", "message"})
 err_sup: FrozenSet[str] = err_sub | frozenset({"data"})
 
 notif_sup: FrozenSet[str] = method_ | params_
 req_sub: FrozenSet[str] = id_ | method_
-req_sup: FrozenSet[str] = req_sub | params_
+req_sup: FrozenSet[str] = req_sub | params_ | ext_req
 res_sub: FrozenSet[str] = frozenset({"error", "result"})
-res_sup: FrozenSet[str] = id_ | res_sub
+res_sup: FrozenSet[str] = id_ | res_sub | ext_res
 
 
 ID: type = Optional[Union[int, str]]
@@ -99,6 +107,14 @@ class Error(object):
     def server_error(cls, data=None) -> "Error":
         return cls(-32603, "Internal error", data)
 
+    @classmethod
+    def overloaded(cls, data=None) -> "Error":
+        return cls(-32001, "Server overloaded", data)
+
+    @classmethod
+    def expired(cls, data=None) -> "Error":
+        return cls(-32002, "Deadline passed", data)
+
     def as_exception(self) -> RemoteError:
         return RemoteError.from_message(dict(self))
 
@@ -121,7 +137,7 @@ class Error(object):
         return repr(dict(self))
 
     def __str__(self) -> str:
-        return dumps(dict(self), **JSON_OPTS)
+        return dumps(dict(self))
 
 
 class JRPC(IntEnum):
@@ -134,62 +150,97 @@ class JRPC(IntEnum):
     def check(cls, data: dict) -> "JRPC":
         if data.get("jsonrpc") != __version__:
             return cls.NONE
-        keys = frozenset(data.keys())
+        # Comparing the Keys View to a Set checks for unknown Members, without
+        #   building a new Set for every Message.
+        keys = data.keys()
 
-        if id_ < keys:
+        if "id" in data:
             # Either a Request or a Response.
-            if req_sub <= keys <= req_sup:
-                return cls.REQUEST
-            elif res_sub & keys and keys <= res_sup:
+            if "method" in data:
+                if keys <= req_sup:
+                    return cls.REQUEST
+            elif ("result" in data or "error" in data) and keys <= res_sup:
                 return cls.RESPONSE
 
-        elif method_ <= keys <= notif_sup:
+        elif "method" in data and keys <= notif_sup:
             # A Notification.
             return cls.NOTIF
 
         return cls.NONE
 
     @classmethod
-    def decode(cls, line: str) -> Iterator["Message"]:
+    def decode(
+        cls, line: Union[bytes, str], received: float = None
+    ) -> Iterator["Message"]:
+        """Decode a line of JSON into Messages.
+
+        :param bytes line: A JSON-RPC Message, or Batch thereof, as UTF-8 Bytes
+            or as a String.
+        :param float received: The ``monotonic()`` time at which the line was
+            received. If this is supplied, it is used as the starting point for
+            the Deadlines of any Requests that carry a Budget.
+        """
         structure = loads(line)
 
         if isinstance(structure, dict):
             structure = [structure]
 
+        check = cls.check
         for msg in structure:
             try:
-                mtype = cls.check(msg)
+                mtype = check(msg)
 
                 if mtype is cls.NOTIF:
+                    # The Parameters were just decoded, and belong to nobody
+                    #   else, so they are used as they are, not copied.
                     params = msg.get("params")
-
-                    if isinstance(params, dict):
-                        yield Notification(msg["method"], **params)
-                    elif isinstance(params, list):
-                        yield Notification(msg["method"], *params)
-                    else:
-                        yield Notification(msg["method"])
+                    if not isinstance(params, (dict, list)):
+                        params = []
+                    yield Notification.make(msg["method"], params)
 
                 elif mtype is cls.REQUEST:
                     params = msg.get("params")
-
-                    if isinstance(params, dict):
-                        yield Request(msg["method"], **params, mid=msg["id"])
-                    elif isinstance(params, (list, tuple)):
-                        yield Request(msg["method"], *params, mid=msg["id"])
+                    if not isinstance(params, (dict, list)):
+                        params = []
+                    req = Request.make(msg["method"], params, msg["id"])
+
+                    try:
+                        if "budget" in msg:
+                            req.set_budget(msg["budget"], received)
+                        if "stream" in msg:
+                            req.set_stream(msg["stream"])
+                    except ValueError as e:
+                        # The Request has an ID, so it can still be answered.
+                        yield Rejected(req, Error.invalid_request(str(e)))
                     else:
-                        yield Request(msg["method"], mid=msg["id"])
+                        yield req
 
                 elif mtype is cls.RESPONSE:
                     if "error" in msg:
-                        yield Response(msg["id"], error=Error(**msg["error"]))
+                        res = Response.make(msg["id"], error=Error(**msg["error"]))
                     else:
-                        yield Response(msg["id"], result=msg.get("result", []))
+                        # As with the Constructor, an empty Result is None.
+                        res = Response.make(msg["id"], result=msg["result"] or None)
+
+                    if "parts" in msg:
+                        res.set_parts(msg["parts"])
+                    yield res
 
             except Exception as e:
                 yield e
 
 
+class Rejected(ValueError):
+    """A Request which was received, but cannot be handled as it is. It should
+        be answered with the Error given.
+    """
+
+    def __init__(self, request: "Request", error: Error):
+        super().__init__(error.data or error.message)
+        self.request: Request = request
+        self.error: Error = error
+
+
 class Message(ABC):
     jsonrpc = __version__
     mtype: JRPC = JRPC.NONE
@@ -202,7 +253,10 @@ class Message(ABC):
         return repr(dict(self))
 
     def __str__(self) -> str:
-        return dumps(dict(self), **JSON_OPTS)
+        return dumps(dict(self))
+
+    def __bytes__(self) -> bytes:
+        return dumpb(dict(self))
 
 
 class Notification(Message):
@@ -234,6 +288,16 @@ class Notification(Message):
 
         self.method: Final[str] = method
 
+    @classmethod
+    def make(cls, method: str, params: ParamsRPC) -> "Notification":
+        """Construct a Notification around Parameters which are already a Dict
+            or a List, without copying them.
+        """
+        notif = cls.__new__(cls)
+        notif.method = method
+        notif.params = params
+        return notif
+
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
         yield "jsonrpc", self.jsonrpc
         yield "method", self.method
@@ -242,9 +306,12 @@ class Notification(Message):
 
 class Request(Message):
     __slots__ = (
+        "budget",
+        "deadline",
         "id",
         "method",
         "params",
+        "stream",
     )
     mtype = JRPC.REQUEST
 
@@ -271,6 +338,54 @@ class Request(Message):
         self.method: Final[str] = method
         self.id: Final[ID] = mid or _id_new()
 
+        self.budget: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.stream: Optional[int] = None
+
+    @classmethod
+    def make(cls, method: str, params: ParamsRPC, mid: ID) -> "Request":
+        """Construct a Request around Parameters which are already a Dict or a
+            List, without copying them.
+        """
+        req = cls.__new__(cls)
+        req.method = method
+        req.params = params
+        req.id = mid
+        req.budget = req.deadline = req.stream = None
+        return req
+
+    @property
+    def expired(self) -> bool:
+        """Whether the sender of this Request has already stopped waiting."""
+        return self.deadline is not None and self.deadline <= monotonic()
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """The number of seconds until the sender of this Request stops waiting
+            for its Response, or None if it will wait forever.
+        """
+        return None if self.deadline is None else self.deadline - monotonic()
+
+    def set_budget(self, budget: float, start: float = None) -> None:
+        """Set the number of seconds that the sender will wait for a Response,
+            counting from ``start``, a ``monotonic()`` time, or from now.
+        """
+        if not isinstance(budget, (int, float)) or budget < 0:
+            raise ValueError(f"Invalid Budget for Request: {budget!r}")
+
+        self.budget = budget
+        self.deadline = (monotonic() if start is None else start) + budget
+
+    def set_stream(self, window: int) -> None:
+        """Ask for every value produced by the Handler of this Request to be
+            sent back as it is produced, rather than only the first. No more
+            than ``window`` values will be sent before the sender asks for more.
+        """
+        if not isinstance(window, int) or isinstance(window, bool) or window < 1:
+            raise ValueError(f"Invalid Window for Request: {window!r}")
+
+        self.stream = window
+
     @overload
     def response(self) -> "Response":
         ...
@@ -292,6 +407,14 @@ class Request(Message):
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
         yield "jsonrpc", self.jsonrpc
         yield "method", self.method
+
+        if self.deadline is not None:
+            # Send only what is left of the Budget.
+            yield "budget", round(max(self.remaining, 0), 3)
+
+        if self.stream is not None:
+            yield "stream", self.stream
+
         yield "params", self.params
         yield "id", self.id
 
@@ -300,6 +423,7 @@ class Response(Message):
     __slots__ = (
         "error",
         "id",
+        "parts",
         "result",
     )
     mtype = JRPC.RESPONSE
@@ -327,6 +451,7 @@ class Response(Message):
 
         self.error: Optional[Error] = None
         self.result: Optional[ParamsRPC] = None
+        self.parts: Optional[int] = None
 
         if error or result:
             # noinspection PyArgumentList
@@ -335,6 +460,30 @@ class Response(Message):
             #   of these Keywords anyway, so if this raises an Exception, it
             #   should.
 
+    @classmethod
+    def make(
+        cls, mid: ID, *, error: Error = None, result: ParamsRPC = None
+    ) -> "Response":
+        """Construct a Response without checking that it has exactly one of an
+            Error or a Result.
+        """
+        res = cls.__new__(cls)
+        res.id = mid
+        res.error = error
+        res.result = result
+        res.parts = None
+        return res
+
+    def set_parts(self, parts: int) -> None:
+        """Mark this as the Response which ends a Stream, after ``parts`` values
+            were sent. This is kept apart from the Result, so that no Result can
+            be mistaken for the end of a Stream.
+        """
+        if not isinstance(parts, int) or isinstance(parts, bool) or parts < 0:
+            raise ValueError(f"Invalid number of parts for Response: {parts!r}")
+
+        self.parts = parts
+
     @overload
     def set(self, *, result: ParamsRPC) -> None:
         ...
@@ -360,9 +509,86 @@ class Response(Message):
         else:
             yield "result", self.result or []
 
+        if self.parts is not None:
+            yield "parts", self.parts
+
         yield "id", self.id
 
 
+# The start and end of a Message in the compact form written by this Package.
+_head = regex(r'\{"jsonrpc":"2\.0","method":"((?:[^"\\]|\\.)*)"')
+_tail = regex(r',"id":("(?:[^"\\]|\\.)*"|-?\d+)\}$')
+_unread = object()
+
+
+class Raw(bytes):
+    """The encoded text of a Message which has not been fully decoded, and so
+        may not be valid JSON. It is always written in a Frame of its own,
+        rather than spliced into a Batch, where it could break, or add to,
+        other Messages.
+    """
+
+    __slots__ = ()
+
+
+class LazyMessage(Message):
+    """A Notification or Request of which only the Envelope, its Method and ID,
+        has been decoded. The Parameters are decoded only if they are read, and
+        the Message is sent on as the same text it arrived as.
+
+    This is meant for Messages which are only passed through, such as those
+        relayed from one Client to another, where decoding and encoding the
+        Parameters would be wasted work. The Envelope is found with a Pattern
+        if the text is a Request in the compact form that this Package writes,
+        and by decoding all of it otherwise. Notifications are always decoded,
+        since a Pattern cannot be sure that the text holds no ID elsewhere.
+
+    :param str raw: The JSON text of one Notification or Request.
+    """
+
+    __slots__ = ("_params", "id", "method", "mtype", "raw")
+
+    def __init__(self, raw: str):
+        self.raw: str = raw
+        self._params: Any = _unread
+
+        head = _head.match(raw)
+        tail = None if head is None else _tail.search(raw, head.end())
+        if tail is not None:
+            method = head.group(1)
+            self.method: str = loads(f'"{method}"') if "\\" in method else method
+            self.id: ID = loads(tail.group(1))
+
+        else:
+            msg = loads(raw)
+            if not isinstance(msg, dict) or JRPC.check(msg) not in (
+                JRPC.NOTIF,
+                JRPC.REQUEST,
+            ):
+                raise ValueError("Not a JSON-RPC Notification or Request.")
+
+            self.method: str = msg["method"]
+            self.id: ID = msg.get("id")
+            self._params = msg.get("params", [])
+
+        self.mtype: JRPC = JRPC.NOTIF if self.id is None else JRPC.REQUEST
+
+    @property
+    def params(self) -> ParamsRPC:
+        if self._params is _unread:
+            self._params = loads(self.raw).get("params", [])
+        return self._params
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return iter(loads(self.raw).items())
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __bytes__(self) -> Raw:
+        return Raw(self.raw.encode())
+
+
 class Batch(List[Message]):
     def __init__(self, *a):
         super().__init__(a)
@@ -371,4 +597,21 @@ class Batch(List[Message]):
         return [dict(msg) for msg in self if msg]
 
     def json(self) -> str:
-        return dumps(self.flat(), **JSON_OPTS)
+        return dumps(self.flat())
+
+    def __bytes__(self) -> bytes:
+        return dumpb(self.flat())
+
+
+def compose(
+    cls: type, method: str, params: Union[ParamsRPC, tuple, None], **kw
+) -> Union[Notification, Request]:
+    """Construct a Notification or Request with the given Parameters, whether
+        they are named or positional.
+    """
+    if isinstance(params, dict):
+        return cls(method, **params, **kw)
+    elif isinstance(params, (list, tuple)):
+        return cls(method, *params, **kw)
+    else:
+        return cls(method, **kw)
@@ -0,0 +1,143 @@
+"""Module providing a Registry of connected Remotes, indexed by ID and by Tag.
+
+Every Remote in a Registry has an ID which no other Remote in it shares, so that
+    it can be found, and messages routed to it, by ID alone. A Remote whose ID
+    is already taken when it is added is given a new one. New IDs are drawn at
+    random, and grow by a digit whenever the Registry fills a quarter of the
+    IDs of the current length, so that finding a free one stays quick no
+    matter how many Remotes are connected.
+
+If the Registry has a Prefix, every new ID begins with it. A Server in a Cluster
+    gives the ID of its Node as the Prefix, so that IDs are unique across the
+    Cluster, and show which Node holds each Remote.
+
+Remotes may also be given any number of Tags, such as a role or a region, and
+    every Remote with a Tag can then be found without searching the rest.
+
+A Server with Shards adds and removes Remotes from the Threads of several Event
+    Loops, so every change is made under a Lock, and iterating a Registry goes
+    over a copy taken at the start.
+"""
+
+from collections.abc import MutableSet
+from secrets import randbits
+from threading import Lock
+from typing import Dict, Iterator, Optional, Set, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import Remote
+
+
+# The length of the shortest IDs handed out.
+ID_DIGITS: int = 3
+
+
+class Registry(MutableSet):
+    """A Set of Remotes, which can also be searched by ID or by Tag."""
+
+    __slots__ = ("by_id", "by_tag", "lock", "prefix", "tags")
+
+    def __init__(self, prefix: str = ""):
+        self.prefix: str = prefix
+        self.by_id: Dict[str, "Remote"] = {}
+        self.by_tag: Dict[str, Set["Remote"]] = {}
+        # Remote -> Tags, so that a Remote can be removed from every Tag when it
+        #   goes away.
+        self.tags: Dict["Remote", Set[str]] = {}
+        self.lock: Lock = Lock()
+
+    def __contains__(self, remote) -> bool:
+        return self.by_id.get(getattr(remote, "id", None)) is remote
+
+    def __iter__(self) -> Iterator["Remote"]:
+        with self.lock:
+            return iter(list(self.by_id.values()))
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    def __repr__(self) -> str:
+        return f"<Registry: {len(self)} Remotes, {len(self.by_tag)} Tags>"
+
+    def new_id(self) -> str:
+        """Find an ID which is not in use by any Remote in the Registry."""
+        digits = ID_DIGITS
+        while len(self.by_id) * 4 >= 16 ** digits:
+            digits += 1
+
+        while (
+            rid := self.prefix + format(randbits(4 * digits), f"0>{digits}X")
+        ) in self.by_id:
+            pass
+        return rid
+
+    def add(self, remote: "Remote") -> None:
+        """Add a Remote to the Registry. If its ID is already taken by another
+            Remote, it is given a new one.
+        """
+        with self.lock:
+            if remote in self:
+                return
+            if remote.id in self.by_id:
+                remote.id = self.new_id()
+
+            self.by_id[remote.id] = remote
+            self.tags[remote] = set()
+
+    def discard(self, remote: "Remote") -> None:
+        with self.lock:
+            if remote not in self:
+                return
+
+            del self.by_id[remote.id]
+            for tag in self.tags.pop(remote, ()):
+                tagged = self.by_tag[tag]
+                tagged.discard(remote)
+                if not tagged:
+                    del self.by_tag[tag]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.by_id.clear()
+            self.by_tag.clear()
+            self.tags.clear()
+
+    def get(self, rid: str) -> Optional["Remote"]:
+        """Find the Remote with an ID, or None if there is none."""
+        return self.by_id.get(rid)
+
+    def tag(self, remote: "Remote", *tags: str) -> None:
+        """Give Tags to a Remote in the Registry."""
+        with self.lock:
+            if remote not in self:
+                raise KeyError(f"{remote!r} is not registered.")
+
+            self.tags[remote].update(tags)
+            for tag in tags:
+                self.by_tag.setdefault(tag, set()).add(remote)
+
+    def untag(self, remote: "Remote", *tags: str) -> None:
+        """Remove Tags from a Remote. If no Tags are given, remove all of them."""
+        with self.lock:
+            own = self.tags.get(remote, set())
+            for tag in list(tags or own):
+                own.discard(tag)
+                tagged = self.by_tag.get(tag)
+                if tagged is not None:
+                    tagged.discard(remote)
+                    if not tagged:
+                        del self.by_tag[tag]
+
+    def tagged(self, *tags: str) -> Set["Remote"]:
+        """Find every Remote which has all of the given Tags."""
+        if not tags:
+            return set(self)
+
+        with self.lock:
+            found = set(self.by_tag.get(tags[0], ()))
+            for tag in tags[1:]:
+                found &= self.by_tag.get(tag, set())
+        return found
+
+    def tags_of(self, remote: "Remote") -> Set[str]:
+        return set(self.tags.get(remote, ()))
@@ -0,0 +1,178 @@
+"""Module providing Streamed Responses, with Flow Control.
+
+A Request may ask to be answered as a Stream, by carrying a Window. If its
+    Handler is a Generator, every value it produces is then sent back in an
+    ``RPC.PART`` Notification as soon as it is produced, rather than only the
+    first. Once the Generator is exhausted, the Request gets a Response with an
+    empty Result, which holds the number of parts sent in a ``parts`` Member of
+    its own. Any Result, however it looks, is therefore never taken for the end
+    of a Stream.
+
+No more than a Window of parts may be in flight at once. The receiver grants
+    more with ``RPC.MORE`` Notifications as it consumes them, so that a Handler
+    never produces values faster than they are used, and never needs to hold
+    more than a Window of them in memory. If the receiver stops reading, the
+    Request is cancelled, and the Generator is closed.
+
+If the Handler is not a Generator, it simply returns its Result, and the Stream
+    yields that Result as its only part.
+
+The final Response may be processed before the last few parts. Any parts still
+    missing once it has arrived are waited for, but only for ``LATE_PARTS``
+    seconds, after which the Stream fails.
+"""
+
+from asyncio import AbstractEventLoop, Future, TimeoutError, wait_for
+from collections import deque
+from typing import Any, Callable, Deque, Optional
+
+
+# The number of parts which may be in flight, if the receiver does not say.
+WINDOW_DEFAULT: int = 16
+# The number of seconds to wait for parts still missing after the final Response.
+LATE_PARTS: float = 5.0
+
+
+class Credit:
+    """The number of parts which a Stream may still send before it must wait
+        for the receiver to ask for more.
+    """
+
+    __slots__ = ("available", "loop", "waiter")
+
+    def __init__(self, loop: AbstractEventLoop, window: int):
+        self.loop: AbstractEventLoop = loop
+        self.available: int = window
+        self.waiter: Optional[Future] = None
+
+    def grant(self, count: int) -> None:
+        self.available += count
+        if self.available > 0 and self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    async def take(self) -> None:
+        """Wait until a part may be sent, and count it."""
+        while self.available <= 0:
+            self.waiter = self.loop.create_future()
+            await self.waiter
+        self.available -= 1
+
+
+class ResponseStream:
+    """An Async Iterator over the parts of a Streamed Response.
+
+    :param Future future: The Future which will receive the final Response.
+    :param int window: The number of parts the sender may send ahead.
+    :param Callable ask: A Function to be called with a number of parts, to
+        grant the sender that many more.
+    :param float timeout: The number of seconds to wait for each part.
+    """
+
+    __slots__ = (
+        "ask",
+        "buffer",
+        "consumed",
+        "expected",
+        "future",
+        "received",
+        "timeout",
+        "waiter",
+        "window",
+    )
+
+    def __init__(
+        self,
+        future: Future,
+        window: int,
+        ask: Callable[[int], Any],
+        timeout: float = None,
+    ):
+        self.future: Future = future
+        self.window: int = window
+        self.ask: Callable[[int], Any] = ask
+        self.timeout: Optional[float] = timeout
+
+        self.buffer: Deque[Any] = deque()
+        self.waiter: Optional[Future] = None
+
+        # Parts received in total, and parts consumed since more were granted.
+        self.received: int = 0
+        self.consumed: int = 0
+        # The number of parts sent, as told by the final Response. None if the
+        #   Response has not arrived, or did not end a Stream.
+        self.expected: Optional[int] = None
+
+        future.add_done_callback(self._wake)
+
+    def __aiter__(self) -> "ResponseStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self.buffer:
+            if self.finished():
+                # Raises any Error which ended the Stream, or else stops.
+                result = self.future.result()
+                if self.received == 0 and self.expected is None:
+                    # The Handler did not stream. Its Result is the only part.
+                    self.received = 1
+                    return result
+                raise StopAsyncIteration
+
+            self.waiter = self.future.get_loop().create_future()
+            try:
+                # Once the final Response has arrived, the parts still missing
+                #   can only be a little behind it.
+                await wait_for(self.waiter, LATE_PARTS if self.future.done() else None)
+            except BaseException as e:
+                await self.aclose()
+                if isinstance(e, TimeoutError):
+                    raise TimeoutError(
+                        f"Stream ended after {self.expected} parts, but only"
+                        f" {self.received} arrived."
+                    ) from e
+                raise
+
+        self.consumed += 1
+        if self.consumed * 2 >= self.window and not self.future.done():
+            # Half of the Window has been used up. Let the sender fill it again.
+            self.ask(self.consumed)
+            self.consumed = 0
+
+        return self.buffer.popleft()
+
+    def finished(self) -> bool:
+        """Determine whether every part has arrived. The final Response may be
+            processed before the last of the parts, so it says how many there
+            should be.
+        """
+        if not self.future.done():
+            return False
+        elif self.future.cancelled() or self.future.exception() is not None:
+            return True
+
+        return self.expected is None or self.received >= self.expected
+
+    def end(self, parts: Optional[int]) -> None:
+        """Receive the number of parts sent, from the final Response. If it is
+            None, the Response did not end a Stream, and its Result is the only
+            part.
+        """
+        self.expected = parts
+
+    def _wake(self, _=None) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(None)
+
+    def feed(self, part: Any) -> None:
+        """Receive a part from the sender."""
+        self.buffer.append(part)
+        self.received += 1
+        self._wake()
+
+    async def aclose(self) -> None:
+        """Stop reading the Stream. The Request is cancelled, if it is still in
+            progress, and any parts not yet read are discarded.
+        """
+        self.buffer.clear()
+        if not self.future.done():
+            self.future.cancel()
@@ -0,0 +1,181 @@
+"""Module providing an Index of Subscriptions to Topics.
+
+A Topic is a String of Segments separated by dots, such as ``news.sport.f1``.
+    A Subscription is a Pattern of the same form, in which a Segment of ``*``
+    matches any one Segment, and a final Segment of ``#`` matches any number of
+    Segments, including none. So, ``news.*.f1`` matches ``news.sport.f1``, and
+    ``news.#`` matches ``news``, ``news.sport`` and ``news.sport.f1``.
+
+Patterns are kept in a Trie, keyed by Segment, so that finding the Subscribers
+    of a Topic takes time proportional to the depth of the Topic, rather than to
+    the number of Subscriptions.
+
+A Server with Shards subscribes, unsubscribes and publishes from the Threads of
+    several Event Loops, so the Trie is only read or changed under a Lock.
+"""
+
+from threading import RLock
+from typing import Dict, Hashable, Iterable, List, Optional, Set
+
+
+SEP: str = "."
+ONE: str = "*"
+REST: str = "#"
+
+
+def split(pattern: str) -> List[str]:
+    """Split a Pattern into its Segments, checking that it is valid."""
+    if not isinstance(pattern, str) or not pattern:
+        raise ValueError(f"Invalid Topic: {pattern!r}")
+
+    segments = pattern.split(SEP)
+    if not all(segments) or REST in segments[:-1]:
+        raise ValueError(f"Invalid Topic: {pattern!r}")
+
+    return segments
+
+
+class _Node:
+    __slots__ = ("children", "exact", "rest")
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = {}
+        # Subscribers whose Patterns end here, and those whose Patterns end
+        #   here with ``#``.
+        self.exact: Set[Hashable] = set()
+        self.rest: Set[Hashable] = set()
+
+    def __bool__(self) -> bool:
+        return bool(self.children or self.exact or self.rest)
+
+
+class TopicIndex:
+    """A Mapping of Patterns to the Subscribers of each, which can be searched
+        for every Subscriber to a Topic.
+    """
+
+    __slots__ = ("lock", "root", "subscriptions")
+
+    def __init__(self):
+        self.lock: RLock = RLock()
+        self.root: _Node = _Node()
+        # Subscriber -> Patterns, so that all of a Subscriber's Patterns can be
+        #   removed when it goes away.
+        self.subscriptions: Dict[Hashable, Set[str]] = {}
+
+    def __contains__(self, subscriber: Hashable) -> bool:
+        return subscriber in self.subscriptions
+
+    def __len__(self) -> int:
+        with self.lock:
+            return sum(map(len, self.subscriptions.values()))
+
+    def subscribe(self, subscriber: Hashable, pattern: str) -> bool:
+        """Add a Subscription. Return False if it already existed."""
+        segments = split(pattern)
+        with self.lock:
+            return self._subscribe(subscriber, pattern, segments)
+
+    def _subscribe(
+        self, subscriber: Hashable, pattern: str, segments: List[str]
+    ) -> bool:
+        node = self.root
+
+        for segment in segments[:-1]:
+            node = node.children.setdefault(segment, _Node())
+
+        if segments[-1] == REST:
+            target = node.rest
+        else:
+            target = node.children.setdefault(segments[-1], _Node()).exact
+
+        if subscriber in target:
+            return False
+
+        target.add(subscriber)
+        self.subscriptions.setdefault(subscriber, set()).add(pattern)
+        return True
+
+    def unsubscribe(self, subscriber: Hashable, pattern: str) -> bool:
+        """Remove a Subscription. Return False if it did not exist."""
+        with self.lock:
+            return self._unsubscribe(subscriber, pattern)
+
+    def _unsubscribe(self, subscriber: Hashable, pattern: str) -> bool:
+        patterns = self.subscriptions.get(subscriber)
+        if not patterns or pattern not in patterns:
+            return False
+
+        segments = split(pattern)
+        rest: bool = segments[-1] == REST
+        if rest:
+            segments.pop()
+
+        path: List[_Node] = [self.root]
+        for segment in segments:
+            path.append(path[-1].children[segment])
+
+        if rest:
+            path[-1].rest.discard(subscriber)
+        else:
+            path[-1].exact.discard(subscriber)
+
+        # Prune any Nodes left empty.
+        for parent, node, segment in zip(
+            reversed(path[:-1]), reversed(path[1:]), reversed(segments)
+        ):
+            if node:
+                break
+            del parent.children[segment]
+
+        patterns.discard(pattern)
+        if not patterns:
+            del self.subscriptions[subscriber]
+        return True
+
+    def discard(self, subscriber: Hashable) -> int:
+        """Remove every Subscription of a Subscriber. Return how many there
+            were.
+        """
+        with self.lock:
+            patterns = list(self.subscriptions.get(subscriber, ()))
+            for pattern in patterns:
+                self._unsubscribe(subscriber, pattern)
+            return len(patterns)
+
+    def patterns(self, subscriber: Hashable) -> Set[str]:
+        with self.lock:
+            return set(self.subscriptions.get(subscriber, ()))
+
+    def match(self, topic: str) -> Set[Hashable]:
+        """Find every Subscriber with a Pattern which matches a Topic. The
+            Topic itself may not contain wildcards.
+        """
+        segments = split(topic)
+        if ONE in segments or REST in segments:
+            raise ValueError(f"Cannot publish to a Pattern: {topic!r}")
+
+        found: Set[Hashable] = set()
+        with self.lock:
+            self._match(self.root, segments, 0, found)
+        return found
+
+    def _match(
+        self, node: _Node, segments: List[str], depth: int, found: Set[Hashable]
+    ) -> None:
+        found |= node.rest
+
+        if depth == len(segments):
+            return
+
+        last: bool = depth == len(segments) - 1
+        for key in (segments[depth], ONE):
+            child: Optional[_Node] = node.children.get(key)
+            if child is not None:
+                if last:
+                    found |= child.exact
+                self._match(child, segments, depth + 1, found)
+
+    def subscribers(self) -> Iterable[Hashable]:
+        with self.lock:
+            return list(self.subscriptions)
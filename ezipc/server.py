@@ -2,37 +2,77 @@ from asyncio import (
     AbstractEventLoop,
     AbstractServer,
     CancelledError,
+    ensure_future,
     Future,
     gather,
     get_event_loop,
+    get_running_loop,
     run,
+    run_coroutine_threadsafe,
     start_server,
     StreamReader,
     StreamWriter,
     Task,
 )
-from collections import Counter, MutableSet
+from collections import Counter
 from datetime import datetime as dt
+from inspect import isawaitable
 from socket import AF_INET, SOCK_DGRAM, socket
-from typing import Callable, Dict, Optional, Union
+from threading import Lock
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    MutableSet,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
 
 from .remote import (
+    Bulkhead,
+    Error,
+    FlightGroup,
+    JRPC,
+    LazyMessage,
+    ResultCache,
     can_encrypt,
     counter,
+    Lane,
     notif_handler,
+    Notification,
+    Registry,
     Remote,
     RemoteError,
     request_handler,
     rpc_response,
+    TopicIndex,
 )
+from .remote.cache import MISSING
+from .remote.codec import BACKEND
+from .remote.fanout import as_completed, fan_out, FanoutReport
+from .remote.protocol import compose
+from .remote.executors import hold, release, warm
+from .shards import request_on, run_on, ShardedListener
 from .util import callback_response, echo, err, hl_method, P, T, warn
 
+if TYPE_CHECKING:
+    from .cluster import Cluster, NodeRoute
+
+
+# The number of seconds to wait for the Response to a relayed Request which does
+#   not carry a Budget of its own.
+RELAY_TIMEOUT: float = 30.0
 
 __all__ = (
     "callback_response",
     "can_encrypt",
     "echo",
     "err",
+    "Lane",
     "rpc_response",
     "P",
     "Remote",
@@ -70,16 +110,24 @@ class Server:
         "eventloop",
         "helpers",
         "listeners",
+        "lock",
         "remotes",
         "server",
         "startup",
         "total_clients",
         "total_sent",
         "total_recv",
+        "total_expired",
         "hooks_notif",
         "hooks_request",
         "hooks_connection",
         "hooks_disconnect",
+        "bulkheads",
+        "caches",
+        "cluster",
+        "flights",
+        "priorities",
+        "topics",
     )
 
     def __init__(
@@ -111,19 +159,36 @@ class Server:
 
         self.eventloop: Optional[AbstractEventLoop] = None
         self.listeners: MutableSet[Task] = set()
-        self.remotes: MutableSet[Remote] = set()
+        # Guards the Statistics of the Server, which Shards update from their
+        #   own Threads.
+        self.lock: Lock = Lock()
+        # Connected Remotes, indexed by their IDs, which are unique among them.
+        self.remotes: Registry = Registry()
         self.server: Optional[AbstractServer] = None
         self.startup: dt = dt.utcnow()
 
         self.total_clients: int = 0
         self.total_sent: Counter = counter()
         self.total_recv: Counter = counter()
+        self.total_expired: int = 0
 
         self.hooks_notif = {}
         self.hooks_request = {}
         self.hooks_connection = []
         self.hooks_disconnect = []
 
+        self.bulkheads: Dict[str, Bulkhead] = {}
+        self.caches: Dict[str, ResultCache] = {}
+        self.flights: Dict[str, FlightGroup] = {}
+        self.priorities: Dict[str, int] = {}
+
+        # Topic Patterns, and the Remotes subscribed to each.
+        self.topics: TopicIndex = TopicIndex()
+
+        # Other Servers to which Broadcasts and Relays are passed on. See the
+        #   ``cluster`` Module.
+        self.cluster: Optional["Cluster"] = None
+
     def setup(self, *_a, **_kw):
         """Execute all prerequisites to running, before running. Meant to be
             extended by Subclasses.
@@ -131,25 +196,170 @@ class Server:
 
         @self.hook_request("ETC.INIT")
         async def cb_time(_, remote: Remote):
-            return {"startup": self.startup.timestamp(), "id": remote.id}
+            return {
+                "startup": self.startup.timestamp(),
+                "id": remote.id,
+                # Tell the Client which Results it may cache, and for how long.
+                "cache": {method: cache.ttl for method, cache in self.caches.items()},
+            }
+
+        @self.hook_request("TOPIC.SUB")
+        def cb_subscribe(data: list, remote: Remote):
+            try:
+                for pattern in data:
+                    self.topics.subscribe(remote, pattern)
+            except ValueError as e:
+                return Error.invalid_params(str(e))
+            return sorted(self.topics.patterns(remote))
+
+        @self.hook_request("TOPIC.UNSUB")
+        def cb_unsubscribe(data: list, remote: Remote):
+            for pattern in data or self.topics.patterns(remote):
+                self.topics.unsubscribe(remote, pattern)
+            return sorted(self.topics.patterns(remote))
+
+        @self.hook_request("RELAY.REQ")
+        async def cb_relay_request(data: dict, remote: Remote, request):
+            try:
+                # Only the Envelope of the relayed Request is decoded; It is
+                #   sent on as the text it arrived as. Its Budget goes with it,
+                #   and bounds the wait here, as does a default without one.
+                msg = LazyMessage(data["msg"])
+                if msg.mtype is not JRPC.REQUEST:
+                    raise TypeError("Relayed Message is not a Request.")
+
+                target = self.route(data["to"])
+                return await run_on(
+                    target.eventloop,
+                    self._forward(target, msg, request.remaining or RELAY_TIMEOUT),
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                return Error.invalid_params(f"Cannot Relay: {e}")
+            except RemoteError as e:
+                return Error(e.code, e.message, e.data)
+
+        @self.hook_notif("RELAY.NOTIF")
+        async def cb_relay_notif(data: dict, remote: Remote):
+            try:
+                msg = LazyMessage(data["msg"])
+                if msg.mtype is not JRPC.NOTIF:
+                    raise TypeError("Relayed Message is not a Notification.")
+
+                target = self.route(data["to"])
+                await run_on(target.eventloop, target.forward(msg))
+            except (KeyError, TypeError, ValueError) as e:
+                warn(f"Failed to relay a Notification from {remote!r}:", e)
 
-    def hook_notif(self, method: str):
+    def hook_notif(
+        self,
+        method: str,
+        *,
+        limit: int = None,
+        queue: int = 0,
+        priority: int = None,
+        **options,
+    ) -> Callable:
         """Signal to the Remote that `func` is waiting for Notifications of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Notification, and the second is the Remote.
+            of the Notification, and the second is the Remote. It may also take a
+            third, the Notification itself.
+
+        If ``limit`` is given, no more than that many calls to the Function may
+            run at once, across all Remotes, and no more than ``queue`` may wait
+            for a turn; Any more are dropped. If ``priority`` is given, Messages
+            of the Method will be queued in that Lane. Other Keyword Options,
+            such as ``executor`` and ``bulkhead``, are passed through to
+            ``notif_handler()``.
         """
-        return notif_handler(self.hooks_notif, method)
+        if priority is not None:
+            self.priorities[method] = priority
+        if limit is not None:
+            options["bulkhead"] = self.bulkhead(method, limit, queue)
+        return notif_handler(self.hooks_notif, method, **options)
 
-    def hook_request(self, method: str) -> Callable:
+    def hook_request(
+        self,
+        method: str,
+        *,
+        limit: int = None,
+        queue: int = 0,
+        priority: int = None,
+        cache: Union[float, Tuple[float, int], ResultCache] = None,
+        coalesce: bool = False,
+        **options,
+    ) -> Callable:
         """Signal to the Remote that `func` is waiting for Requests of the
             provided `method` value.
 
         The provided Function should take two arguments: The first is the Data
-            of the Request, and the second is the Remote.
+            of the Request, and the second is the Remote. It may also take a
+            third, the Request itself.
+
+        If ``limit`` is given, no more than that many calls to the Function may
+            run at once, across all Remotes, and no more than ``queue`` may wait
+            for a turn; Any more are answered immediately with an Error. If
+            ``priority`` is given, Messages of the Method will be queued in that
+            Lane.
+
+        If ``cache`` is given, Results of the Function will be cached, keyed by
+            their Parameters, and repeated Requests answered without running
+            it. It may be a TTL in seconds, a Tuple of a TTL and a maximum size,
+            or a ``ResultCache`` to be shared with other Methods. Entries can
+            be removed with ``Server.invalidate()``.
+
+        If ``coalesce`` is True, a Request which is identical to one still being
+            handled, from any Remote, is not run again; It is answered with the
+            Result of the call already running. Nothing is kept afterwards.
+
+        Other Keyword Options, such as ``executor`` and ``bulkhead``, are passed
+            through to ``request_handler()``.
+        """
+        if priority is not None:
+            self.priorities[method] = priority
+        if limit is not None:
+            options["bulkhead"] = self.bulkhead(method, limit, queue)
+        if cache is not None:
+            if not isinstance(cache, ResultCache):
+                cache = ResultCache(*cache if isinstance(cache, tuple) else (cache,))
+            self.caches[method] = options["cache"] = cache
+        if coalesce:
+            self.flights[method] = options["coalesce"] = FlightGroup()
+        return request_handler(self.hooks_request, method, **options)
+
+    def bulkhead(self, name: str, limit: int, queue: int = 0) -> Bulkhead:
+        """Create a Bulkhead which may be shared between several Hooks, such as
+            all of those in one Namespace, to limit them together. It will be
+            included in the Statistics of the Server.
         """
-        return request_handler(self.hooks_request, method)
+        self.bulkheads[name] = bh = Bulkhead(limit, queue, name)
+        return bh
+
+    def invalidate(self, method: str, params: Union[dict, list] = MISSING) -> int:
+        """Remove cached Results of a Method; Either the one for a given set of
+            Parameters, or all of them. Return the number of entries removed.
+
+        Every connected Client is also sent a ``CACHE.DROP`` Notification, so
+            that it removes the same Results from its own Cache.
+        """
+        if method not in self.caches:
+            return 0
+
+        if self.remotes and self.eventloop:
+            drop = {"meth": method}
+            if params is not MISSING:
+                drop["params"] = params
+            # Every Client must hear of this, however slow, or it will go on
+            #   using stale Results. Nothing waits for it, so a slow Client holds
+            #   up only its own send. This may be called from the Thread of a
+            #   Shard.
+            run_coroutine_threadsafe(
+                self.broadcast("CACHE.DROP", drop, backlog=None, timeout=None),
+                self.eventloop,
+            )
+
+        return self.caches[method].invalidate(method, params)
 
     def hook_connect(self, func):
         """Add a Function to a List of Callables that will be called on every
@@ -171,22 +381,222 @@ class Server:
         """Send a Notification to every connected Remote. Return a Dict which
             maps each Remote to its respective sending Task. These Tasks must
             then be awaited.
+
+        This starts a Task for every Remote at once. For many Remotes, or where
+            some may be slow, ``broadcast()`` is preferable. In a Cluster, the
+            Notification is also passed on to the Clients of every other Node.
         """
         echo(
             "cast",
             f"Broadcasting {hl_method(meth)} Notif to {len(self.remotes)}"
             f" Remote{'' if len(self.remotes) == 1 else 's'}.",
         )
+        if self.cluster is not None:
+            self.cluster.broadcast(meth, bytes(compose(Notification, meth, params)))
         if not self.remotes:
             return {}
 
         return {
-            remote: self.eventloop.create_task(
-                remote.notif(meth, params, quiet=True, **kw)
+            remote: ensure_future(
+                run_on(remote.eventloop, remote.notif(meth, params, quiet=True, **kw))
             )
             for remote in self.remotes
         }
 
+    async def publish(
+        self,
+        topic: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        lane: int = Lane.NORMAL,
+        **options,
+    ) -> FanoutReport:
+        """Send a ``TOPIC.PUB`` Notification to every Remote subscribed to a
+            Topic, through the Fan-Out Engine, as ``broadcast()`` does.
+
+        Remotes subscribe with a ``TOPIC.SUB`` Request, listing Patterns of the
+            Topics they want; See the ``topics`` Module for their form. The
+            Notification is serialized only once, however many Remotes receive
+            it.
+        """
+        targets = self.topics.match(topic)
+        echo(
+            "cast",
+            f"Publishing {hl_method(topic)} to {len(targets)}"
+            f" Subscriber{'' if len(targets) == 1 else 's'}.",
+        )
+
+        text = bytes(Notification("TOPIC.PUB", topic, params))
+        if self.cluster is not None:
+            self.cluster.publish(topic, text)
+        return await self._fan_out(targets, "TOPIC.PUB", text, lane, **options)
+
+    async def broadcast(
+        self,
+        meth: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        request: bool = False,
+        targets: Iterable[Remote] = None,
+        lane: int = None,
+        **options,
+    ) -> FanoutReport:
+        """Send a Notification, or a Request, to every connected Remote, or to
+            every Remote in ``targets``, through the Fan-Out Engine. Return a
+            Report of which Remotes were reached, and which were skipped or
+            failed; For Requests, it maps each Remote reached to the Future of
+            its Response.
+
+        Other Keyword Options, such as ``limit``, ``timeout``, ``backlog`` and
+            ``slow``, are passed through to ``fan_out()``. See the ``fanout``
+            Module for their effects.
+
+        In a Cluster, a Notification sent to every Remote is also passed on to
+            the Clients of every other Node, though the Report covers only the
+            Remotes of this one.
+        """
+        broadcast_all = targets is None
+        targets = list(self.remotes if targets is None else targets)
+        echo(
+            "cast",
+            f"Broadcasting {hl_method(meth)} {'Request' if request else 'Notif'} to"
+            f" {len(targets)} Remote{'' if len(targets) == 1 else 's'}.",
+        )
+
+        if request:
+            report = await fan_out(
+                targets,
+                lambda remote: request_on(
+                    remote, meth, params, nohandle=True, quiet=True
+                ),
+                **options,
+            )
+            self._fan_out_warn(meth, report)
+            return report
+        else:
+            text = bytes(compose(Notification, meth, params))
+            if self.cluster is not None and broadcast_all:
+                self.cluster.broadcast(meth, text)
+            return await self._fan_out(targets, meth, text, lane, **options)
+
+    async def scatter(
+        self,
+        meth: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        targets: Iterable[Remote] = None,
+        first: int = None,
+        quorum: bool = False,
+        timeout: float = None,
+        errors: bool = False,
+        cancel: bool = True,
+        **options,
+    ) -> AsyncIterator[Tuple[Remote, Any]]:
+        """Send a Request to every connected Remote, or to every Remote in
+            ``targets``, and yield each Remote with its Result as soon as it
+            arrives.
+
+        If ``first`` is given, stop after that many Results; If ``quorum`` is
+            True, stop after Results from a majority of the Remotes that were
+            sent the Request. If ``timeout`` is given, stop after that many
+            seconds. When stopping, the Requests still outstanding are
+            cancelled, unless ``cancel`` is False. Failed Requests are passed
+            over, unless ``errors`` is True, in which case they are yielded
+            with their Exceptions.
+
+        Other Keyword Options are passed through to ``fan_out()``.
+        """
+        report = await self.broadcast(
+            meth, params, request=True, targets=targets, **options
+        )
+
+        if quorum:
+            needed = len(report.sent) // 2 + 1
+            first = needed if first is None else min(first, needed)
+
+        async for remote, result in as_completed(
+            report.sent, first=first, timeout=timeout, errors=errors, cancel=cancel
+        ):
+            yield remote, result
+
+    def route(self, to: str) -> Union[Remote, "NodeRoute"]:
+        """Find the connected Remote with a given ID. In a Cluster, a Remote on
+            another Node is found as a ``NodeRoute``, which passes Messages on
+            to that Node.
+
+        :raises KeyError: If no Remote with the ID is connected.
+        """
+        remote = self.remotes.get(to)
+        if remote is not None and remote.open:
+            return remote
+        elif self.cluster is not None:
+            return self.cluster.route(to)
+        else:
+            raise KeyError(f"No Remote with ID {to!r}")
+
+    async def relay(
+        self,
+        to: str,
+        meth: str,
+        params: Union[dict, list, tuple] = None,
+        *,
+        request: bool = False,
+        timeout: float = 0,
+    ) -> Any:
+        """Send a Message to the connected Remote with a given ID.
+
+        If ``request`` is True, a Request is sent, and the Future of its
+            Response is returned, or the Result itself if ``timeout`` is given.
+            Otherwise, a Notification is sent, and None is returned.
+
+        Clients reach each other the same way: They ask the Server, with a
+            ``RELAY.REQ`` Request or a ``RELAY.NOTIF`` Notification, to pass a
+            Message on. Those Messages are forwarded without being decoded.
+
+        :raises KeyError: If no Remote with the ID is connected.
+        """
+        remote = self.route(to)
+        if request:
+            ret = await request_on(remote, meth, params, timeout=timeout)
+            return await ret if timeout > 0 else ret
+        else:
+            await run_on(remote.eventloop, remote.notif(meth, params))
+
+    @staticmethod
+    async def _forward(target: Remote, msg: LazyMessage, timeout: float) -> Any:
+        """Forward a Message, and wait for the Result, on the Loop of the target."""
+        ret = await target.forward(msg, timeout=timeout)
+        return await ret if isawaitable(ret) else ret
+
+    async def _fan_out(
+        self, targets: Iterable[Remote], meth: str, text: bytes, lane: int, **options
+    ) -> FanoutReport:
+        """Send the same serialized Notification to many Remotes."""
+
+        def send(remote: Remote):
+            remote.total_sent["notif"] += 1
+            return run_on(
+                remote.eventloop,
+                remote.send_text(text, remote.lane(meth) if lane is None else lane),
+            )
+
+        report = await fan_out(targets, send, **options)
+        self._fan_out_warn(meth, report)
+        return report
+
+    @staticmethod
+    def _fan_out_warn(meth: str, report: FanoutReport) -> None:
+        if report.skipped:
+            warn(
+                f"Skipped {len(report.skipped)} slow Remote(s) for {meth!r}:",
+                ", ".join(map(repr, report.skipped)),
+            )
+        if report.failed:
+            warn(
+                f"Failed to send {meth!r} to {len(report.failed)} Remote(s):",
+                ", ".join(map(repr, report.failed)),
+            )
+
     async def bcast_request(
         self, meth: str, params: Union[dict, list, tuple] = None, **kw,
     ) -> Dict[Remote, Future]:
@@ -196,7 +606,8 @@ class Server:
 
         Unlike ``bcast_notif()``, this Method will await sending the Message.
             The objects returned are the Futures which will receive the
-            Responses from the Remote.
+            Responses from the Remote. To act on the Responses as they arrive,
+            use ``scatter()`` instead.
         """
         echo(
             "cast",
@@ -207,9 +618,7 @@ class Server:
             return {}
 
         tasks: Dict[Remote, Task] = {
-            remote: self.eventloop.create_task(
-                remote.request(meth, params, quiet=True, **kw)
-            )
+            remote: ensure_future(request_on(remote, meth, params, quiet=True, **kw))
             for remote in self.remotes
         }
         await gather(*tasks.values(), return_exceptions=True)
@@ -219,15 +628,21 @@ class Server:
         }
 
     def drop(self, remote: Remote):
-        if remote in self.remotes:
-            self.remotes.remove(remote)
-            self.total_sent.update(remote.total_sent)
-            self.total_recv.update(remote.total_recv)
+        with self.lock:
+            if remote in self.remotes:
+                self.remotes.remove(remote)
+                self.total_sent.update(remote.total_sent)
+                self.total_recv.update(remote.total_recv)
+                self.total_expired += remote.expired
+            self.topics.discard(remote)
 
     async def terminate(self, reason: str = "Server Closing"):
+        if self.cluster is not None:
+            await self.cluster.close()
+
         for remote in list(self.remotes):
             try:
-                await remote.terminate(reason)
+                await run_on(remote.eventloop, remote.terminate(reason))
             except Exception as e:
                 warn(f"Unknown Error from {remote!r}:", e)
             finally:
@@ -235,30 +650,45 @@ class Server:
 
         self.remotes.clear()
 
-        if self.server.is_serving():
+        if self.server is not None:
+            # Close it even if it has stopped serving, so that any Shards stop.
             self.server.close()
             await self.server.wait_closed()
 
         self.server = None
+        # Let go of the Threads and Processes which ran Hooks, unless another
+        #   Server or Client is still using them.
+        release(self)
         echo("dcon", "Server closed.")
 
     async def open_connection(self, str_in: StreamReader, str_out: StreamWriter):
-        """Callback executed by AsyncIO when a Client contacts the Server."""
-        remote = Remote(self.eventloop, str_in, str_out, rtype="Client")
+        """Callback executed by AsyncIO when a Client contacts the Server. With
+            Shards, this runs on the Loop of the Shard given the Connection.
+        """
+        loop = get_running_loop()
+        remote = Remote(
+            loop,
+            str_in,
+            str_out,
+            rtype="Client",
+            remote_id=self.remotes.new_id(),
+        )
         echo(
             "con", f"Incoming Connection from Client at {T.bold_green(remote.host)}.",
         )
-        self.total_clients += 1
+        with self.lock:
+            self.total_clients += 1
 
         # Update the Client Hooks with our own.
         remote.hooks_notif_inher = self.hooks_notif
         remote.hooks_request_inher = self.hooks_request
+        remote.priorities.update(self.priorities)
         remote.startup = self.startup
 
         self.remotes.add(remote)
         echo("diff", f"Client at {remote.host} has been assigned UUID {remote.id}.")
 
-        listening = self.eventloop.create_task(remote.loop(self.helpers))
+        listening = loop.create_task(remote.loop(self.helpers))
         self.listeners.add(listening)
 
         for hook in self.hooks_connection:
@@ -297,23 +727,100 @@ class Server:
             finally:
                 self.drop(remote)
 
-    async def run(self, loop=None):
+    async def run(self, loop=None, *, reuse_port: bool = False, shards: int = 1):
         """Server Coroutine. Does not setup or wrap the Server. Intended for use
             in instances where other things must be done, and the Server needs
             to be run properly asynchronously.
+
+        :param bool reuse_port: If this is True, bind the Port with
+            ``SO_REUSEPORT``, so that several Processes may listen on it at
+            once, as the Workers of ``start(workers=N)`` do.
+        :param int shards: If this is more than one, run the Remotes on this
+            many Event Loops, each in its own Thread, and hand each new
+            Connection to the next of them in turn. See the ``shards`` Module.
         """
         self.eventloop = loop or get_event_loop()
 
+        # Spawn the Workers of any Process Pools before any Requests arrive.
+        hold(self)
+        await warm()
+
         echo("info", f"Running Server on {self.addr}:{self.port}")
-        self.server = await start_server(
-            self.open_connection, self.addr, self.port, loop=self.eventloop
-        )
+        echo("info", f"JSON Backend: {BACKEND}")
+        if shards > 1:
+            self.server = ShardedListener(self, shards, reuse_port)
+        else:
+            self.server = await start_server(
+                self.open_connection, self.addr, self.port, reuse_port=reuse_port
+            )
         echo("win", "Ready to begin accepting Requests.")
         # noinspection PyUnresolvedReferences
         tsk = self.eventloop.create_task(self.server.serve_forever())
         tsk.add_done_callback(self.report)
         return tsk
 
+    def stats(self) -> Dict[str, Any]:
+        """Take a snapshot of the Statistics which ``report()`` shows, including
+            those of Remotes which are still connected, in a form which can be
+            pickled and given to ``merge()`` in another Process.
+        """
+        sent = self.total_sent.copy()
+        recv = self.total_recv.copy()
+        expired = self.total_expired
+        for remote in self.remotes:
+            sent.update(remote.total_sent)
+            recv.update(remote.total_recv)
+            expired += remote.expired
+
+        return {
+            "clients": self.total_clients,
+            "sent": dict(sent),
+            "recv": dict(recv),
+            "expired": expired,
+            "bulkheads": {
+                name: (bh.admitted, bh.queued, bh.rejected, bh.wait_total)
+                for name, bh in self.bulkheads.items()
+            },
+            "caches": {
+                method: (cache.hits, cache.misses, cache.evictions)
+                for method, cache in self.caches.items()
+            },
+            "flights": {
+                method: (flights.led, flights.joined)
+                for method, flights in self.flights.items()
+            },
+        }
+
+    def merge(self, stats: Dict[str, Any]):
+        """Add a snapshot from ``stats()``, usually taken in a Worker Process,
+            onto the Statistics of this Server, so that ``report()`` shows them.
+        """
+        self.total_clients += stats["clients"]
+        self.total_sent.update(stats["sent"])
+        self.total_recv.update(stats["recv"])
+        self.total_expired += stats["expired"]
+
+        for name, counts in stats["bulkheads"].items():
+            if name in self.bulkheads:
+                admitted, queued, rejected, waited = counts
+                bh = self.bulkheads[name]
+                bh.admitted += admitted
+                bh.queued += queued
+                bh.rejected += rejected
+                bh.wait_total += waited
+
+        for method, (hits, misses, evictions) in stats["caches"].items():
+            if method in self.caches:
+                cache = self.caches[method]
+                cache.hits += hits
+                cache.misses += misses
+                cache.evictions += evictions
+
+        for method, (led, joined) in stats["flights"].items():
+            if method in self.flights:
+                self.flights[method].led += led
+                self.flights[method].joined += joined
+
     def report(self, *_):
         try:
             echo(
@@ -337,17 +844,85 @@ class Server:
                     for k, v in self.total_recv.items()
                 ],
             )
+            if self.total_expired:
+                echo(
+                    "info",
+                    f"Dropped {self.total_expired} Request"
+                    f"{'' if self.total_expired == 1 else 's'} past Deadline.",
+                )
+            if self.bulkheads:
+                echo("info", "Admission:")
+                echo(
+                    "tab",
+                    [
+                        f"> {name}: {bh.admitted} Admitted, {bh.queued} Queued"
+                        f" ({bh.stats()['wait_mean']:.3f}s mean wait),"
+                        f" {bh.rejected} Rejected"
+                        for name, bh in self.bulkheads.items()
+                    ],
+                )
+            if self.caches:
+                echo("info", "Caches:")
+                echo(
+                    "tab",
+                    [
+                        f"> {method}: {cache.hits} Hits, {cache.misses} Misses,"
+                        f" {cache.evictions} Evictions"
+                        for method, cache in self.caches.items()
+                    ],
+                )
+            if self.flights:
+                echo("info", "Coalesced:")
+                echo(
+                    "tab",
+                    [
+                        f"> {method}: {flights.led} Run, {flights.joined} Joined"
+                        for method, flights in self.flights.items()
+                    ],
+                )
+            if self.cluster is not None:
+                cluster = self.cluster
+                echo(
+                    "info",
+                    f"Cluster: Node {cluster.node}, {len(cluster.links)} Link(s),"
+                    f" {cluster.forwarded} Forwarded in {cluster.batches} Batches,"
+                    f" {cluster.delivered} Delivered, {cluster.duplicates}"
+                    f" Duplicate(s) dropped, {cluster.refused} Refused.",
+                )
+            if self.topics.subscriptions:
+                echo(
+                    "info",
+                    f"Topics: {len(self.topics)} Subscription(s) from"
+                    f" {len(self.topics.subscriptions)} Remote(s).",
+                )
         except:
             pass
 
-    def start(self, *a, **kw):
+    def start(self, *a, workers: int = 1, shards: int = 1, **kw):
         """Run alone and do nothing else. For very simple implementations that
             do not need to do anything else at the same time.
+
+        :param int workers: If this is more than one, fork this many Worker
+            Processes, each running its own copy of the Server on the same
+            Port, and restart any which die. Hooks must be registered before
+            this is called, so that the Workers inherit them.
+        :param int shards: If this is more than one, each Server runs its
+            Remotes on this many Event Loops, in as many Threads.
         """
         self.setup(*a, **kw)
 
+        if workers > 1:
+            from .workers import Supervisor
+
+            Supervisor(self, workers, shards=shards).run()
+            return
+
+        async def serve():
+            # Keep the Loop running for as long as the Server is serving.
+            await (await self.run(shards=shards))
+
         try:
-            run(self.run())
+            run(serve())
         except KeyboardInterrupt:
             err("INTERRUPTED. Server closing...")
             run(self.terminate("Server Interrupted"))
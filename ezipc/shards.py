@@ -0,0 +1,190 @@
+"""Module providing Shards, which let one Server run several Event Loops, each in
+    a Thread of its own, within one Process.
+
+The Loop which runs the Server accepts every Connection, and hands each one to
+    the next Shard in turn. From then on, the Remote made for the Connection,
+    its Helpers, and the Hooks which it calls all run on the Loop of that Shard.
+    Only one Thread can run Python at a time, so this helps only where Hooks
+    spend their time outside of Python, such as in compression, cryptography or
+    I/O, which release the Global Interpreter Lock. Unlike separate Processes,
+    the Shards share every Cache, Bulkhead and Hook in one Address Space.
+
+A Remote may only be used on its own Loop. Anything which reaches Remotes on
+    other Shards, such as a Broadcast or a Relay, must go through ``run_on()``
+    or ``request_on()``, which hand the work to the right Loop if it is not the
+    one running.
+"""
+
+from asyncio import (
+    AbstractEventLoop,
+    all_tasks,
+    current_task,
+    gather,
+    get_running_loop,
+    new_event_loop,
+    open_connection,
+    run_coroutine_threadsafe,
+    Task,
+    wrap_future,
+)
+from inspect import isawaitable
+from itertools import cycle
+from socket import AF_INET, SO_REUSEADDR, socket, SOL_SOCKET
+from threading import Thread
+from typing import Any, Awaitable, Coroutine, List, Optional, TYPE_CHECKING, Union
+
+from .util import echo, err
+
+if TYPE_CHECKING:
+    from .remote import Remote
+    from .server import Server
+
+
+def on_loop(loop: AbstractEventLoop) -> bool:
+    """Check whether a Loop is the one running in this Thread."""
+    try:
+        return get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+def run_on(loop: AbstractEventLoop, coro: Coroutine) -> Awaitable:
+    """Run a Coroutine on a Loop, which may belong to another Thread. Return
+        something which the running Loop can await for its Result.
+    """
+    if on_loop(loop):
+        return coro
+    else:
+        return wrap_future(run_coroutine_threadsafe(coro, loop))
+
+
+async def request_on(
+    remote: "Remote", meth: str, params: Union[dict, list, tuple] = None, **kw
+) -> Awaitable:
+    """Send a Request through a Remote, which may belong to another Loop, and
+        return something which the running Loop can await for its Result.
+    """
+    if on_loop(remote.eventloop):
+        ret = await remote.request(meth, params, **kw)
+        if not isawaitable(ret):
+            done = remote.eventloop.create_future()
+            done.set_result(ret)
+            ret = done
+        return ret
+
+    async def ask():
+        ret = await remote.request(meth, params, **kw)
+        return await ret if isawaitable(ret) else ret
+
+    return wrap_future(run_coroutine_threadsafe(ask(), remote.eventloop))
+
+
+class Shard(Thread):
+    """A Thread running an Event Loop, on which some of the Remotes of a Server
+        are run.
+    """
+
+    def __init__(self, server: "Server", number: int):
+        super().__init__(name=f"ezipc-shard-{number}", daemon=True)
+        self.server: "Server" = server
+        self.loop: AbstractEventLoop = new_event_loop()
+        self.number: int = number
+
+    def __repr__(self) -> str:
+        return f"<Shard {self.number}>"
+
+    def run(self):
+        self.loop.run_forever()
+
+        # Close the Loop in the Thread which ran it.
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+    def adopt(self, sock: socket):
+        """Take over a Connection accepted by another Thread."""
+        run_coroutine_threadsafe(self.serve(sock), self.loop)
+
+    async def serve(self, sock: socket):
+        try:
+            str_in, str_out = await open_connection(sock=sock)
+        except Exception as e:
+            err(f"{self!r} failed to take a Connection:", e)
+            sock.close()
+        else:
+            await self.server.open_connection(str_in, str_out)
+
+    async def _halt(self):
+        tasks = [t for t in all_tasks() if t is not current_task()]
+        for task in tasks:
+            task.cancel()
+        await gather(*tasks, return_exceptions=True)
+        self.loop.stop()
+
+    def halt(self):
+        """Cancel everything on the Loop, and stop it. The Thread then ends."""
+        if not self.loop.is_closed():
+            run_coroutine_threadsafe(self._halt(), self.loop)
+
+
+class ShardedListener:
+    """Accepts Connections on one Loop, and hands them to several Shards in turn.
+        Stands in for the ``AbstractServer`` which ``start_server()`` returns.
+
+    :param Server server: The Server whose Connections these are.
+    :param int count: The number of Shards to start.
+    :param bool reuse_port: If this is True, bind the Port with
+        ``SO_REUSEPORT``, as ``start_server()`` would.
+    """
+
+    def __init__(self, server: "Server", count: int, reuse_port: bool = False):
+        if count < 1:
+            raise ValueError("A Server must have at least one Shard.")
+
+        self.sock: socket = socket(AF_INET)
+        self.sock.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        if reuse_port:
+            # Not available on every Platform.
+            from socket import SO_REUSEPORT
+
+            self.sock.setsockopt(SOL_SOCKET, SO_REUSEPORT, 1)
+        self.sock.bind((server.addr, server.port))
+        self.sock.listen(100)
+        self.sock.setblocking(False)
+
+        self.serving: Optional[Task] = None
+
+        self.shards: List[Shard] = [Shard(server, i) for i in range(count)]
+        for shard in self.shards:
+            shard.start()
+        self._next = cycle(self.shards)
+
+        echo("info", f"Running {count} Shards.")
+
+    @property
+    def sockets(self) -> List[socket]:
+        return [self.sock]
+
+    def is_serving(self) -> bool:
+        return self.serving is not None
+
+    async def serve_forever(self) -> Any:
+        loop = get_running_loop()
+        self.serving = current_task()
+        try:
+            while True:
+                conn, _ = await loop.sock_accept(self.sock)
+                next(self._next).adopt(conn)
+        finally:
+            self.serving = None
+
+    def close(self):
+        if self.serving is not None:
+            self.serving.cancel()
+        self.sock.close()
+        for shard in self.shards:
+            shard.halt()
+
+    async def wait_closed(self):
+        loop = get_running_loop()
+        for shard in self.shards:
+            await loop.run_in_executor(None, shard.join)
@@ -0,0 +1,209 @@
+"""Module providing a Supervisor, which runs a Server in several Worker Processes.
+
+Every Worker is forked from the Supervisor after the Server has been set up, so
+    it inherits every Hook, Cache and Bulkhead already registered, including
+    those which could not be pickled. Each Worker then binds the same Port with
+    ``SO_REUSEPORT``, and the Kernel spreads incoming Connections among them,
+    so that a busy Server can use more than one Core.
+
+Workers share nothing once they are forked. A Client is only ever connected to
+    one of them, so Broadcasts, Topics and Relays reach only the Clients of the
+    Worker which sends them.
+
+Each Worker sends the Supervisor a snapshot of its Statistics every few seconds,
+    and once more when it stops. A Worker which dies is started again, and when
+    the Supervisor stops, the last snapshot from every Worker, living or dead,
+    is added up and reported as though from one Server.
+"""
+
+from asyncio import get_running_loop, run, wait
+from multiprocessing import current_process, get_context
+from os import getpid
+from queue import Empty
+from signal import SIGINT, signal, SIGTERM
+from socket import SO_REUSEPORT  # Not available on every Platform.
+from time import monotonic
+from typing import Any, Dict, TYPE_CHECKING
+
+from .remote.executors import hold, release
+from .util import echo, err, warn
+
+if TYPE_CHECKING:
+    from .server import Server
+
+
+# The number of seconds between snapshots of the Statistics of each Worker.
+INTERVAL: float = 5.0
+# The least number of seconds between restarts of the same Worker, so that a
+#   Worker which dies as soon as it starts does not spin.
+RESTART_DELAY: float = 1.0
+
+
+def _worker(server: "Server", queue, interval: float, shards: int) -> None:
+    """The Main Function of a Worker Process."""
+
+    async def main():
+        loop = get_running_loop()
+        stop = loop.create_future()
+
+        def interrupt():
+            if not stop.done():
+                stop.set_result(None)
+
+        for sig in (SIGINT, SIGTERM):
+            loop.add_signal_handler(sig, interrupt)
+
+        serving = await server.run(reuse_port=True, shards=shards)
+        # The Supervisor reports for every Worker together.
+        serving.remove_done_callback(server.report)
+
+        try:
+            while not stop.done():
+                await wait((stop, serving), timeout=interval)
+                if serving.done():
+                    # Stopped serving without being told to. Let the Supervisor
+                    #   start another Worker.
+                    raise RuntimeError("Worker stopped serving.")
+                queue.put((getpid(), server.stats()))
+        finally:
+            serving.cancel()
+            await server.terminate("Server Closing")
+            queue.put((getpid(), server.stats()))
+
+    # The Worker itself holds the Pools which run Hooks, so that they outlive
+    #   the Server, and are waited for before it exits. A forked Process exits
+    #   without joining the Threads which would otherwise stop the Pools, and
+    #   could leave their Processes behind.
+    hold(current_process())
+    try:
+        run(main())
+    finally:
+        release(current_process(), wait=True)
+
+
+class Supervisor:
+    """Runs a Server which has already been set up in several Worker Processes,
+        restarting any which die, until it is interrupted.
+
+    :param Server server: The Server to run. It should already have been set up.
+    :param int workers: The number of Worker Processes to keep running.
+    :param float interval: The number of seconds between snapshots of the
+        Statistics of each Worker.
+    :param int shards: The number of Event Loop Threads in each Worker.
+    """
+
+    __slots__ = (
+        "context",
+        "interval",
+        "latest",
+        "procs",
+        "queue",
+        "server",
+        "shards",
+        "workers",
+    )
+
+    def __init__(
+        self,
+        server: "Server",
+        workers: int,
+        interval: float = INTERVAL,
+        *,
+        shards: int = 1,
+    ):
+        if workers < 1:
+            raise ValueError("A Supervisor must run at least one Worker.")
+
+        # Forking, rather than spawning, is what lets the Workers inherit Hooks
+        #   which cannot be pickled.
+        self.context = get_context("fork")
+        self.server: "Server" = server
+        self.workers: int = workers
+        self.interval: float = interval
+        self.shards: int = shards
+
+        self.procs: Dict[int, Any] = {}
+        self.queue = self.context.Queue()
+        # PID -> The last snapshot of the Statistics of the Worker.
+        self.latest: Dict[int, Dict[str, Any]] = {}
+
+    def spawn(self, slot: int) -> None:
+        # Not a Daemon, since a Daemon cannot start the Processes of a Process
+        #   Pool. Instead, ``stop()`` ends every Worker.
+        proc = self.context.Process(
+            target=_worker,
+            args=(self.server, self.queue, self.interval, self.shards),
+            name=f"ezipc-worker-{slot}",
+        )
+        proc.start()
+        self.procs[slot] = proc
+        echo("con", f"Started Worker {slot} (PID {proc.pid}).")
+
+    def collect(self, timeout: float = 0) -> None:
+        """Receive any snapshots which the Workers have sent."""
+        try:
+            while True:
+                pid, stats = self.queue.get(timeout=timeout)
+                self.latest[pid] = stats
+                timeout = 0
+        except Empty:
+            pass
+
+    def run(self) -> None:
+        """Start the Workers, and keep them running until interrupted."""
+        started: Dict[int, float] = {}
+        stopping = False
+
+        def stop(*_):
+            nonlocal stopping
+            stopping = True
+
+        previous = {sig: signal(sig, stop) for sig in (SIGINT, SIGTERM)}
+
+        try:
+            # The Workers are not Daemons, so whatever happens from here on,
+            #   they must be stopped before this returns.
+            for slot in range(self.workers):
+                self.spawn(slot)
+                started[slot] = monotonic()
+
+            while not stopping:
+                self.collect(0.5)
+
+                for slot, proc in list(self.procs.items()):
+                    if stopping or proc.is_alive():
+                        continue
+                    if monotonic() - started[slot] < RESTART_DELAY:
+                        continue
+
+                    warn(
+                        f"Worker {slot} (PID {proc.pid}) exited with Code"
+                        f" {proc.exitcode}. Restarting it."
+                    )
+                    self.spawn(slot)
+                    started[slot] = monotonic()
+
+        finally:
+            for sig, handler in previous.items():
+                signal(sig, handler)
+            self.stop()
+
+    def stop(self, timeout: float = 10) -> None:
+        """Tell every Worker to stop, wait for them, and report for all of them."""
+        echo("dcon", "Stopping Workers...")
+        for proc in self.procs.values():
+            if proc.is_alive():
+                proc.terminate()
+
+        deadline = monotonic() + timeout
+        for proc in self.procs.values():
+            proc.join(max(deadline - monotonic(), 0))
+            if proc.is_alive():
+                err(f"Worker PID {proc.pid} did not stop in time. Killing it.")
+                proc.kill()
+                proc.join()
+
+        self.collect()
+        for stats in self.latest.values():
+            self.server.merge(stats)
+        self.server.report()
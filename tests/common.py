@@ -0,0 +1,67 @@
+"""Utilities shared by the Tests.
+
+There is no AsyncIO Plugin for the Test Runner, so every Test is a plain
+    Function which runs its own Coroutine with ``asyncio.run()``.
+"""
+
+from asyncio import (
+    AbstractEventLoop,
+    get_running_loop,
+    open_connection,
+    start_server,
+    Task,
+)
+from typing import List, Tuple
+
+from ezipc.remote import Remote
+from ezipc.server import Server
+from ezipc.util import set_verbosity
+
+
+set_verbosity(0)
+
+
+async def pair(helpers: int = 5) -> Tuple[Remote, Remote, List[Task]]:
+    """Connect two Remotes to each other over the Loopback Interface. The first
+        plays the part of a Client, and the second that of a Server. Also return
+        the Tasks which run them.
+    """
+    loop: AbstractEventLoop = get_running_loop()
+    accepted = loop.create_future()
+
+    server = await start_server(
+        lambda r, w: accepted.set_result((r, w)), "127.0.0.1", 0
+    )
+    port = server.sockets[0].getsockname()[1]
+
+    instr, outstr = await open_connection("127.0.0.1", port)
+    client = Remote(loop, instr, outstr, rtype="Server", remote_id="SRV")
+    server_side = Remote(loop, *await accepted, rtype="Client", remote_id="CLI")
+    server.close()
+
+    tasks = [
+        loop.create_task(client.loop(helpers)),
+        loop.create_task(server_side.loop(helpers)),
+    ]
+    return client, server_side, tasks
+
+
+async def serve(server: Server, **kw) -> int:
+    """Set up a Server and run it on a free Port, which is returned."""
+    server.port = 0
+    server.setup()
+    await server.run(**kw)
+    return server.server.sockets[0].getsockname()[1]
+
+
+async def connect(port: int, helpers: int = 5) -> Tuple[Remote, str, Task]:
+    """Connect a bare Remote to a Server, as a Client would. Return it, the ID
+        which the Server gave it, and the Task which runs it.
+    """
+    loop: AbstractEventLoop = get_running_loop()
+    remote = Remote(
+        loop, *await open_connection("127.0.0.1", port), rtype="Server"
+    )
+    task = loop.create_task(remote.loop(helpers))
+    info = await remote.request("ETC.INIT", [], timeout=5)
+    return remote, info["id"], task
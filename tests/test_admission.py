@@ -0,0 +1,94 @@
+from asyncio import gather, run, sleep
+
+from ezipc.remote.admission import Bulkhead
+
+from .common import pair
+
+
+def test_limit_and_queue():
+    async def main():
+        client, server, tasks = await pair()
+        bulkhead = Bulkhead(1, 1, "SLOW")
+
+        @server.hook_request("SLOW", bulkhead=bulkhead)
+        async def slow(data):
+            await sleep(0.05)
+            return [1]
+
+        results = await gather(
+            *(client.request("SLOW", [], timeout=5) for _ in range(3)),
+            return_exceptions=True,
+        )
+        # One runs, one waits for it, and the third is turned away.
+        assert sorted(map(repr, results)).count("[1]") == 2
+        assert bulkhead.stats()["rejected"] == 1
+        assert bulkhead.active == 0
+
+    run(main())
+
+
+def test_generator_holds_place():
+    async def main():
+        client, server, tasks = await pair()
+        bulkhead = Bulkhead(1, 0, "GEN")
+        running = []
+
+        @server.hook_request("GEN", bulkhead=bulkhead)
+        async def gen(data):
+            running.append(bulkhead.active)
+            for i in range(3):
+                await sleep(0.01)
+                yield i
+
+        # Without streaming, the first value is the Result.
+        assert await client.request("GEN", [], timeout=5) == [0]
+        # The rest of the Generator is run through after the Response is sent.
+        await sleep(0.1)
+        assert bulkhead.active == 0
+
+        # When streamed, every value arrives, and the place is held meanwhile.
+        parts = [part async for part in await client.request_stream("GEN", [])]
+        assert parts == [0, 1, 2]
+        assert running == [1, 1]
+
+        await sleep(0.1)
+        assert bulkhead.active == 0
+
+    run(main())
+
+
+def test_sync_generator_holds_place():
+    async def main():
+        client, server, tasks = await pair()
+        bulkhead = Bulkhead(1, 0, "GEN")
+
+        @server.hook_request("GEN", bulkhead=bulkhead)
+        def gen(data):
+            yield from range(3)
+
+        parts = [part async for part in await client.request_stream("GEN", [])]
+        assert parts == [0, 1, 2]
+        await sleep(0.05)
+        assert bulkhead.active == 0
+
+    run(main())
+
+
+def test_held_closed_before_start():
+    async def main():
+        bulkhead = Bulkhead(1, 1)
+
+        async def gen():
+            yield 1
+
+        first = bulkhead.hold(bulkhead.admit(), gen())
+        second = bulkhead.hold(bulkhead.admit(), gen())
+        assert bulkhead.active == 1 and bulkhead.waiting == 1
+
+        # Closing a Generator which never ran still gives up its place, or
+        #   its place in line.
+        await second.aclose()
+        await first.aclose()
+        assert bulkhead.active == 0 and bulkhead.waiting == 0
+
+    run(main())
@@ -0,0 +1,102 @@
+from asyncio import run, sleep, TimeoutError
+
+import pytest
+
+from ezipc.remote.exc import RemoteError
+from ezipc.remote.protocol import compose, JRPC, LazyMessage, Rejected, Request
+
+from .common import pair
+
+
+def test_budget_on_the_wire():
+    request = compose(Request, "WORK", [], mid="q1")
+    assert request.remaining is None and not request.expired
+
+    request.set_budget(2)
+    assert dict(request)["budget"] <= 2
+    assert 0 < request.remaining <= 2
+
+    with pytest.raises(ValueError):
+        request.set_budget(-1)
+
+    decoded = next(iter(JRPC.decode(bytes(request))))
+    assert 0 < decoded.remaining <= 2
+
+
+def test_handler_sees_deadline():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("LEFT")
+        def left(data, remote, request):
+            return [request.remaining]
+
+        (remaining,) = await client.request("LEFT", [], timeout=2)
+        assert 1 < remaining <= 2
+
+        # Without a timeout, there is no Deadline.
+        assert await (await client.request("LEFT", [])) == [None]
+
+    run(main())
+
+
+def test_expired_request_dropped():
+    async def main():
+        client, server, tasks = await pair(helpers=1)
+        ran = []
+
+        @server.hook_request("HOG")
+        async def hog(data):
+            await sleep(0.3)
+            return [1]
+
+        @server.hook_request("QUICK")
+        def quick(data):
+            ran.append(data)
+            return [2]
+
+        hogging = await client.request("HOG", [])
+        await sleep(0.05)
+
+        # This waits behind the only Helper until long after its Deadline.
+        with pytest.raises(TimeoutError):
+            await client.request("QUICK", [1], timeout=0.1)
+
+        assert await hogging == [1]
+        await sleep(0.05)
+        assert ran == [] and server.expired == 1
+
+    run(main())
+
+
+def test_expired_and_invalid_answered():
+    async def main():
+        client, server, tasks = await pair()
+        ran = []
+        server.hooks_request["QUICK"] = lambda data, _: ran.append(data)
+
+        def raw(budget) -> LazyMessage:
+            return LazyMessage(
+                '{"jsonrpc":"2.0","method":"QUICK","budget":%s,"params":[],'
+                '"id":"%s"}' % (budget, client._id_new())
+            )
+
+        # Neither is run, but each is answered, rather than left to time out.
+        with pytest.raises(RemoteError) as e:
+            await client.forward(raw(0), timeout=5)
+        assert e.value.code == -32002
+
+        with pytest.raises(RemoteError) as e:
+            await client.forward(raw(-1), timeout=5)
+        assert e.value.code == -32600
+        assert ran == []
+
+    run(main())
+
+
+def test_invalid_budget_decoded():
+    (rejected,) = JRPC.decode(
+        b'{"jsonrpc":"2.0","method":"M","budget":"soon","params":[],"id":"b1"}'
+    )
+    assert isinstance(rejected, Rejected)
+    assert rejected.request.id == "b1" and rejected.error.code == -32600
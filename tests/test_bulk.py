@@ -0,0 +1,98 @@
+from asyncio import gather, run, sleep, TimeoutError
+
+import pytest
+
+from .common import pair
+
+
+def test_request_many():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("ECHO")
+        def echo(data):
+            return data
+
+        @server.hook_request("FAIL")
+        def fail(data):
+            raise ValueError("no")
+
+        before = client.connection.frames_sent
+        futures = await client.request_many(
+            [("ECHO", [i]) for i in range(50)] + [("FAIL", [])]
+        )
+        # Everything went out in one Frame, and every ID is unique.
+        assert client.connection.frames_sent - before == 1
+        results = await gather(*futures, return_exceptions=True)
+        assert results[:50] == [[i] for i in range(50)]
+        assert isinstance(results[50], Exception)
+        assert not client.futures
+
+        # Too many to fit into one Frame.
+        client.batch_bytes = 100
+        before = client.connection.frames_sent
+        futures = await client.request_many([("ECHO", [i]) for i in range(50)])
+        assert await gather(*futures) == [[i] for i in range(50)]
+        assert client.connection.frames_sent - before > 1
+
+        assert await client.request_many([]) == []
+
+    run(main())
+
+
+def test_request_many_timeout():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            await sleep(data[0])
+            return data
+
+        futures = await client.request_many([("SLOW", [0.01])] * 2, timeout=1)
+        assert await gather(*futures) == [[0.01]] * 2
+
+        # The Futures are returned even though they will not be answered in time.
+        futures = await client.request_many([("SLOW", [1])] * 2, timeout=0.2)
+        for future in futures:
+            with pytest.raises(TimeoutError):
+                await future
+        assert not client.futures
+
+    run(main())
+
+
+def test_request_each():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            await sleep(data[0])
+            return data
+
+        order = [
+            index
+            async for index, future in client.request_each(
+                [("SLOW", [0.2]), ("SLOW", [0]), ("SLOW", [0.1])]
+            )
+        ]
+        assert sorted(order) == [0, 1, 2]
+
+    run(main())
+
+
+def test_notif_many():
+    async def main():
+        client, server, tasks = await pair()
+        got = []
+        server.hooks_notif["NOTE"] = lambda data, _: got.append(data.params[0])
+
+        before = client.connection.frames_sent
+        await client.notif_many([("NOTE", [i]) for i in range(20)])
+        assert client.connection.frames_sent - before == 1
+
+        await sleep(0.1)
+        assert sorted(got) == list(range(20))
+
+    run(main())
@@ -0,0 +1,161 @@
+from asyncio import run, sleep
+
+import pytest
+
+from ezipc.remote.cache import cache_key, cacheable, MISSING, ResultCache
+from ezipc.remote.exc import RemoteError
+from ezipc.remote.protocol import Error
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+def test_key_ignores_order():
+    assert cache_key("M", {"a": 1, "b": 2}) == cache_key("M", {"b": 2, "a": 1})
+    assert cache_key("M", None) == cache_key("M", ()) == cache_key("M", [])
+    assert cache_key("M", [1]) != cache_key("N", [1])
+
+    assert cacheable([1]) and cacheable({})
+    assert not cacheable(Error(1, "no")) and not cacheable(ValueError())
+
+
+def test_lru_and_ttl():
+    cache = ResultCache(maxsize=2)
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    # "b" is now the least recently used, so it goes first.
+    cache.put("c", 3)
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "hits": 3, "misses": 1, "evictions": 1}
+
+    cache.put("d", 4, ttl=-1)
+    assert cache.get("d") is MISSING
+    assert len(cache) == 1
+
+
+def test_invalidate():
+    cache = ResultCache()
+    for meth in "MN":
+        for n in range(3):
+            cache.put(cache_key(meth, [n]), n)
+
+    assert cache.invalidate("M", [0]) == 1
+    assert cache.invalidate("M", [0]) == 0
+    assert cache.invalidate("M") == 2
+    assert cache.invalidate() == 3
+    assert not cache
+
+
+def test_stale_result_not_stored():
+    async def main():
+        cache = ResultCache()
+
+        async def slow():
+            await sleep(0.05)
+            return [1]
+
+        filling = cache.fill("k", slow())
+        # Invalidated while the Result was still being worked out.
+        cache.invalidate()
+        assert await filling == [1]
+        assert cache.get("k") is MISSING
+
+        assert await cache.fill("k", slow()) == [1]
+        assert cache.get("k") == [1]
+
+    run(main())
+
+
+def test_server_caches_hook():
+    async def main():
+        server = Server("127.0.0.1")
+        calls = []
+
+        @server.hook_request("SQUARE", cache=(60, 8))
+        def square(data):
+            calls.append(data[0])
+            return [data[0] ** 2]
+
+        @server.hook_request("FAIL", cache=60)
+        def fail(data):
+            calls.append("fail")
+            raise ValueError("no")
+
+        port = await serve(server)
+        remote, _, _ = await connect(port)
+
+        for _ in range(3):
+            assert await remote.request("SQUARE", [3], timeout=5) == [9]
+        assert await remote.request("SQUARE", [4], timeout=5) == [16]
+        assert calls == [3, 4]
+        assert server.caches["SQUARE"].stats()["hits"] == 2
+
+        # Failures are not cached.
+        for _ in range(2):
+            with pytest.raises(RemoteError):
+                await remote.request("FAIL", [], timeout=5)
+        assert calls.count("fail") == 2
+
+        assert server.invalidate("SQUARE", [3]) == 1
+        assert await remote.request("SQUARE", [3], timeout=5) == [9]
+        assert calls == [3, 4, "fail", "fail", 3]
+
+        await server.terminate()
+
+    run(main())
+
+
+def test_client_caches_until_dropped():
+    async def main():
+        server = Server("127.0.0.1")
+        calls = []
+
+        @server.hook_request("GET", cache=60)
+        def get(data):
+            calls.append(data[0])
+            return [len(calls)]
+
+        @server.hook_request("OTHER")
+        def other(data):
+            calls.append("other")
+            return [0]
+
+        port = await serve(server)
+        remote, _, _ = await connect(port)
+        info = await remote.request("ETC.INIT", [], timeout=5)
+        assert info["cache"] == {"GET": 60}
+        remote.enable_cache(info["cache"], 16)
+
+        assert await remote.request("GET", ["a"], timeout=5) == [1]
+        # Answered from the Cache of the Client, without a round trip.
+        assert await remote.request("GET", ["a"], timeout=5) == [1]
+        assert await (await remote.request("GET", ["a"])) == [1]
+        assert remote.rcache.stats()["hits"] == 2
+
+        # Methods which the Server did not declare are never cached.
+        for _ in range(2):
+            await remote.request("OTHER", [], timeout=5)
+        assert calls == ["a", "other", "other"]
+
+        assert await remote.request("GET", ["b"], timeout=5) == [4]
+
+        # The Server drops one Result, and tells the Client to do the same.
+        assert server.invalidate("GET", ["a"]) == 1
+        await sleep(0.1)
+        assert await remote.request("GET", ["a"], timeout=5) == [5]
+        assert await remote.request("GET", ["b"], timeout=5) == [4]
+
+        server.invalidate("GET")
+        await sleep(0.1)
+        assert await remote.request("GET", ["b"], timeout=5) == [6]
+        assert calls == ["a", "other", "other", "b", "a", "b"]
+
+        await server.terminate()
+
+    run(main())
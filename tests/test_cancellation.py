@@ -0,0 +1,50 @@
+from asyncio import CancelledError, run, sleep, TimeoutError
+
+import pytest
+
+from .common import pair
+
+
+def test_timeout_cancels_handler():
+    async def main():
+        client, server, tasks = await pair()
+        outcome = []
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            try:
+                await sleep(5)
+            except CancelledError:
+                outcome.append("cancelled")
+                raise
+            outcome.append("finished")
+            return [1]
+
+        with pytest.raises(TimeoutError):
+            await client.request("SLOW", [], timeout=0.1)
+
+        await sleep(0.1)
+        assert outcome == ["cancelled"]
+        assert not server.inflight and not client.futures
+
+    run(main())
+
+
+def test_cancelled_future_cancels_handler():
+    async def main():
+        client, server, tasks = await pair()
+        started = []
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            started.append(True)
+            await sleep(5)
+
+        future = await client.request("SLOW", [])
+        await sleep(0.05)
+        future.cancel()
+        await sleep(0.1)
+
+        assert started and not server.inflight
+
+    run(main())
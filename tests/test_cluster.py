@@ -0,0 +1,215 @@
+from asyncio import run, sleep
+from threading import current_thread
+
+import pytest
+
+from ezipc.cluster import Cluster
+from ezipc.remote.exc import RemoteError
+from ezipc.remote.protocol import compose, Notification, Request
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+SECRET = "correct horse battery staple"
+
+
+async def node(name: str, secret: str = SECRET) -> Server:
+    server = Server("127.0.0.1")
+    Cluster(server, name, secret=secret)
+    server.port = await serve(server)
+    return server
+
+
+async def client(server: Server):
+    remote, rid, _ = await connect(server.port)
+    got = []
+    for meth in ("NEWS", "TOPIC.PUB"):
+        remote.hooks_notif[meth] = lambda data, _: got.append(data.params)
+    remote.hooks_request["WHO"] = lambda data, _: {"id": rid}
+    return remote, rid, got
+
+
+async def close(*servers: Server):
+    for server in servers:
+        await server.terminate()
+
+
+def test_triangle():
+    async def main():
+        a, b, c = [await node(name) for name in "ABC"]
+        await b.cluster.dial("127.0.0.1", a.port)
+        await c.cluster.dial("127.0.0.1", a.port)
+        await c.cluster.dial("127.0.0.1", b.port)
+        assert sorted(a.cluster.links) == ["B", "C"]
+        # Links are not counted among the Clients.
+        assert not a.remotes and not b.remotes
+
+        clients = [await client(server) for server in (a, b, c)]
+        assert [rid[0] for _, rid, _ in clients] == ["A", "B", "C"]
+        await clients[2][0].request("TOPIC.SUB", ["sport.*"], timeout=5)
+
+        await a.broadcast("NEWS", ["x"])
+        await b.publish("sport.f1", {"lap": 1})
+        await sleep(0.2)
+
+        # Every Client hears the Broadcast once, despite the loop of Links.
+        assert [got.count(["x"]) for _, _, got in clients] == [1, 1, 1]
+        assert clients[2][2][-1] == ["sport.f1", {"lap": 1}]
+
+        # Relays reach Remotes on other Nodes, from Servers and from Clients.
+        rid_b, rid_c = clients[1][1], clients[2][1]
+        assert await a.relay(rid_c, "WHO", [], request=True, timeout=5) == {
+            "id": rid_c
+        }
+        relayed = await clients[0][0].request(
+            "RELAY.REQ",
+            {"to": rid_b, "msg": str(compose(Request, "WHO", [], mid="r1"))},
+            timeout=5,
+        )
+        assert relayed == {"id": rid_b}
+
+        await close(a, b, c)
+
+    run(main())
+
+
+def test_wrong_secret():
+    async def main():
+        a = await node("A")
+        b = await node("B", "something else")
+
+        # The Node dialed cannot prove that it knows the Secret of the other.
+        with pytest.raises(PermissionError):
+            await b.cluster.dial("127.0.0.1", a.port)
+        await sleep(0.1)
+        assert not a.cluster.links and not b.cluster.links
+        assert not a.cluster.challenges
+
+        await close(a, b)
+
+    run(main())
+
+
+def test_impostor():
+    async def main():
+        a, b = await node("A"), await node("B")
+        await b.cluster.dial("127.0.0.1", a.port)
+        remote, _, got = await client(a)
+
+        # A Client cannot take over the Link of a Node.
+        with pytest.raises(RemoteError):
+            await remote.request(
+                "CLUSTER.HELLO", {"node": "B", "nonce": "0"}, timeout=5
+            )
+        # Nor, without the Secret, become one.
+        hello = await remote.request(
+            "CLUSTER.HELLO", {"node": "Z", "nonce": "0"}, timeout=5
+        )
+        assert hello["node"] == "A"
+        with pytest.raises(RemoteError):
+            await remote.request("CLUSTER.AUTH", {"proof": "0" * 64}, timeout=5)
+        assert sorted(a.cluster.links) == ["B"]
+
+        # Nor can it pass Messages on to every Client as though it were a Node.
+        envelope = {
+            "id": "B:0:0",
+            "k": "b",
+            "m": "NEWS",
+            "msg": str(compose(Notification, "NEWS", ["forged"])),
+            "via": ["B"],
+        }
+        await remote.notif("CLUSTER.BATCH", [envelope])
+        await sleep(0.1)
+        assert got == []
+        assert a.cluster.refused == 3
+
+        await close(a, b)
+
+    run(main())
+
+
+def test_validate_envelopes():
+    async def main():
+        a = await node("A")
+        _, _, got = await client(a)
+        link = object()
+
+        def envelope(msg: str, kind: str = "b", meth: str = "NEWS", mid: str = "B:1:0"):
+            return {"id": mid, "k": kind, "m": meth, "msg": msg, "via": ["B"]}
+
+        good = str(compose(Notification, "NEWS", ["ok"]))
+        bad = [
+            envelope(str(compose(Request, "NEWS", [], mid="x"))),
+            envelope(good + "," + good),
+            envelope(good, meth="OTHER"),
+            envelope(good, kind="p", meth="NEWS"),
+            envelope(good, kind="?"),
+            {"k": "b"},
+        ]
+        for each in bad:
+            with pytest.raises((ValueError, TypeError)):
+                await a.cluster.receive(each, link)
+
+        await a.cluster.receive(envelope(good), link)
+        await sleep(0.1)
+        assert got == [["ok"]]
+
+        await close(a)
+
+    run(main())
+
+
+def test_restarted_node_not_duplicate():
+    async def main():
+        a = await node("A")
+        _, _, got = await client(a)
+        text = str(compose(Notification, "NEWS", ["hi"]))
+
+        first = Cluster(Server(), "B", secret=SECRET)
+        again = Cluster(Server(), "B", secret=SECRET)
+        for cluster in (first, again, first):
+            # The first Message of each run of Node B. The last is a repeat.
+            envelope = cluster._envelope("b", "NEWS", text.encode())
+            envelope["id"] = envelope["id"].rpartition(":")[0] + ":0"
+            await a.cluster.receive(envelope, None)
+
+        await sleep(0.1)
+        assert got == [["hi"], ["hi"]]
+        assert a.cluster.duplicates == 1
+
+        await close(a)
+
+    run(main())
+
+
+def test_link_lost_on_shard():
+    async def main():
+        a = Server("127.0.0.1")
+        Cluster(a, "A", secret=SECRET, linger=60)
+        a.port = await serve(a, shards=2)
+        b = await node("B")
+        await b.cluster.dial("127.0.0.1", a.port)
+        assert a.cluster.links["B"].eventloop is not a.eventloop
+
+        a.cluster.queue("B", a.cluster._envelope("b", "NEWS", b"[]"))
+        cancelled = []
+
+        class Timer:
+            def cancel(self):
+                cancelled.append(current_thread().name)
+
+        a.cluster.timers.pop("B").cancel()
+        a.cluster.timers["B"] = Timer()
+
+        # The Link is lost on the Loop of a Shard, but its Batch is dropped on
+        #   the Loop of the Server, which owns it.
+        await close(b)
+        await sleep(0.3)
+        assert "B" not in a.cluster.links
+        assert not a.cluster.pending and not a.cluster.timers
+        assert cancelled == [current_thread().name]
+
+        await close(a)
+
+    run(main())
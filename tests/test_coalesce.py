@@ -0,0 +1,111 @@
+from asyncio import gather, get_running_loop, run, sleep
+from sys import getswitchinterval, setswitchinterval
+from threading import Thread
+
+from ezipc.remote.flight import FlightGroup
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+def test_identical_requests_coalesce():
+    async def main():
+        server = Server("127.0.0.1")
+        calls = []
+
+        @server.hook_request("SLOW", coalesce=True)
+        async def slow(data):
+            calls.append(data)
+            await sleep(0.1)
+            return [data[0] * 2]
+
+        @server.hook_request("QUICK", coalesce=True)
+        def quick(data):
+            calls.append("quick")
+            return [0]
+
+        port = await serve(server)
+        remotes = [(await connect(port))[0] for _ in range(3)]
+
+        # Identical Requests from several Clients share one call. Each gets an
+        #   answer to its own Request.
+        results = await gather(
+            *(r.request("SLOW", [21], timeout=5) for r in remotes for _ in range(2)),
+            remotes[0].request("SLOW", [1], timeout=5),
+        )
+        assert results == [[42]] * 6 + [[2]]
+        assert sorted(calls) == [[1], [21]]
+        assert server.flights["SLOW"].stats() == {"flying": 0, "led": 2, "joined": 5}
+
+        # Once the call has finished, the next Request runs it again.
+        assert await remotes[1].request("SLOW", [21], timeout=5) == [42]
+        assert calls.count([21]) == 2
+
+        # Synchronous Results are never shared.
+        await gather(*(r.request("QUICK", [], timeout=5) for r in remotes))
+        assert calls.count("quick") == 3
+
+        await server.terminate()
+
+    run(main())
+
+
+def test_coalesced_caller_leaves():
+    async def main():
+        server = Server("127.0.0.1")
+        finished = []
+
+        @server.hook_request("SLOW", coalesce=True)
+        async def slow(data):
+            await sleep(0.2)
+            finished.append(data)
+            return [1]
+
+        port = await serve(server)
+        first, _, _ = await connect(port)
+        second, _, _ = await connect(port)
+
+        leader = await first.request("SLOW", [])
+        follower = await second.request("SLOW", [])
+        await sleep(0.05)
+
+        # The Client which started the call gives up; The other still waits.
+        leader.cancel()
+        assert await follower == [1]
+        assert finished == [[]]
+
+        await server.terminate()
+
+    run(main())
+
+
+def test_counts_from_threads():
+    group = FlightGroup()
+
+    def shard():
+        async def main():
+            loop = get_running_loop()
+            for i in range(500):
+                # Keyed by Loop, as a Server with Shards keys them.
+                key = (loop, i % 5)
+                if group.follow(key) is None:
+                    group.lead(key, loop.create_future()).cancel()
+                await sleep(0)
+
+        run(main())
+
+    # Switch Threads as often as possible, to bring out any lost counts.
+    interval = getswitchinterval()
+    setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=shard) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        setswitchinterval(interval)
+
+    stats = group.stats()
+    assert stats["led"] + stats["joined"] == 4 * 500
+    assert stats["flying"] == 0
@@ -0,0 +1,38 @@
+from json import loads as std_loads
+
+import pytest
+
+from ezipc.remote.codec import BACKEND, dumpb, dumps, loads
+
+
+VALUES = [
+    {"a": [1, 2.5, None, True], "b": {"c": "ü"}},
+    [],
+    "text",
+    2 ** 70,
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_round_trip(value):
+    encoded = dumpb(value)
+    assert isinstance(encoded, bytes)
+    assert dumps(value) == encoded.decode()
+
+    # Whatever the Backend, the Standard Library must read the same thing.
+    assert std_loads(encoded) == value
+    assert loads(encoded) == loads(encoded.decode()) == value
+
+
+def test_compact():
+    assert dumps({"a": [1, 2], "b": None}) == '{"a":[1,2],"b":null}'
+    # Keys which are not Strings are encoded as they would be by ``json``.
+    assert loads(dumpb({1: "x"})) == {"1": "x"}
+    assert BACKEND
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        loads(b"{not json")
+    with pytest.raises(TypeError):
+        dumpb(object())
@@ -0,0 +1,157 @@
+from asyncio import run
+from threading import current_thread, Thread
+
+import pytest
+
+from ezipc.remote import executors
+from ezipc.remote.handlers import request_handler
+from ezipc.client import Client
+from ezipc.server import Server
+
+from .common import connect, pair, serve
+
+
+def where(_data):
+    return current_thread().name
+
+
+def test_thread_hook():
+    async def main():
+        client, server, tasks = await pair()
+        server.hook_request("WHERE", executor="thread")(where)
+
+        ret = await client.request("WHERE", [], timeout=5)
+        assert ret[0].startswith("ezipc-hook")
+
+    run(main())
+
+
+def test_pool_replaced_after_shutdown():
+    async def main():
+        client, server, tasks = await pair()
+        server.hook_request("SHARED", executor="thread")(where)
+        server.hook_request("OWN", executor="thread", workers=1)(where)
+
+        for meth in ("SHARED", "OWN"):
+            assert await client.request(meth, [], timeout=5)
+
+        executors.shutdown()
+
+        # Hooks registered before the Shutdown get new Pools, and still answer.
+        for meth in ("SHARED", "OWN"):
+            assert await client.request(meth, [], timeout=5)
+
+    run(main())
+
+
+def test_dedicated_pool_kept():
+    owner = object()
+    pool = executors.get_executor("thread", 2, owner)
+    assert executors.get_executor("thread", 2, owner) is pool
+    assert executors.get_executor("thread", 2) is not pool
+
+    executors.shutdown()
+    assert executors.get_executor("thread", 2, owner) is not pool
+
+
+def test_terminate_shuts_pools_down():
+    async def main():
+        server = Server("127.0.0.1")
+        server.hook_request("WHERE", executor="thread")(where)
+        port = await serve(server)
+
+        remote, _, _ = await connect(port)
+        assert await remote.request("WHERE", [], timeout=5)
+        assert executors._pools
+
+        await server.terminate()
+        assert not executors._pools
+
+    run(main())
+
+
+def test_pools_kept_while_held():
+    async def main():
+        server = Server("127.0.0.1")
+        server.hook_request("WHERE", executor="thread")(where)
+        port = await serve(server)
+        remote, _, _ = await connect(port)
+        assert await remote.request("WHERE", [], timeout=5)
+        pool = executors.get_executor("thread")
+
+        # Another Client in the same Process stops, while the Server runs on.
+        client = Client("127.0.0.1", port)
+        executors.hold(client)
+        await client.disconnect()
+        assert executors.get_executor("thread") is pool
+        assert await remote.request("WHERE", [], timeout=5)
+
+        # Whatever else holds them, ``shutdown()`` stops every Pool.
+        holder = object()
+        executors.hold(holder)
+        executors.shutdown()
+        assert executors.get_executor("thread") is not pool
+
+        executors.release(holder)
+        await server.terminate()
+
+    run(main())
+
+
+def square(data):
+    return [data[0] ** 2]
+
+
+def test_process_hook():
+    async def main():
+        client, server, tasks = await pair()
+        hooked = server.hook_request("SQUARE", executor="process")(square)
+        # The Function itself is kept, so that it can be pickled by name.
+        assert hooked is square
+
+        await executors.warm()
+        assert await client.request("SQUARE", [7], timeout=10) == [49]
+        executors.shutdown()
+
+    run(main())
+
+
+def test_warm_from_threads():
+    pools = []
+
+    def warm_in_thread():
+        pool = executors.get_executor("process", 1)
+        pools.append(pool)
+        run(executors.warm())
+
+    threads = [Thread(target=warm_in_thread) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every Pool was warmed once, by one Thread or another.
+    assert not executors._cold
+    assert all(len(pool._processes) == 1 for pool in pools)
+    executors.shutdown()
+
+
+def with_remote(data, remote):
+    return data
+
+
+def test_process_hook_contract():
+    def nested(data):
+        return data
+
+    async def coro(data):
+        return data
+
+    # Neither can be sent to another Process.
+    with pytest.raises(TypeError):
+        request_handler({}, "NESTED", executor="process")(nested)
+    with pytest.raises(TypeError):
+        request_handler({}, "REMOTE", executor="process")(with_remote)
+    # Nor can a Coroutine be run in any Pool.
+    with pytest.raises(TypeError):
+        request_handler({}, "CORO", executor="thread")(coro)
@@ -0,0 +1,144 @@
+from asyncio import get_running_loop, run, sleep
+from inspect import signature
+
+from ezipc.remote.fanout import as_completed, BACKLOG_MAX, fan_out, SEND_TIMEOUT
+from ezipc.remote.lanes import Lane
+from ezipc.server import Server
+
+from .common import connect, pair, serve
+from .test_outbox import Stalled
+
+
+class Target:
+    """Stands in for a Remote, as far as the Fan-Out Engine is concerned."""
+
+    def __init__(self, name: str, backlog: int = 0, open: bool = True):
+        self.name = name
+        self.backlog = backlog
+        self.open = open
+
+    def __repr__(self):
+        return self.name
+
+
+def test_limit_and_outcomes():
+    async def main():
+        targets = [Target(str(i)) for i in range(10)]
+        slow = Target("slow", BACKLOG_MAX + 1)
+        closed = Target("closed", open=False)
+        running = 0
+        most = 0
+
+        async def send(target):
+            nonlocal running, most
+            running += 1
+            most = max(most, running)
+            await sleep(0.01)
+            running -= 1
+            return target.name
+
+        report = await fan_out(targets + [slow, closed], send, limit=3)
+        assert most == 3
+        assert sorted(report.sent.values()) == sorted(t.name for t in targets)
+        assert report.skipped == [slow]
+        assert list(report.failed) == [closed]
+        assert not report.ok
+
+    run(main())
+
+
+def test_stuck_send_times_out():
+    async def main():
+        stuck = Target("stuck")
+
+        async def send(target):
+            await sleep(3600)
+
+        # A Remote which never reads cannot hold up a Broadcast for good.
+        assert signature(fan_out).parameters["timeout"].default == SEND_TIMEOUT
+        report = await fan_out([stuck], send, timeout=0.05)
+        assert report.timed_out == [stuck]
+
+    run(main())
+
+
+def test_queued_slow_consumer():
+    async def main():
+        late = Target("late", BACKLOG_MAX + 1)
+
+        async def send(target):
+            if target is not late:
+                # Meanwhile, the Slow Consumer catches up.
+                await sleep(0.05)
+                late.backlog = 0
+            return target.name
+
+        report = await fan_out([late, Target("a")], send, slow="queue")
+        assert sorted(report.sent.values()) == ["a", "late"]
+        assert not report.skipped
+
+    run(main())
+
+
+def test_backlog_counts_outbox():
+    async def main():
+        client, server, tasks = await pair()
+        client.connection.__class__ = Stalled
+        loop = get_running_loop()
+
+        sends = [
+            loop.create_task(client._write(b"x" * 1000, Lane.NORMAL)) for _ in range(5)
+        ]
+        await sleep(0.05)
+        # One is being written, and the rest wait in the Outbox.
+        assert client.backlog >= 4000
+
+        client.close()
+        assert client.backlog == 0
+        for send in sends:
+            send.cancel()
+
+    run(main())
+
+
+def test_as_completed_first():
+    async def main():
+        loop = get_running_loop()
+        futures = {Target(str(i)): loop.create_future() for i in range(3)}
+        for i, future in enumerate(futures.values()):
+            loop.call_later(0.01 * (3 - i), future.set_result, i)
+
+        got = [result async for _, result in as_completed(futures, first=2)]
+        assert got == [2, 1]
+        assert list(futures.values())[0].cancelled()
+
+    run(main())
+
+
+def test_invalidate_reaches_slow_client():
+    async def main():
+        server = Server("127.0.0.1")
+
+        @server.hook_request("CACHED", cache=30)
+        def cached(data):
+            return [1]
+
+        port = await serve(server)
+        remote, rid, _ = await connect(port)
+        got = []
+        remote.hooks_notif["CACHE.DROP"] = lambda data, _: got.append(data)
+        remote.hooks_notif["NEWS"] = lambda data, _: got.append(data)
+
+        # Make the Client look as though it has fallen far behind.
+        server.remotes.get(rid).queued += BACKLOG_MAX + 1
+
+        report = await server.broadcast("NEWS", [1])
+        assert len(report.skipped) == 1
+
+        server.invalidate("CACHED")
+        await sleep(0.1)
+        assert [data.params for data in got] == [{"meth": "CACHED"}]
+
+        await server.terminate()
+
+    run(main())
@@ -0,0 +1,115 @@
+from asyncio import CancelledError, gather, get_running_loop, run, sleep
+
+import pytest
+
+from ezipc.remote.flight import FlightGroup
+
+from .common import pair
+
+
+def test_group_shares_outcome():
+    async def main():
+        loop = get_running_loop()
+        group = FlightGroup()
+        assert group.follow("k") is None
+
+        shared = loop.create_future()
+        first = group.lead("k", shared)
+        second = group.follow("k")
+        assert "k" in group and len(group) == 1
+
+        # Cancelling one caller leaves the others, and the shared Future, alone.
+        second.cancel()
+        assert not shared.cancelled()
+
+        shared.set_result(42)
+        assert await first == 42
+        assert "k" not in group
+        assert group.stats() == {"flying": 0, "led": 1, "joined": 1}
+
+        # Once every caller has gone, the shared work is cancelled.
+        shared = loop.create_future()
+        only = group.lead("k", shared)
+        only.cancel()
+        await sleep(0)
+        assert shared.cancelled()
+
+    run(main())
+
+
+def test_shared_requests():
+    async def main():
+        client, server, tasks = await pair()
+        calls = []
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            calls.append(data)
+            await sleep(0.1)
+            if data == ["bad"]:
+                raise ValueError("bad")
+            return [len(calls)]
+
+        results = await gather(
+            *(client.request("SLOW", [1], timeout=5, shared=True) for _ in range(5))
+        )
+        assert results == [[1]] * 5
+        assert calls == [[1]]
+        assert client.flights.stats()["joined"] == 4
+
+        # Different Parameters, or unshared Requests, each go on the wire.
+        await gather(
+            client.request("SLOW", [2], timeout=5, shared=True),
+            client.request("SLOW", [3], timeout=5, shared=True),
+            client.request("SLOW", [2], timeout=5),
+        )
+        assert sorted(map(tuple, calls)) == [(1,), (2,), (2,), (3,)]
+
+        # A Flight is not a Cache; Once landed, the Request is sent again.
+        client.singleflight = True
+        await client.request("SLOW", [1], timeout=5)
+        assert calls.count([1]) == 2
+
+        # Every caller of a failed Flight sees the Error.
+        outcomes = await gather(
+            *(client.request("SLOW", ["bad"], timeout=5) for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(o, Exception) for o in outcomes)
+        assert calls.count(["bad"]) == 1
+
+    run(main())
+
+
+def test_shared_request_abandoned():
+    async def main():
+        client, server, tasks = await pair()
+        started, finished = [], []
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            started.append(data)
+            await sleep(0.3)
+            finished.append(data)
+            return [1]
+
+        client.singleflight = True
+        impatient = await client.request("SLOW", [])
+        patient = await client.request("SLOW", [])
+        await sleep(0.05)
+
+        # One caller gives up; The Request stays on the wire for the other.
+        impatient.cancel()
+        assert await patient == [1]
+        assert finished == [[]]
+
+        # When the last caller gives up, the Remote is told to stop.
+        gone = await client.request("SLOW", [])
+        await sleep(0.05)
+        gone.cancel()
+        with pytest.raises(CancelledError):
+            await gone
+        await sleep(0.4)
+        assert len(started) == 2 and len(finished) == 1
+
+    run(main())
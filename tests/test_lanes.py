@@ -0,0 +1,50 @@
+from asyncio import run
+
+from ezipc.remote.lanes import Lane, Lanes, LaneQueue, peek_method
+
+
+def test_most_urgent_first():
+    lanes = Lanes()
+    for lane, item in ((Lane.LOW, "l"), (Lane.NORMAL, "n"), (Lane.HIGH, "h")):
+        lanes.push(lane, item)
+
+    assert [lanes.pop() for _ in range(3)] == ["h", "n", "l"]
+    assert not lanes
+
+
+def test_burst_lets_others_through():
+    lanes = Lanes(burst=2)
+    for i in range(6):
+        lanes.push(Lane.HIGH, f"h{i}")
+    lanes.push(Lane.LOW, "l")
+
+    # A less urgent Lane is not starved for longer than the Burst.
+    order = [lanes.pop() for _ in range(7)]
+    assert order.index("l") == 2
+
+
+def test_pop_many_one_lane():
+    lanes = Lanes()
+    for i in range(3):
+        lanes.push(Lane.NORMAL, b"x" * 10)
+    lanes.push(Lane.LOW, b"y")
+
+    assert len(lanes.pop_many(10, 25)) == 2
+    assert lanes.pop_many(10) == [b"x" * 10]
+    assert lanes.pop_many(10) == [b"y"]
+
+
+def test_peek_method():
+    assert peek_method('{"jsonrpc":"2.0","method":"PING","id":1}') == "PING"
+    assert peek_method(b'[{"jsonrpc":"2.0","method":"A.B"}]') == "A.B"
+    assert peek_method(b'{"jsonrpc":"2.0","result":[],"id":1}') is None
+
+
+def test_lane_queue():
+    async def main():
+        queue = LaneQueue(lambda line: Lane.HIGH if b"PING" in line else Lane.LOW)
+        for line in (b"bulk", b"more", b"PING"):
+            queue.put_nowait(line)
+        assert [await queue.get() for _ in range(3)] == [b"PING", b"bulk", b"more"]
+
+    run(main())
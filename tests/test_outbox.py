@@ -0,0 +1,87 @@
+from asyncio import gather, run, sleep, wait_for
+
+import pytest
+
+from ezipc.remote.connection import Connection
+from ezipc.remote.lanes import Lane
+from ezipc.remote.protocol import Raw
+
+from .common import pair
+
+
+class Stalled(Connection):
+    """A Connection whose Writes never finish."""
+
+    __slots__ = ()
+
+    async def write(self, ptext) -> int:
+        await sleep(3600)
+        return 0
+
+
+def test_batching():
+    async def main():
+        client, server, tasks = await pair()
+        client.enable_batching(0.01)
+
+        @server.hook_request("ECHO")
+        def echo(data):
+            return data
+
+        results = await gather(
+            *(client.request("ECHO", [i], timeout=5) for i in range(10))
+        )
+        assert results == [[i] for i in range(10)]
+        # Ten Requests went out in fewer Frames.
+        assert client.connection.frames_sent < 10
+
+    run(main())
+
+
+def test_batch_limits():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("ECHO")
+        def echo(data):
+            return data
+
+        with pytest.raises(ValueError):
+            client.enable_batching(size=0)
+
+        # No Batch may hold more than three Messages.
+        client.enable_batching(0.01, size=3)
+        before = client.connection.frames_sent
+        await gather(*(client.request("ECHO", [i], timeout=5) for i in range(9)))
+        assert client.connection.frames_sent - before >= 3
+
+        # With batching turned off again, every Message has a Frame of its own.
+        client.enable_batching(None)
+        before = client.connection.frames_sent
+        results = await gather(
+            *(client.request("ECHO", [i], timeout=5) for i in range(5))
+        )
+        assert results == [[i] for i in range(5)]
+        assert client.connection.frames_sent - before == 5
+
+    run(main())
+
+
+def test_close_while_writing():
+    async def main():
+        client, server, tasks = await pair()
+        client.enable_batching(0)
+        client.connection.__class__ = Stalled
+
+        # A Raw Message gets a Frame to itself, so these make two Frames, of
+        #   which the second waits behind the first.
+        first = client.eventloop.create_task(client._write(Raw(b"[]"), Lane.NORMAL))
+        second = client.eventloop.create_task(client._write(b"{}", Lane.NORMAL))
+        await sleep(0.05)
+
+        client.close()
+        for sent in (first, second):
+            with pytest.raises(ConnectionResetError):
+                await wait_for(sent, 1)
+
+    run(main())
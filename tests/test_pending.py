@@ -0,0 +1,60 @@
+from asyncio import get_running_loop, run, sleep, TimeoutError
+
+import pytest
+
+from ezipc.remote.pending import Pending
+
+from .common import pair
+
+
+def test_no_default_deadline():
+    async def main():
+        loop = get_running_loop()
+        table = Pending(loop)
+        future = loop.create_future()
+
+        table.add("a", future)
+        assert table.timer is None and not table.heap
+        await sleep(0.05)
+        assert "a" in table and not future.done()
+
+    run(main())
+
+
+def test_expiry():
+    async def main():
+        loop = get_running_loop()
+        gone = []
+        table = Pending(loop, gone.extend)
+        futures = [loop.create_future() for _ in range(3)]
+
+        table.add("short", futures[0], 0.02)
+        table.add("long", futures[1], 10)
+        table.add("none", futures[2])
+        await sleep(0.1)
+
+        assert gone == ["short"]
+        assert isinstance(futures[0].exception(), TimeoutError)
+        assert not futures[1].done() and not futures[2].done()
+        assert table.stats()["expired"] == 1
+
+    run(main())
+
+
+def test_opt_in_default():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("SLOW")
+        async def slow(data):
+            await sleep(0.2)
+            return [1]
+
+        # Without a timeout, a slow Request is still answered.
+        assert await (await client.request("SLOW", [])) == [1]
+
+        client.futures.ttl = 0.05
+        with pytest.raises(TimeoutError):
+            await (await client.request("SLOW", []))
+
+    run(main())
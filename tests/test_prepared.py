@@ -0,0 +1,73 @@
+from asyncio import gather, run, sleep
+
+from ezipc.remote.codec import loads
+from ezipc.remote.lanes import Lane
+from ezipc.remote.protocol import compose, JRPC, Request
+
+from .common import pair
+
+
+def test_same_text_as_request():
+    async def main():
+        client, server, tasks = await pair()
+        prepared = client.prepare("ECHO")
+        assert prepared.lane == Lane.NORMAL
+        assert client.prepare("ECHO", lane=Lane.HIGH).lane == Lane.HIGH
+
+        for params in ([1, "two"], {"a": {"b": None}}, (3,), None):
+            request = compose(Request, "ECHO", params, mid="q1")
+            assert loads(prepared.encode(params, "q1", 0)) == loads(bytes(request))
+
+        # A Budget decodes just as one set on a Request would.
+        (decoded,) = JRPC.decode(prepared.encode([], "q2", 1.5))
+        assert decoded.method == "ECHO" and 1 < decoded.remaining <= 1.5
+
+    run(main())
+
+
+def test_prepared_calls():
+    async def main():
+        client, server, tasks = await pair()
+        calls = []
+
+        @server.hook_request("ECHO")
+        def echo(data, remote, request):
+            calls.append(request.remaining)
+            return data
+
+        prepared = client.prepare("ECHO")
+        assert await prepared([1], timeout=5) == [1]
+        assert await (await prepared({"x": 2})) == {"x": 2}
+        assert await gather(*(prepared([i], timeout=5) for i in range(20))) == [
+            [i] for i in range(20)
+        ]
+        assert 4 < calls[0] <= 5 and calls[1] is None
+        assert not client.futures
+
+        # With Single-Flight on, calls go through ``request()`` and are shared.
+        @server.hook_request("SLOW")
+        async def slow(data):
+            calls.append("slow")
+            await sleep(0.1)
+            return data
+
+        client.singleflight = True
+        slow_prepared = client.prepare("SLOW")
+        assert await gather(*(slow_prepared([0], timeout=5) for _ in range(3))) == [
+            [0]
+        ] * 3
+        assert calls.count("slow") == 1
+
+    run(main())
+
+
+def test_prepared_closed():
+    async def main():
+        client, server, tasks = await pair()
+        prepared = client.prepare("ECHO")
+        client.close()
+
+        future = await prepared([])
+        assert isinstance(future.exception(), ConnectionResetError)
+
+    run(main())
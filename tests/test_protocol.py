@@ -0,0 +1,99 @@
+import pytest
+
+from ezipc.remote.protocol import (
+    compose,
+    Error,
+    JRPC,
+    LazyMessage,
+    Notification,
+    Raw,
+    Request,
+    Response,
+)
+
+
+def test_lazy_request():
+    text = str(compose(Request, "ECHO", {"a": [1, 2]}, mid="q1"))
+    msg = LazyMessage(text)
+
+    assert (msg.mtype, msg.method, msg.id) == (JRPC.REQUEST, "ECHO", "q1")
+    assert msg.params == {"a": [1, 2]}
+    assert str(msg) == text
+    assert isinstance(bytes(msg), Raw)
+
+
+def test_lazy_notification():
+    msg = LazyMessage(str(compose(Notification, "NEWS", [1, {"id": "x"}])))
+    assert (msg.mtype, msg.method, msg.id) == (JRPC.NOTIF, "NEWS", None)
+    assert msg.params == [1, {"id": "x"}]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"jsonrpc":"2.0","method":"X","id":"a","params":[]}',
+        '{"jsonrpc":"2.0","method":"X","\\u0069d":"a","params":[]}',
+        '{"jsonrpc":"2.0","method":"X","params":[],"id":"a" }',
+    ],
+)
+def test_lazy_id_out_of_place(text):
+    # The head of a compact Message, but an ID which is not at its end.
+    msg = LazyMessage(text)
+    assert (msg.mtype, msg.id) == (JRPC.REQUEST, "a")
+
+
+@pytest.mark.parametrize("text", ['{"jsonrpc":"2.0","result":[],"id":1}', "[]"])
+def test_lazy_rejects_others(text):
+    with pytest.raises(ValueError):
+        LazyMessage(text)
+
+
+@pytest.mark.parametrize(
+    "data, mtype",
+    [
+        ({"jsonrpc": "2.0", "method": "M", "params": [], "id": 1}, JRPC.REQUEST),
+        ({"jsonrpc": "2.0", "method": "M", "id": 1, "budget": 5}, JRPC.REQUEST),
+        ({"jsonrpc": "2.0", "method": "M", "params": {}}, JRPC.NOTIF),
+        ({"jsonrpc": "2.0", "result": [1], "id": 1}, JRPC.RESPONSE),
+        (
+            {"jsonrpc": "2.0", "error": {"code": 1, "message": "x"}, "id": 1},
+            JRPC.RESPONSE,
+        ),
+        ({"jsonrpc": "1.0", "method": "M", "id": 1}, JRPC.NONE),
+        ({"jsonrpc": "2.0", "method": "M", "id": 1, "extra": 0}, JRPC.NONE),
+        ({"jsonrpc": "2.0", "method": "M", "budget": 5}, JRPC.NONE),
+        ({"jsonrpc": "2.0", "id": 1}, JRPC.NONE),
+        ({"jsonrpc": "2.0", "result": [], "method": "M"}, JRPC.NONE),
+    ],
+)
+def test_check(data, mtype):
+    assert JRPC.check(data) is mtype
+
+
+def test_decode_batch():
+    line = (
+        b'[{"jsonrpc":"2.0","method":"N","params":5},'
+        b'{"jsonrpc":"2.0","method":"R","params":{"a":1},"id":"q","budget":2,'
+        b'"stream":4},'
+        b'{"jsonrpc":"2.0","result":[],"id":"p"},'
+        b'{"jsonrpc":"2.0","error":{"code":3,"message":"no"},"id":"e"},'
+        b'{"jsonrpc":"2.0","error":{"bad":1},"id":"f"},'
+        b'{"nonsense":true}]'
+    )
+    notif, req, res, error, broken, *rest = JRPC.decode(line)
+
+    assert isinstance(notif, Notification) and notif.params == []
+    assert isinstance(req, Request) and req.params == {"a": 1}
+    assert 0 < req.remaining <= 2 and req.stream == 4
+    assert isinstance(res, Response) and res.result is None
+    assert isinstance(error.error, Error) and error.error.code == 3
+
+    # A Message which cannot be made is passed on as its Exception, and one
+    #   which is not JSON-RPC is left out.
+    assert isinstance(broken, Exception)
+    assert rest == []
+
+    (single,) = JRPC.decode('{"jsonrpc":"2.0","method":"N"}')
+    assert single.method == "N"
+    with pytest.raises(ValueError):
+        list(JRPC.decode(b"{not json"))
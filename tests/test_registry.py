@@ -0,0 +1,147 @@
+from asyncio import run, sleep, wait_for
+
+import pytest
+
+from ezipc.remote.exc import RemoteError
+from ezipc.remote.protocol import compose, Notification, Request
+from ezipc.remote.registry import ID_DIGITS, Registry
+from ezipc import server as server_module
+from ezipc.client import Client
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+class Named:
+    """Stands in for a Remote, which the Registry knows only by its ID."""
+
+    __slots__ = ("id",)
+
+    def __init__(self, rid: str = None):
+        self.id = rid
+
+
+def test_ids_never_collide():
+    registry = Registry("N1-")
+    first, second = Named("SAME"), Named("SAME")
+    registry.add(first)
+    registry.add(second)
+
+    assert first.id == "SAME" and second.id != "SAME"
+    assert second.id.startswith("N1-")
+    assert registry.get("SAME") is first and registry.get(second.id) is second
+
+    # Adding a Remote again changes nothing.
+    registry.add(second)
+    assert len(registry) == 2
+
+    # IDs grow longer before the short ones run out.
+    many = Registry()
+    for _ in range(1100):
+        many.add(Named("X"))
+    assert len(many) == 1100
+    assert len({remote.id for remote in many}) == 1100
+    assert max(len(remote.id) for remote in many) > ID_DIGITS
+
+    registry.discard(first)
+    assert first not in registry and registry.get("SAME") is None
+
+
+def test_tags():
+    registry = Registry()
+    a, b, c = Named("A"), Named("B"), Named("C")
+    for remote in (a, b, c):
+        registry.add(remote)
+
+    registry.tag(a, "worker", "eu")
+    registry.tag(b, "worker", "us")
+    registry.tag(c, "eu")
+    with pytest.raises(KeyError):
+        registry.tag(Named("D"), "worker")
+
+    assert registry.tagged("worker") == {a, b}
+    assert registry.tagged("worker", "eu") == {a}
+    assert registry.tagged("nothing") == set()
+    assert registry.tagged() == {a, b, c}
+
+    registry.untag(a, "worker")
+    assert registry.tagged("worker") == {b}
+    assert registry.tags_of(a) == {"eu"}
+
+    # Removing a Remote removes it from every Tag.
+    registry.discard(c)
+    assert registry.tagged("eu") == {a}
+    registry.untag(a)
+    assert registry.tags_of(a) == set() and "eu" not in registry.by_tag
+
+
+def test_relay_between_clients():
+    async def main():
+        server = Server("127.0.0.1")
+        port = await serve(server)
+        (first, first_id, _), (second, second_id, _) = [
+            await connect(port) for _ in range(2)
+        ]
+        assert server.route(second_id) is not first
+        got = []
+        second.hooks_request["WHO"] = lambda data, _: {"id": second_id}
+        second.hooks_notif["NOTE"] = lambda data, _: got.append(data.params)
+
+        relayed = await first.request(
+            "RELAY.REQ",
+            {"to": second_id, "msg": str(compose(Request, "WHO", [], mid="r1"))},
+            timeout=5,
+        )
+        assert relayed == {"id": second_id}
+
+        await first.notif(
+            "RELAY.NOTIF",
+            {"to": second_id, "msg": str(compose(Notification, "NOTE", [1]))},
+        )
+        assert await server.relay(second_id, "WHO", [], request=True, timeout=5) == {
+            "id": second_id
+        }
+        assert got == [[1]]
+
+        with pytest.raises(RemoteError):
+            await first.request(
+                "RELAY.REQ",
+                {"to": "NOBODY", "msg": str(compose(Request, "WHO", [], mid="r2"))},
+                timeout=5,
+            )
+        with pytest.raises(KeyError):
+            server.route("NOBODY")
+
+        await server.terminate()
+
+    run(main())
+
+
+def test_relay_without_timeout(monkeypatch):
+    monkeypatch.setattr(server_module, "RELAY_TIMEOUT", 0.2)
+
+    async def main():
+        server = Server("127.0.0.1")
+        port = await serve(server)
+        (first, _, _), (second, second_id, _) = [await connect(port) for _ in range(2)]
+        second.hooks_request["WHO"] = lambda data, _: {"id": second_id}
+
+        @second.hook_request("STUCK")
+        async def stuck(data):
+            await sleep(60)
+
+        # Without a timeout, the relayed Request carries no Budget at all, not
+        #   one which has already run out.
+        client = Client("127.0.0.1", port)
+        client.remote = first
+        relayed = await client.relay(second_id, "WHO", [], request=True, timeout=0)
+        assert await wait_for(relayed, 5) == {"id": second_id}
+
+        # The Server does not wait forever for a Request without a Budget.
+        stuck = await client.relay(second_id, "STUCK", [], request=True, timeout=0)
+        with pytest.raises(RemoteError):
+            await wait_for(stuck, 5)
+
+        await server.terminate()
+
+    run(main())
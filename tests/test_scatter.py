@@ -0,0 +1,75 @@
+from asyncio import run, sleep
+
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+async def answering(delays):
+    """Run a Server with one Client for each Delay, which answers ``WORK`` after
+        that many seconds, or fails if the Delay is negative.
+    """
+    server = Server("127.0.0.1")
+    port = await serve(server)
+    finished = []
+
+    def worker(delay: float, rid: str):
+        async def work(data):
+            await sleep(abs(delay))
+            if delay < 0:
+                raise ValueError("failed")
+            finished.append(rid)
+            return [delay]
+
+        return work
+
+    for delay in delays:
+        remote, rid, _ = await connect(port)
+        remote.hook_request("WORK")(worker(delay, rid))
+
+    await sleep(0.05)
+    return server, finished
+
+
+def test_scatter_every_result():
+    async def main():
+        server, finished = await answering([0.15, 0.0, -0.05, 0.1])
+
+        results = [r async for _, r in server.scatter("WORK", [])]
+        assert [r[0] for r in results] == [0.0, 0.1, 0.15]
+
+        failures = [r async for _, r in server.scatter("WORK", [], errors=True)]
+        assert len(failures) == 4
+        assert sum(isinstance(r, Exception) for r in failures) == 1
+
+        await server.terminate()
+
+    run(main())
+
+
+def test_scatter_quorum_cancels_rest():
+    async def main():
+        server, finished = await answering([0.0, 0.05, 0.1, 0.5, 0.5])
+
+        got = [r[0] async for _, r in server.scatter("WORK", [], quorum=True)]
+        # Three of five is a Majority.
+        assert got == [0.0, 0.05, 0.1]
+
+        # The stragglers were told to stop, and never finished.
+        await sleep(0.6)
+        assert len(finished) == 3
+
+        got = [r async for _, r in server.scatter("WORK", [], first=1)]
+        assert got == [[0.0]]
+
+        # Leaving the stragglers running lets them finish.
+        got = [
+            r async for _, r in server.scatter("WORK", [], timeout=0.2, cancel=False)
+        ]
+        assert len(got) == 3
+        await sleep(0.5)
+        assert len(finished) == 3 + 1 + 5
+
+        await server.terminate()
+
+    run(main())
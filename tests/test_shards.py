@@ -0,0 +1,84 @@
+from asyncio import gather, run, sleep
+from threading import current_thread, enumerate as threads
+
+from ezipc.remote.protocol import compose, Request
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+async def sharded(count: int = 3):
+    server = Server("127.0.0.1")
+
+    @server.hook_request("WHERE")
+    def where(data):
+        return current_thread().name
+
+    @server.hook_request("ONE", limit=1, queue=20)
+    async def one(data):
+        await sleep(0.02)
+        return current_thread().name
+
+    port = await serve(server, shards=count)
+    clients = [await connect(port) for _ in range(count * 2)]
+    return server, clients
+
+
+def test_connections_spread():
+    async def main():
+        server, clients = await sharded()
+
+        names = [(await c.request("WHERE", [], timeout=5))[0] for c, _, _ in clients]
+        assert sorted(set(names)) == [f"ezipc-shard-{i}" for i in range(3)]
+
+        # One Bulkhead holds across every Shard.
+        await gather(*(c.request("ONE", [], timeout=5) for c, _, _ in clients))
+        assert server.bulkheads["ONE"].stats()["queued"] >= 3
+
+        await server.terminate()
+        await sleep(0.1)
+        assert not [t for t in threads() if t.name.startswith("ezipc-shard")]
+
+    run(main())
+
+
+def test_topics_and_relays():
+    async def main():
+        server, clients = await sharded()
+        got = []
+        for remote, rid, _ in clients:
+            remote.hooks_notif["TOPIC.PUB"] = lambda data, _: got.append(data.params)
+            remote.hooks_request["WHO"] = lambda data, _, rid=rid: {"id": rid}
+
+        # Subscriptions made from every Shard at once.
+        await gather(
+            *(
+                remote.request("TOPIC.SUB", ["a.#", f"b.{i}"], timeout=5)
+                for i, (remote, _, _) in enumerate(clients)
+            )
+        )
+        assert len(server.topics) == 12
+
+        report = await server.publish("a.x", [1])
+        assert len(report.sent) == 6
+        await server.publish("b.2", [2])
+        await sleep(0.1)
+        assert got.count(["a.x", [1]]) == 6 and got.count(["b.2", [2]]) == 1
+
+        await gather(
+            *(remote.request("TOPIC.UNSUB", [], timeout=5) for remote, _, _ in clients)
+        )
+        assert len(server.topics) == 0
+
+        # A Relay from a Client on one Shard to one on another.
+        (first, _, _), (_, second, _) = clients[:2]
+        relayed = await first.request(
+            "RELAY.REQ",
+            {"to": second, "msg": str(compose(Request, "WHO", [], mid="r1"))},
+            timeout=5,
+        )
+        assert relayed == {"id": second}
+
+        await server.terminate()
+
+    run(main())
@@ -0,0 +1,116 @@
+from asyncio import get_running_loop, run, sleep, TimeoutError
+
+import pytest
+
+from ezipc.remote import streams
+from ezipc.remote.protocol import JRPC, Response
+from ezipc.remote.streams import ResponseStream
+
+from .common import pair
+
+
+def test_stream_in_order():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("COUNT")
+        async def count(data):
+            for i in range(data[0]):
+                yield i
+
+        stream = await client.request_stream("COUNT", [50], window=4)
+        assert [part async for part in stream] == list(range(50))
+
+    run(main())
+
+
+def test_credit_bounds_producer():
+    async def main():
+        client, server, tasks = await pair()
+        made = []
+
+        @server.hook_request("COUNT")
+        def count(data):
+            for i in range(100):
+                made.append(i)
+                yield i
+
+        stream = await client.request_stream("COUNT", [], window=4)
+        assert await stream.__anext__() == 0
+        await sleep(0.1)
+        # Nothing is made beyond the Window until more is granted.
+        assert len(made) <= 4 + 1
+
+        await stream.aclose()
+        await sleep(0.1)
+        assert len(made) < 100
+
+    run(main())
+
+
+def test_plain_handler():
+    async def main():
+        client, server, tasks = await pair()
+
+        @server.hook_request("PLAIN")
+        def plain(data):
+            return {"value": data[0]}
+
+        @server.hook_request("SCALAR")
+        def scalar(data):
+            return 5
+
+        stream = await client.request_stream("PLAIN", [3])
+        assert [part async for part in stream] == [{"value": 3}]
+
+        stream = await client.request_stream("SCALAR", [])
+        assert [part async for part in stream] == [[5]]
+
+        # A Result which looks like the end of a Stream is still only a Result.
+        stream = await client.request_stream("PLAIN", [{"parts": 3}])
+        assert [part async for part in stream] == [{"value": {"parts": 3}}]
+
+        @server.hook_request("PARTS")
+        def parts(data):
+            return {"parts": 3}
+
+        stream = await client.request_stream("PARTS", [], timeout=5)
+        assert [part async for part in stream] == [{"parts": 3}]
+
+    run(main())
+
+
+def test_end_marked_outside_result():
+    end = Response.make("s1", result=[])
+    end.set_parts(2)
+    (decoded,) = JRPC.decode(bytes(end))
+    assert decoded.parts == 2 and decoded.result is None
+
+    (plain,) = JRPC.decode(bytes(Response("s2", result={"parts": 2})))
+    assert plain.parts is None and plain.result == {"parts": 2}
+
+    with pytest.raises(ValueError):
+        end.set_parts(-1)
+    (broken,) = JRPC.decode(b'{"jsonrpc":"2.0","result":[],"parts":"x","id":"s3"}')
+    assert isinstance(broken, ValueError)
+
+
+def test_missing_parts_fail(monkeypatch):
+    monkeypatch.setattr(streams, "LATE_PARTS", 0.1)
+
+    async def main():
+        future = get_running_loop().create_future()
+        stream = ResponseStream(future, 4, lambda count: None)
+
+        stream.feed("a")
+        # The final Response says that three parts were sent. One is late, and
+        #   the last never comes.
+        stream.end(3)
+        future.set_result(None)
+        get_running_loop().call_later(0.05, stream.feed, "b")
+
+        assert [await stream.__anext__() for _ in range(2)] == ["a", "b"]
+        with pytest.raises(TimeoutError):
+            await stream.__anext__()
+
+    run(main())
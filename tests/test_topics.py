@@ -0,0 +1,122 @@
+from asyncio import run, sleep
+from sys import getswitchinterval, setswitchinterval
+from threading import Thread
+
+import pytest
+
+from ezipc.remote.exc import RemoteError
+from ezipc.remote.topics import TopicIndex
+from ezipc.server import Server
+
+from .common import connect, serve
+
+
+def test_match():
+    index = TopicIndex()
+    index.subscribe("a", "news.sport.f1")
+    index.subscribe("b", "news.*.f1")
+    index.subscribe("c", "news.#")
+    index.subscribe("d", "weather.*")
+
+    assert index.match("news.sport.f1") == {"a", "b", "c"}
+    assert index.match("news.tech.f1") == {"b", "c"}
+    assert index.match("news") == {"c"}
+    assert index.match("weather.today") == {"d"}
+    assert index.match("weather.today.rain") == set()
+
+    with pytest.raises(ValueError):
+        index.match("news.*")
+    with pytest.raises(ValueError):
+        index.subscribe("e", "news.#.f1")
+
+
+def test_unsubscribe_prunes():
+    index = TopicIndex()
+    assert index.subscribe("a", "x.y.z")
+    assert not index.subscribe("a", "x.y.z")
+    index.subscribe("a", "x.#")
+    assert len(index) == 2
+
+    assert index.unsubscribe("a", "x.y.z")
+    assert not index.unsubscribe("a", "x.y.z")
+    assert index.discard("a") == 1
+    assert not index.root and "a" not in index
+
+
+def test_threads():
+    index = TopicIndex()
+    errors = []
+
+    def churn(name: str):
+        try:
+            for i in range(2000):
+                index.subscribe(name, f"t.{i % 7}.#")
+                index.match(f"t.{i % 7}.x")
+                index.unsubscribe(name, f"t.{i % 7}.#")
+        except Exception as e:
+            errors.append(e)
+
+    # Switch Threads as often as possible, to bring out any races.
+    interval = getswitchinterval()
+    setswitchinterval(1e-6)
+    try:
+        threads = [Thread(target=churn, args=(str(n),)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        setswitchinterval(interval)
+
+    assert not errors
+    assert not index.root and not index.subscriptions
+
+
+def test_server_publish():
+    async def main():
+        server = Server("127.0.0.1")
+        port = await serve(server)
+        got = {}
+        remotes = []
+
+        for patterns in (["news.#"], ["news.*.f1", "weather.*"], []):
+            remote, rid, _ = await connect(port)
+            got[rid] = []
+            remote.hooks_notif["TOPIC.PUB"] = (
+                lambda data, _, rid=rid: got[rid].append(data.params)
+            )
+            if patterns:
+                subscribed = await remote.request("TOPIC.SUB", patterns, timeout=5)
+                assert subscribed == sorted(patterns)
+            remotes.append((remote, rid))
+
+        (news, news_id), (f1, f1_id), (_, none_id) = remotes
+        with pytest.raises(RemoteError):
+            await f1.request("TOPIC.SUB", ["a.#.b"], timeout=5)
+
+        report = await server.publish("news.sport.f1", {"lap": 1})
+        assert len(report.sent) == 2
+        await server.publish("weather.today", [2])
+        await server.publish("sport", [3])
+        await sleep(0.1)
+        assert got == {
+            news_id: [["news.sport.f1", {"lap": 1}]],
+            f1_id: [["news.sport.f1", {"lap": 1}], ["weather.today", [2]]],
+            none_id: [],
+        }
+
+        assert await f1.request("TOPIC.UNSUB", ["weather.*"], timeout=5) == [
+            "news.*.f1"
+        ]
+        # Unsubscribing from nothing in particular means from everything.
+        assert not await f1.request("TOPIC.UNSUB", [], timeout=5)
+
+        # A Remote which goes away takes its Subscriptions with it.
+        news.close()
+        await sleep(0.1)
+        assert len(server.topics) == 0
+        assert not (await server.publish("news.x", [])).sent
+
+        await server.terminate()
+
+    run(main())
@@ -0,0 +1,142 @@
+from asyncio import gather, run, sleep
+from os import getpid, kill
+from signal import SIGTERM
+from socket import create_connection, socket
+from threading import Timer
+
+import pytest
+
+from ezipc.server import Server
+from ezipc.workers import Supervisor
+
+from .common import connect
+
+
+def free_port() -> int:
+    with socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 10):
+    for _ in range(int(timeout * 20)):
+        try:
+            create_connection(("127.0.0.1", port), 0.1).close()
+            return
+        except OSError:
+            run(sleep(0.05))
+    raise TimeoutError(f"Nothing is listening on Port {port}.")
+
+
+def test_workers_share_port_and_report():
+    server = Server("127.0.0.1", free_port())
+
+    @server.hook_request("PID", cache=60)
+    def pid(data):
+        return [getpid()]
+
+    server.setup()
+    supervisor = Supervisor(server, 2, interval=0.1)
+    assert supervisor.context.get_start_method() == "fork"
+
+    try:
+        for slot in range(2):
+            supervisor.spawn(slot)
+        wait_for_port(server.port)
+        # Give the second Worker time to bind as well.
+        run(sleep(0.5))
+
+        async def main():
+            remotes = [(await connect(server.port))[0] for _ in range(16)]
+            answers = await gather(*(r.request("PID", [], timeout=5) for r in remotes))
+            # Each Worker keeps a Cache of its own.
+            await gather(*(r.request("PID", [], timeout=5) for r in remotes))
+            for remote in remotes:
+                remote.close()
+            await sleep(0.3)
+            return {pid for (pid,) in answers}
+
+        pids = run(main())
+        assert pids == {proc.pid for proc in supervisor.procs.values()}
+
+    finally:
+        supervisor.stop()
+
+    assert not any(proc.is_alive() for proc in supervisor.procs.values())
+    assert set(supervisor.latest) == pids
+
+    # The last snapshot of every Worker has been added up.
+    #   One more Client connected while waiting for the Port to open.
+    assert server.total_clients == 17
+    assert server.total_recv["request"] == 16 * 3
+    assert server.caches["PID"].stats() == {
+        "size": 0,
+        "hits": 30,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+def square(data):
+    return [data[0] ** 2]
+
+
+def test_workers_with_process_pool():
+    server = Server("127.0.0.1", free_port())
+    server.hook_request("SQUARE", executor="process", workers=1)(square)
+    server.setup()
+    supervisor = Supervisor(server, 2, interval=0.1)
+
+    try:
+        for slot in range(2):
+            supervisor.spawn(slot)
+        wait_for_port(server.port)
+        first = {slot: proc.pid for slot, proc in supervisor.procs.items()}
+
+        async def main():
+            remotes = [(await connect(server.port))[0] for _ in range(8)]
+            answers = await gather(
+                *(r.request("SQUARE", [i], timeout=10) for i, r in enumerate(remotes))
+            )
+            for remote in remotes:
+                remote.close()
+            return answers
+
+        # Each Worker starts a Process Pool of its own, and keeps running.
+        assert run(main()) == [[i * i] for i in range(8)]
+        assert all(proc.is_alive() for proc in supervisor.procs.values())
+        assert {slot: p.pid for slot, p in supervisor.procs.items()} == first
+
+    finally:
+        supervisor.stop()
+
+    assert not any(proc.is_alive() for proc in supervisor.procs.values())
+
+
+def test_dead_worker_restarted():
+    server = Server("127.0.0.1", free_port())
+    server.setup()
+    supervisor = Supervisor(server, 2, interval=0.1)
+    first = {}
+
+    def crash():
+        first.update((slot, proc.pid) for slot, proc in supervisor.procs.items())
+        supervisor.procs[0].kill()
+
+    # Crash a Worker once the Supervisor is running, and later tell the
+    #   Supervisor to stop, as a Signal would.
+    timers = [Timer(1.2, crash), Timer(3, kill, (getpid(), SIGTERM))]
+    for timer in timers:
+        timer.start()
+    supervisor.run()
+
+    assert supervisor.procs[0].pid != first[0]
+    assert supervisor.procs[1].pid == first[1]
+    assert supervisor.procs[0].exitcode is not None
+    # The snapshots of the dead Worker are kept, and reported with the rest.
+    assert first[0] in supervisor.latest and len(supervisor.latest) == 3
+
+
+def test_at_least_one_worker():
+    with pytest.raises(ValueError):
+        Supervisor(Server("127.0.0.1"), 0)